@@ -0,0 +1,235 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark every stage of baking each available template.
+
+Run this script with ``python benchmarks/bench_bake.py``. Each template is
+baked various times and the following stages are timed:
+
+- ``staging``: copying the common files, the template files and the license
+  into a staging directory.
+- ``render``: resolving the context and rendering the staged template. Files
+  excluded by the manifest of the template are never rendered.
+- ``hooks``: running the post-generation hook, i.e. the isort pass.
+- ``total``: baking the project end to end with :func:`bake_template`, as done
+  by the command line interface, reusing the cached staged template.
+
+The minimum and the median time of each stage are stored as JSON. Pass a
+previous results file with ``--compare`` to exit with an error if any median
+time regressed beyond ``--threshold``.
+"""
+import argparse
+import json
+import os
+from pathlib import Path
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+import ansys.templates
+from ansys.templates.licenses import MIT_LICENSE
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.rendering import _run_hook, generate_files, generate_template_context
+from ansys.templates.utils import _stage_template, bake_template
+
+STAGES = ["staging", "render", "hooks", "total"]
+"""Stages timed for each template."""
+
+SKIPPED_TEMPLATES = ["common"]
+"""Templates not benchmarked. The common files are only baked within other templates."""
+
+EXTRA_CONTEXTS = {"pybasic": {"project_name": "pybasic"}}
+"""Values of the variables required by some templates."""
+
+MIN_REGRESSION = 0.005
+"""Minimum increase of a median time, in seconds, considered a regression."""
+
+
+def time_stages(template_path, extra_context, work_path):
+    """Time each stage of baking a template once.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template.
+    extra_context : dict
+        Values of the template variables.
+    work_path : ~pathlib.Path
+        Empty directory where the template is staged and baked.
+
+    Returns
+    -------
+    dict
+        Wall time spent in each stage, in seconds.
+
+    """
+    timings = {}
+    staging_path, output_path = work_path / "staged", work_path / "output"
+    staging_path.mkdir()
+
+    start = time.perf_counter()
+    _stage_template(template_path, MIT_LICENSE, staging_path)
+    timings["staging"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    context = generate_template_context(
+        staging_path, output_dir=str(output_path), no_input=True, extra_context=extra_context
+    )
+    project_dir = generate_files(
+        staging_path, context, output_dir=str(output_path), accept_hooks=False
+    )
+    timings["render"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    _run_hook(staging_path, "post_gen_project", project_dir, context, False)
+    timings["hooks"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bake_template(
+        template_path,
+        work_path / "baked",
+        overwrite_if_exists=True,
+        no_input=True,
+        extra_context=extra_context,
+    )
+    timings["total"] = time.perf_counter() - start
+
+    return timings
+
+
+def run_benchmarks(rounds):
+    """Time each stage of baking all the available templates.
+
+    Parameters
+    ----------
+    rounds : int
+        Number of times each template is baked.
+
+    Returns
+    -------
+    dict
+        Minimum and median time of each stage, indexed by template name.
+        Templates failing to bake hold the error instead.
+
+    """
+    results = {}
+    for name, template_path in TEMPLATE_PATH_FINDER.items():
+        if name in SKIPPED_TEMPLATES:
+            continue
+
+        timings = {stage: [] for stage in STAGES}
+        try:
+            for _ in range(rounds):
+                with tempfile.TemporaryDirectory() as tmp_dir:
+                    for stage, elapsed in time_stages(
+                        template_path, EXTRA_CONTEXTS.get(name, {}), Path(tmp_dir)
+                    ).items():
+                        timings[stage].append(elapsed)
+        except Exception as err:
+            results[name] = {"error": f"{type(err).__name__}: {err}".splitlines()[0]}
+            continue
+
+        results[name] = {
+            stage: {"min": min(values), "median": statistics.median(values)}
+            for stage, values in timings.items()
+        }
+    return results
+
+
+def find_regressions(results, baseline, threshold):
+    """Find the stages whose median time regressed with respect to a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Current results.
+    baseline : dict
+        Previous results.
+    threshold : float
+        Allowed relative increase of the median time. Increases shorter than
+        ``MIN_REGRESSION`` are considered noise.
+
+    Returns
+    -------
+    list
+        Template, stage, previous and current median time of each regression.
+
+    """
+    regressions = []
+    for name, stages in results["templates"].items():
+        baseline_stages = baseline["templates"].get(name, {})
+        for stage in STAGES:
+            if stage not in stages or stage not in baseline_stages:
+                continue
+            previous, current = baseline_stages[stage]["median"], stages[stage]["median"]
+            if current - previous > max(previous * threshold, MIN_REGRESSION):
+                regressions.append((name, stage, previous, current))
+    return regressions
+
+
+def main():
+    """Entry point of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rounds", type=int, default=5, help="Bakes of each template.")
+    parser.add_argument("--output", type=Path, help="JSON file where results are written.")
+    parser.add_argument("--compare", type=Path, help="JSON file with previous results.")
+    parser.add_argument(
+        "--threshold", type=float, default=0.25, help="Allowed relative regression."
+    )
+    args = parser.parse_args()
+
+    # Keep the user cache directory untouched
+    with tempfile.TemporaryDirectory() as cache_dir:
+        os.environ["ANSYS_TEMPLATES_CACHE_DIR"] = cache_dir
+        results = {
+            "version": ansys.templates.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "rounds": args.rounds,
+            "templates": run_benchmarks(args.rounds),
+        }
+
+    print(f"{'template':<24}" + "".join(f"{stage:>10}" for stage in STAGES))
+    for name, stages in results["templates"].items():
+        if "error" in stages:
+            print(f"{name:<24}  {stages['error'][:60]}")
+            continue
+        print(f"{name:<24}" + "".join(f"{stages[stage]['median']:>9.3f}s" for stage in STAGES))
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(results, indent=2) + "\n", encoding="utf-8")
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text(encoding="utf-8"))
+        regressions = find_regressions(results, baseline, args.threshold)
+        for name, stage, previous, current in regressions:
+            print(f"Regression in {name} ({stage}): {previous:.3f}s -> {current:.3f}s")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
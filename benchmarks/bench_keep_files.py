@@ -0,0 +1,98 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Benchmark the removal of undesired files from a large project.
+
+Run this script with ``python benchmarks/bench_keep_files.py``. A synthetic
+project with ``--files`` files is created for every round and pruned with both
+the current implementation of ``keep_files`` and the former one, which globbed
+the whole project and looked up each path in a list.
+
+"""
+import argparse
+import os
+from pathlib import Path
+import shutil
+import tempfile
+import time
+
+from ansys.templates.utils import keep_files
+
+
+def legacy_keep_files(files_list, project_path):
+    """Remove undesired files as done before the single pass implementation."""
+    all_project_files = project_path.glob("**/*")
+    desired_files = [file.replace("/", os.sep) for file in files_list]
+
+    folders = []
+    for file in all_project_files:
+        if str(file.relative_to(project_path)) not in desired_files:
+            file.unlink() if file.is_file() else folders.append(file)
+
+    folders = sorted(folders, reverse=True)
+    [folder.rmdir() for folder in folders if not os.listdir(str(folder))]
+
+
+def create_project(project_path, n_files, files_per_dir=100):
+    """Create a synthetic project and return one every ten of its files."""
+    files_list = []
+    for index in range(n_files):
+        directory = f"pkg_{index // (files_per_dir * 10)}/mod_{index // files_per_dir}"
+        if index % files_per_dir == 0:
+            (project_path / directory).mkdir(parents=True)
+        file = f"{directory}/file_{index}.py"
+        (project_path / file).touch()
+        if index % 10 == 0:
+            files_list.append(file)
+    return files_list
+
+
+def time_function(function, n_files, rounds):
+    """Return the best time needed by a function to prune a project."""
+    timings = []
+    for _ in range(rounds):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            project_path = Path(tmp_dir) / "project"
+            files_list = create_project(project_path, n_files)
+            start = time.perf_counter()
+            function(files_list, project_path)
+            timings.append(time.perf_counter() - start)
+            shutil.rmtree(project_path)
+    return min(timings)
+
+
+def main():
+    """Entry point of the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=100_000, help="Files in the project.")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds for each implementation.")
+    args = parser.parse_args()
+
+    current = time_function(keep_files, args.files, args.rounds)
+    legacy = time_function(legacy_keep_files, args.files, args.rounds)
+    print(f"keep_files ({args.files} files): {current:.3f}s")
+    print(f"legacy keep_files ({args.files} files): {legacy:.3f}s ({legacy / current:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
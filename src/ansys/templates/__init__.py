@@ -27,22 +27,28 @@ A collection of interactive templates for building Python projects from scratch
 according to PyAnsys guidelines.
 """
 
-try:
-    import importlib.metadata as importlib_metadata
-except ModuleNotFoundError:
-    import importlib_metadata
 
-__version__ = importlib_metadata.version(__name__.replace(".", "-"))
+def __getattr__(name):
+    """Resolve the version and templates of the package only when first requested.
 
-AVAILABLE_TEMPLATES_AND_DESCRIPTION = {
-    "doc-project": "Create a documentation project using Sphinx.",
-    "pybasic": "Create a basic Python Package.",
-    "pyansys": "Create a PyAnsys Python Package project.",
-    "pyansys-advanced": "Create an advanced PyAnsys Python Package project.",
-    "pyansys-openapi_client": "Create an OpenAPI Client Package project.",
-    "pyace": "Create a Python project for any method developers.",
-    "pyace-flask": "Create a Flask project initialized for any developer.",
-    "pyace-grpc": "Create gRPC project initialized for any developer.",
-    "pyace-fast": "Create a FastAPI project initialized for any developer.",
-}
-"""A list holding all available templates names."""
+    Reading the metadata of the distribution is slow, so it is avoided when
+    importing the package. Available templates are read from the template index.
+    """
+    if name == "AVAILABLE_TEMPLATES_AND_DESCRIPTION":
+        from ansys.templates.index import load_index
+
+        templates = {
+            template: entry["description"] for template, entry in load_index()["templates"].items()
+        }
+        globals()[name] = templates
+        return templates
+    if name == "__version__":
+        try:
+            import importlib.metadata as importlib_metadata
+        except ModuleNotFoundError:
+            import importlib_metadata
+
+        version = importlib_metadata.version(__name__.replace(".", "-"))
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
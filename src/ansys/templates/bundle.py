@@ -0,0 +1,300 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Single-file bundles of staged templates.
+
+A bundle is a zip archive holding the files of a template already combined
+with the common files, i.e. the staged template without its license. The
+``bundle.json`` member indexes the bundle:
+
+.. code-block:: json
+
+    {
+        "format": 1,
+        "template": "pyansys",
+        "version": "5.0.0",
+        "digest": "<sha256 of all the paths and file hashes>",
+        "files": {
+            "cookiecutter.json": {"sha256": "<sha256>", "size": 512, "mode": 420}
+        }
+    }
+
+Bundles are built before packaging with ``python -m ansys.templates.bundle``.
+Reading a bundle only requires its index and random access to its members,
+so the files of a template are never walked while baking.
+"""
+
+import argparse
+import contextlib
+import hashlib
+import json
+import mmap
+import os
+from pathlib import Path, PurePosixPath, PureWindowsPath
+import zipfile
+
+import ansys.templates
+from ansys.templates.index import collect_template_files, files_digest
+from ansys.templates.paths import BUNDLES_PATH, TEMPLATE_PATH_FINDER
+
+BUNDLE_FORMAT = 1
+"""Version of the bundle format."""
+
+BUNDLE_INDEX = "bundle.json"
+"""Name of the member indexing the files of a bundle."""
+
+_ZIP_EPOCH = (1980, 1, 1, 0, 0, 0)
+
+
+class _MappedFile(mmap.mmap):
+    """Memory-mapped file usable as the file object of a zip archive."""
+
+    def seekable(self):
+        """Return whether the file supports random access."""
+        return True
+
+
+def build_bundle(template_path, bundle_path):
+    """Pack a template together with the common files into a bundle.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template.
+    bundle_path : ~pathlib.Path
+        Path to the bundle to be created.
+
+    Returns
+    -------
+    dict
+        Index of the bundle.
+
+    """
+    files, contents = {}, {}
+    for name, source_path in sorted(collect_template_files(template_path).items()):
+        data = source_path.read_bytes()
+        files[name] = {
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "size": len(data),
+            "mode": os.stat(source_path).st_mode & 0o7777,
+        }
+        contents[name] = data
+
+    index = {
+        "format": BUNDLE_FORMAT,
+        "template": Path(template_path).resolve().name,
+        "version": ansys.templates.__version__,
+        "digest": files_digest(files),
+        "files": files,
+    }
+
+    # Members are stored uncompressed, so they can be read straight from the
+    # mapped archive. Timestamps are fixed to make builds reproducible.
+    Path(bundle_path).parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(bundle_path, "w", compression=zipfile.ZIP_STORED) as archive:
+        archive.writestr(zipfile.ZipInfo(BUNDLE_INDEX, _ZIP_EPOCH), json.dumps(index, indent=1))
+        for name, data in contents.items():
+            info = zipfile.ZipInfo(name, _ZIP_EPOCH)
+            info.external_attr = (0o100000 | files[name]["mode"]) << 16
+            archive.writestr(info, data)
+
+    return index
+
+
+def build_bundles(output_path=BUNDLES_PATH):
+    """Build the bundles of all the available templates.
+
+    Parameters
+    ----------
+    output_path : ~pathlib.Path, optional
+        Directory where bundles are created. Default is the directory where
+        installed bundles are looked up.
+
+    Returns
+    -------
+    list
+        Paths to the created bundles.
+
+    """
+    template_paths = {
+        path.resolve() for name, path in TEMPLATE_PATH_FINDER.items() if name != "common"
+    }
+    bundle_paths = []
+    for template_path in sorted(template_paths):
+        bundle_path = Path(output_path) / f"{template_path.name}.zip"
+        build_bundle(template_path, bundle_path)
+        bundle_paths.append(bundle_path)
+    return bundle_paths
+
+
+@contextlib.contextmanager
+def _open_bundle(bundle_path):
+    """Open a bundle as a memory-mapped zip archive.
+
+    Parameters
+    ----------
+    bundle_path : ~pathlib.Path
+        Path to the bundle.
+
+    Yields
+    ------
+    zipfile.ZipFile
+        Archive reading its members from the mapped bundle.
+
+    """
+    with open(bundle_path, "rb") as bundle_file:
+        with _MappedFile(bundle_file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            with zipfile.ZipFile(buffer) as archive:
+                yield archive
+
+
+def read_bundle_index(bundle_path):
+    """Read the index of a bundle.
+
+    Parameters
+    ----------
+    bundle_path : ~pathlib.Path
+        Path to the bundle.
+
+    Returns
+    -------
+    dict
+        Index of the bundle.
+
+    Raises
+    ------
+    ValueError
+        If the file is not a bundle or its format is not supported.
+
+    """
+    try:
+        with _open_bundle(bundle_path) as archive:
+            index = json.loads(archive.read(BUNDLE_INDEX))
+    except (zipfile.BadZipFile, KeyError, ValueError) as error:
+        raise ValueError(f"'{bundle_path}' is not a template bundle.") from error
+
+    if index.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported format of template bundle '{bundle_path}'.")
+    return index
+
+
+def extract_bundle(bundle_path, output_path):
+    """Extract all the files of a bundle, checking their hashes.
+
+    Parameters
+    ----------
+    bundle_path : ~pathlib.Path
+        Path to the bundle.
+    output_path : ~pathlib.Path
+        Directory where the files are extracted.
+
+    Raises
+    ------
+    ValueError
+        If the path of a file is not relative to the output directory or the
+        contents of a file do not match its hash.
+
+    """
+    with _open_bundle(bundle_path) as archive:
+        index = json.loads(archive.read(BUNDLE_INDEX))
+        for name, entry in index["files"].items():
+            member_path = PurePosixPath(name)
+            if (
+                member_path.is_absolute()
+                or PureWindowsPath(name).drive
+                or "\\" in name
+                or ".." in member_path.parts
+            ):
+                raise ValueError(
+                    f"File '{name}' of template bundle '{bundle_path}' is not allowed."
+                )
+
+            data = archive.read(name)
+            if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                raise ValueError(f"File '{name}' of template bundle '{bundle_path}' is corrupted.")
+
+            filepath = Path(output_path, name)
+            filepath.parent.mkdir(parents=True, exist_ok=True)
+            filepath.write_bytes(data)
+            os.chmod(filepath, entry["mode"])
+
+
+def find_bundle(template_path):
+    """Return the installed bundle of a template, if any.
+
+    A bundle is only returned while it is up to date, i.e. while its digest
+    matches the loose files of the template, if any. A stale bundle never
+    shadows changes to the template.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template.
+
+    Returns
+    -------
+    ~pathlib.Path or None
+        Path to the bundle. ``None`` if the template has not been bundled or
+        its bundle is stale, in which case its loose files are used.
+
+    """
+    bundle_path = BUNDLES_PATH / f"{Path(template_path).name}.zip"
+    if not bundle_path.is_file():
+        return None
+
+    files = collect_template_files(template_path)
+    if not files:
+        # Only the bundle of the template is installed
+        return bundle_path
+
+    try:
+        bundle_digest = read_bundle_index(bundle_path).get("digest")
+    except ValueError:
+        return None
+    digest = files_digest(
+        {
+            name: {"sha256": hashlib.sha256(source_path.read_bytes()).hexdigest()}
+            for name, source_path in files.items()
+        }
+    )
+    return bundle_path if bundle_digest == digest else None
+
+
+def main():
+    """Build the bundles of all the available templates."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "output_path",
+        nargs="?",
+        default=BUNDLES_PATH,
+        type=Path,
+        help="Directory where bundles are created.",
+    )
+    args = parser.parse_args()
+
+    for bundle_path in build_bundles(args.output_path):
+        print(f"Built {bundle_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,262 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""A persistent cache of staged templates."""
+
+import hashlib
+import os
+from pathlib import Path
+import shutil
+import sys
+import time
+import uuid
+
+import ansys.templates
+
+CACHE_DIR_ENV_VAR = "ANSYS_TEMPLATES_CACHE_DIR"
+"""Environment variable overriding the location of the cache directory."""
+
+MAX_STAGED_TEMPLATES = 32
+"""Maximum number of staged templates kept in the cache."""
+
+EVICTION_MIN_AGE = 600
+"""Time in seconds during which a staged template is not evicted after being used."""
+
+
+def user_cache_dir():
+    """Return the directory where ansys-templates caches its data.
+
+    Returns
+    -------
+    ~pathlib.Path
+        Path to the cache directory. It may not exist yet.
+
+    """
+    if os.environ.get(CACHE_DIR_ENV_VAR):
+        return Path(os.environ[CACHE_DIR_ENV_VAR])
+
+    if sys.platform.startswith("win"):
+        base_path = Path(os.environ.get("LOCALAPPDATA", Path.home() / "AppData" / "Local"))
+        return base_path / "ansys-templates" / "Cache"
+    elif sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches" / "ansys-templates"
+    else:
+        base_path = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+        return base_path / "ansys-templates"
+
+
+def staging_cache_dir():
+    """Return the directory holding all the staged templates.
+
+    Returns
+    -------
+    ~pathlib.Path
+        Path to the staged templates cache directory.
+
+    """
+    return user_cache_dir() / "staging"
+
+
+def _hash_tree(hasher, path):
+    """Feed the paths, permission bits and contents of all files in a tree to a hasher.
+
+    Each file is prefixed with its path, size and permission bits, so files
+    whose paths and contents concatenate to the same bytes are told apart.
+
+    Parameters
+    ----------
+    hasher : hashlib._Hash
+        Hash object to be updated.
+    path : ~pathlib.Path
+        Path to the directory to be hashed.
+
+    """
+    for root, dirs, files in os.walk(path):
+        # Walk in a deterministic order
+        dirs.sort()
+        for file in sorted(files):
+            filepath = Path(root, file)
+            relpath, data = filepath.relative_to(path).as_posix(), filepath.read_bytes()
+            mode = filepath.stat().st_mode & 0o777
+            hasher.update(f"{relpath}\0{len(data)}\0{mode:o}\0".encode("utf-8"))
+            hasher.update(data)
+
+
+def staging_key(template_path, license_path):
+    """Compute the cache key of a staged template.
+
+    The key depends on the name of the template, the version of
+    ansys-templates and the contents of all the files being staged. Thus, any
+    change in the installed package produces a different key.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template.
+    license_path : ~pathlib.Path
+        Path to the license template.
+
+    Returns
+    -------
+    str
+        Key identifying the staged template.
+
+    """
+    hasher = hashlib.sha256()
+    for path in [template_path / "../common/{{cookiecutter.__project_name_slug}}", template_path]:
+        hasher.update(b"\0")
+        _hash_tree(hasher, path)
+    hasher.update(b"\0")
+    hasher.update(Path(license_path).read_bytes())
+
+    name, version = Path(template_path).resolve().name, ansys.templates.__version__
+    return f"{name}-{version}-{hasher.hexdigest()[:16]}"
+
+
+def bundle_staging_key(bundle_index, license_path):
+    """Compute the cache key of a template staged from a bundle.
+
+    The hashes precomputed when building the bundle are used, so no file of
+    the template is read.
+
+    Parameters
+    ----------
+    bundle_index : dict
+        Index of the bundle. See :mod:`ansys.templates.bundle`.
+    license_path : ~pathlib.Path
+        Path to the license template.
+
+    Returns
+    -------
+    str
+        Key identifying the staged template.
+
+    """
+    hasher = hashlib.sha256(bundle_index["digest"].encode("utf-8"))
+    hasher.update(b"\0")
+    hasher.update(Path(license_path).read_bytes())
+
+    name, version = bundle_index["template"], bundle_index["version"]
+    return f"{name}-{version}-{hasher.hexdigest()[:16]}"
+
+
+def get_staged_template(key, stage_function, max_entries=MAX_STAGED_TEMPLATES):
+    """Return the path to a staged template, staging it if not cached yet.
+
+    Parameters
+    ----------
+    key : str
+        Key identifying the staged template.
+    stage_function : callable
+        Function receiving a directory path and staging the template in it.
+        Only called if the template is not cached yet.
+    max_entries : int, optional
+        Maximum number of staged templates kept in the cache.
+
+    Returns
+    -------
+    ~pathlib.Path
+        Path to the staged template.
+
+    """
+    staged_path = staging_cache_dir() / key
+
+    if staged_path.is_dir():
+        # Record the access so least recently used templates are evicted first
+        os.utime(staged_path)
+        return staged_path
+
+    # Stage in a private directory and publish it atomically. This allows
+    # various processes to stage the same template at the same time.
+    tmp_path = staging_cache_dir() / f".{key}-{uuid.uuid4().hex}"
+    tmp_path.mkdir(parents=True)
+    try:
+        stage_function(tmp_path)
+        os.rename(tmp_path, staged_path)
+    except OSError:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        if not staged_path.is_dir():
+            raise
+
+    evict_staged_templates(max_entries)
+
+    return staged_path
+
+
+def evict_staged_templates(max_entries=MAX_STAGED_TEMPLATES, min_age=EVICTION_MIN_AGE):
+    """Remove the least recently used staged templates from the cache.
+
+    Staged templates used in the last ``min_age`` seconds are kept even if
+    the cache holds more than ``max_entries``, since other processes may
+    still be baking projects from them.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of staged templates kept in the cache.
+    min_age : float, optional
+        Time in seconds since their last use after which staged templates may
+        be evicted.
+
+    Returns
+    -------
+    int
+        Number of removed staged templates.
+
+    """
+    if not staging_cache_dir().is_dir():
+        return 0
+
+    last_uses = {}
+    for path in staging_cache_dir().iterdir():
+        if path.name.startswith("."):
+            continue
+        try:
+            last_uses[path] = path.stat().st_mtime
+        except FileNotFoundError:
+            # Evicted by another process
+            continue
+
+    removed = 0
+    now = time.time()
+    for path in sorted(last_uses, key=last_uses.get, reverse=True)[max_entries:]:
+        if now - last_uses[path] >= min_age:
+            shutil.rmtree(path, ignore_errors=True)
+            removed += 1
+
+    return removed
+
+
+def clear_cache():
+    """Remove all the staged templates from the cache.
+
+    Unlike the eviction done when staging templates, recently used staged
+    templates are removed too.
+
+    Returns
+    -------
+    int
+        Number of removed staged templates.
+
+    """
+    return evict_staged_templates(max_entries=0, min_age=0)
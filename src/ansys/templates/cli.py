@@ -22,25 +22,126 @@
 
 """Command Line Interface for PyAnsys Templates."""
 
+import json
 import os
 
 import click
 
-from ansys.templates import AVAILABLE_TEMPLATES_AND_DESCRIPTION, __version__
-from ansys.templates.paths import TEMPLATE_PATH_FINDER
-from ansys.templates.utils import bake_template
-
-
-def create_project(template, no_input=False, extra_context={}):
+import ansys.templates
+from ansys.templates import AVAILABLE_TEMPLATES_AND_DESCRIPTION
+from ansys.templates.cache import clear_cache, staging_cache_dir
+
+
+def create_project(
+    template,
+    no_input=False,
+    extra_context={},
+    bundle_path=None,
+    profile_path=None,
+    stats_path=None,
+    dry_run=False,
+    output=None,
+    output_format=None,
+    record=False,
+):
     """Create Python project based on a given template.
 
     Parameters
     ----------
     template : str
         Name of the template to be used as basis for the project
+    bundle_path : str, optional
+        Path to a bundle of the template to be baked instead of the installed
+        template.
+    profile_path : str, optional
+        Path to a JSON file where the time spent in each phase of the bake and
+        rendering each file is written. The slowest phases and files are also
+        printed. Not available with ``dry_run`` or ``output``.
+    stats_path : str, optional
+        Path to a file where :mod:`cProfile` statistics of the bake are dumped.
+        Not available with ``dry_run`` or ``output``.
+    dry_run : bool, optional
+        Print the path, size, hash and permission bits of each file of the
+        project as a line of JSON instead of writing the project. The values
+        of the template variables are not prompted, so the output only holds
+        JSON lines.
+    output : str, optional
+        Directory, archive or ``"-"`` for the standard output, where the
+        project is written as soon as each file is rendered. Hooks of the
+        template are not executed and the project holds no record for
+        ``ansys-templates update``. Values of the template variables are not
+        prompted when writing to the standard output.
+    output_format : str, optional
+        Format of the output. See :func:`ansys.templates.sinks.open_sink`.
+    record : bool, optional
+        Write a ``.ansys-templates.json`` file in the project recording how it
+        was baked, so it can be updated later with ``ansys-templates update``.
+
+    Raises
+    ------
+    click.UsageError
+        If the project is profiled or recorded but not baked into the current
+        directory.
 
     """
-    bake_template(TEMPLATE_PATH_FINDER[template], os.getcwd(), overwrite_if_exists=True, no_input=no_input, extra_context=extra_context)
+    if dry_run or output is not None:
+        for option, value in [
+            ("--profile", profile_path),
+            ("--profile-stats", stats_path),
+            ("--record", record),
+        ]:
+            if value:
+                raise click.UsageError(f"{option} cannot be combined with --dry-run or --output.")
+
+    # Rendering dependencies are slow to import, so each branch only imports
+    # the ones it needs
+    if dry_run:
+        from ansys.templates.paths import TEMPLATE_PATH_FINDER
+        from ansys.templates.utils import dry_run_template
+
+        for file_info in dry_run_template(
+            TEMPLATE_PATH_FINDER[template],
+            os.getcwd(),
+            bundle_path=bundle_path,
+            no_input=True,
+            extra_context=extra_context,
+        ):
+            print(json.dumps(file_info), flush=True)
+        return
+
+    if output is not None:
+        from ansys.templates.paths import TEMPLATE_PATH_FINDER
+        from ansys.templates.sinks import open_sink
+        from ansys.templates.utils import bake_template
+
+        with open_sink(output, output_format) as sink:
+            bake_template(
+                TEMPLATE_PATH_FINDER[template],
+                os.getcwd(),
+                bundle_path=bundle_path,
+                sink=sink,
+                no_input=no_input or output == "-",
+                extra_context=extra_context,
+            )
+        return
+
+    from ansys.templates.profiling import BakeProfile
+    from ansys.templates.update import bake_project
+
+    profile = BakeProfile(stats_path)
+    bake_project(
+        template,
+        os.getcwd(),
+        no_input=no_input,
+        extra_context=extra_context,
+        bundle_path=bundle_path,
+        profile=profile,
+        record=record,
+    )
+
+    if profile_path:
+        profile.write_json(profile_path)
+        print(profile.format_report())
 
 
 @click.group()
@@ -60,64 +161,187 @@ def list():
 @main.command()
 def version():
     """Display current version."""
-    print(f"ansys-templates {__version__}")
+    print(f"ansys-templates {ansys.templates.__version__}")
 
 
-@main.group()
-def new():
-    """Create a new project from desired template."""
-    pass
+@main.command()
+@click.argument("jobs_file", type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    "-j",
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Maximum number of worker processes. Default is the number of CPUs.",
+)
+def bake_many(jobs_file, max_workers):
+    """Bake various projects in parallel from a jobs file.
+
+    JOBS_FILE is a JSON or YAML file holding a list of jobs. Each job is a
+    mapping with a 'template' name, an 'output_dir' and, optionally, an
+    'extra_context' mapping of cookiecutter variables.
+    """
+    from ansys.templates.utils import bake_templates, load_bake_jobs
+
+    try:
+        jobs = load_bake_jobs(jobs_file)
+    except ValueError as err:
+        raise click.ClickException(str(err))
+    results = bake_templates(jobs, max_workers=max_workers)
+
+    for result in results:
+        status = "OK" if result.succeeded else "FAILED"
+        print(f"{status:<6} {result.elapsed:8.2f}s  {result.template} -> {result.output_dir}")
+        if not result.succeeded:
+            print(f"       {result.error}")
+
+    failures = sum(not result.succeeded for result in results)
+    print(f"\nBaked {len(results) - failures} of {len(results)} project(s)")
+    if failures:
+        raise SystemExit(1)
+
 
+@main.command()
+@click.argument("project_dir", type=click.Path(exists=True, file_okay=False), default=".")
+@click.option(
+    "-t",
+    "--template",
+    type=click.Choice(tuple(AVAILABLE_TEMPLATES_AND_DESCRIPTION)),
+    default=None,
+    help="Template of the project. Only required if the project has no record.",
+)
+@click.option(
+    "--from-bundle",
+    "bundle_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Update from a template bundle instead of the installed template.",
+)
+def update(project_dir, template, bundle_path):
+    """Update a project to the installed version of its template.
+
+    PROJECT_DIR is the directory of the project, by default the current one.
+    Only the files changed in the template are written. Files also changed in
+    the project are left untouched and reported as conflicts.
+    """
+    from ansys.templates.update import update_project
 
-@new.command()
-def doc_project():
-    """Create a documentation project using Sphinx."""
-    create_project("doc-project")
+    report = update_project(project_dir, template=template, bundle_path=bundle_path)
 
+    for status, files in [
+        ("added", report.added),
+        ("updated", report.updated),
+        ("removed", report.removed),
+        ("kept", report.kept),
+    ]:
+        for file in files:
+            print(f"{status:<9} {file}")
+    for file, reason in report.conflicts.items():
+        print(f"{'conflict':<9} {file} ({reason})")
 
-@new.command()
-def pybasic():
-    """Create a basic Python Package."""
-    create_project("pybasic")
+    changes = len(report.added) + len(report.updated) + len(report.removed)
+    print(f"\nUpdated {changes} file(s) with {len(report.conflicts)} conflict(s)")
+    if report.conflicts:
+        raise SystemExit(1)
 
 
-@new.command()
-def pyansys():
-    """Create a PyAnsys Python Package project."""
-    create_project("pyansys")
+@main.group()
+def cache():
+    """Manage the cache of staged templates."""
+    pass
 
 
-@new.command()
-def pyansys_advanced():
-    """Create an advanced PyAnsys Python Package project."""
-    create_project("pyansys-advanced")
+@cache.command()
+def clear():
+    """Remove all the staged templates from the cache."""
+    removed = clear_cache()
+    print(f"Removed {removed} staged template(s) from {staging_cache_dir()}")
 
 
-@new.command()
-def pyansys_openapi_client():
-    """Create an OpenAPI Client Package project."""
-    create_project("pyansys-openapi-client")
+@main.group()
+@click.option(
+    "--from-bundle",
+    "bundle_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Bake from a template bundle instead of the installed template.",
+)
+@click.option(
+    "--profile",
+    "profile_path",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Write the time spent in each phase and file to a JSON file.",
+)
+@click.option(
+    "--profile-stats",
+    "stats_path",
+    type=click.Path(dir_okay=False, writable=True),
+    default=None,
+    help="Dump cProfile statistics of the bake to a file.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Print each file of the project with default values as JSON lines without writing it.",
+)
+@click.option(
+    "-o",
+    "--output",
+    type=click.Path(allow_dash=True),
+    default=None,
+    help="Write the project into a directory, a .tar.gz or .zip archive, or '-' for stdout.",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(["dir", "tar.gz", "zip"]),
+    default=None,
+    help="Format of the output. Default is inferred from its extension.",
+)
+@click.option(
+    "--record",
+    is_flag=True,
+    default=False,
+    help="Record how the project is baked, so 'ansys-templates update' can update it.",
+)
+@click.pass_context
+def new(ctx, bundle_path, profile_path, stats_path, dry_run, output, output_format, record):
+    """Create a new project from desired template."""
+    ctx.obj = {
+        "bundle_path": bundle_path,
+        "profile_path": profile_path,
+        "stats_path": stats_path,
+        "dry_run": dry_run,
+        "output": output,
+        "output_format": output_format,
+        "record": record,
+    }
 
 
-@new.command()
-def pyace():
-    """Create a Python project for any method developers."""
-    create_project("pyace")
+def _new_template_command(template, description):
+    """Create the command baking a project from a template.
 
+    Parameters
+    ----------
+    template : str
+        Name of the template.
+    description : str
+        Help of the command.
 
-@new.command()
-def pyace_fast():
-    """Create a FastAPI project initialized for any developer."""
-    create_project("pyace-fast")
+    Returns
+    -------
+    click.Command
+        Command named after the template.
+
+    """
 
+    @click.pass_obj
+    def callback(obj):
+        create_project(template, **obj)
 
-@new.command()
-def pyace_flask():
-    """Create a Flask project initialized for any developer."""
-    create_project("pyace-flask")
+    return click.Command(template, callback=callback, help=description)
 
 
-@new.command()
-def pyace_grpc():
-    """Create gRPC project initialized for any developer."""
-    create_project("pyace-grpc")
+for _template, _description in AVAILABLE_TEMPLATES_AND_DESCRIPTION.items():
+    new.add_command(_new_template_command(_template, _description))
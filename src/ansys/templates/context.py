@@ -0,0 +1,443 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Non-interactive resolution of the variables of a template.
+
+Variables declared in a ``cookiecutter.json`` file may be derived from other
+variables through Jinja expressions, like the ``__*_slug`` variables. When no
+input is prompted, cookiecutter renders all these expressions again for every
+bake. Here, the references between variables are extracted once, variables are
+rendered following their dependencies and the resolved values are memoized, so
+baking the same template with the same values only renders them once. Values
+using non-deterministic extensions, like ``{% now %}`` or ``uuid4()``, are
+rendered again for every bake.
+
+Values given by the user are validated against the declared variables before
+anything is rendered.
+"""
+
+from collections import OrderedDict
+import copy
+from functools import lru_cache
+import json
+import os
+import warnings
+
+from cookiecutter.environment import StrictEnvironment
+from cookiecutter.exceptions import UndefinedVariableInTemplate
+from jinja2 import nodes
+from jinja2.exceptions import TemplateSyntaxError, UndefinedError
+
+MAX_RESOLVED_CONTEXTS = 256
+"""Maximum number of resolved contexts kept in memory."""
+
+_RESOLVED_CONTEXTS = OrderedDict()
+"""Resolved variables indexed by the raw variables they were resolved from."""
+
+_ENVIRONMENTS = {}
+"""Environments rendering the variables indexed by their Jinja extensions."""
+
+_NON_DETERMINISTIC_GLOBALS = frozenset(["lipsum", "random_ascii_string", "uuid4"])
+"""Jinja globals returning a different value every time they are called."""
+
+_NON_DETERMINISTIC_FILTERS = frozenset(["random"])
+"""Jinja filters returning a different value every time they are applied."""
+
+
+class InvalidContextError(ValueError):
+    """Values given for the variables of a template are not valid.
+
+    Parameters
+    ----------
+    errors : list
+        Description of each invalid value.
+
+    """
+
+    def __init__(self, errors):
+        """Initialize the error from the description of each invalid value."""
+        self.errors = list(errors)
+        super().__init__(
+            "Invalid values of the template variables:\n"
+            + "\n".join(f"- {error}" for error in self.errors)
+        )
+
+
+@lru_cache(maxsize=64)
+def _read_variables(context_file, mtime_ns, size):
+    """Read the variables declared in a context file, see :func:`load_variables`."""
+    with open(context_file, encoding="utf-8") as file:
+        return json.load(file, object_pairs_hook=OrderedDict)
+
+
+def load_variables(context_file):
+    """Load the variables declared in a ``cookiecutter.json`` file.
+
+    The file is only read again if it changes.
+
+    Parameters
+    ----------
+    context_file : str or ~pathlib.Path
+        Path to the ``cookiecutter.json`` file.
+
+    Returns
+    -------
+    collections.OrderedDict
+        Raw values of the variables, in declaration order. It must not be
+        modified.
+
+    """
+    stat = os.stat(context_file)
+    return _read_variables(os.path.abspath(context_file), stat.st_mtime_ns, stat.st_size)
+
+
+def validate_extra_context(variables, extra_context):
+    """Check the values given for the variables of a template.
+
+    Parameters
+    ----------
+    variables : dict
+        Raw values of the variables declared by the template.
+    extra_context : dict
+        Values given for the variables.
+
+    Raises
+    ------
+    InvalidContextError
+        If any value does not match the declared variable, e.g. a choice not
+        among the declared ones. All the invalid values are reported at once.
+
+    Warns
+    -----
+    UserWarning
+        If values are given for variables the template does not declare. These
+        values are ignored.
+
+    """
+    errors, unknown = [], []
+    for name, value in extra_context.items():
+        if name not in variables:
+            unknown.append(name)
+            continue
+
+        declared = variables[name]
+        if isinstance(declared, list):
+            if value not in declared:
+                choices = ", ".join(repr(choice) for choice in declared)
+                errors.append(
+                    f"{value!r} is not a valid choice for '{name}'. Choose from {choices}."
+                )
+        elif isinstance(declared, bool):
+            if not isinstance(value, bool):
+                errors.append(f"'{name}' expects a boolean, got {value!r}.")
+        elif isinstance(declared, dict):
+            if not isinstance(value, dict):
+                errors.append(f"'{name}' expects a mapping, got {value!r}.")
+        elif isinstance(value, (dict, list)):
+            errors.append(f"'{name}' expects a single value, got {value!r}.")
+
+    if unknown:
+        warnings.warn(
+            f"Ignoring values of undeclared template variables: {', '.join(sorted(unknown))}.",
+            stacklevel=2,
+        )
+    if errors:
+        raise InvalidContextError(errors)
+
+
+def _get_environment(context):
+    """Return the environment rendering the variables of a context.
+
+    Parameters
+    ----------
+    context : dict
+        Cookiecutter context, whose ``_extensions`` are loaded.
+
+    Returns
+    -------
+    jinja2.Environment
+        Strict environment shared by all contexts with the same extensions.
+
+    """
+    key = json.dumps(context["cookiecutter"].get("_extensions", []))
+    env = _ENVIRONMENTS.get(key)
+    if env is None:
+        env = _ENVIRONMENTS[key] = StrictEnvironment(context=context)
+    return env
+
+
+def _references(env, raw):
+    """Find the variables referenced by a raw value.
+
+    Parameters
+    ----------
+    env : jinja2.Environment
+        Environment parsing the value.
+    raw : object
+        Raw value of a variable.
+
+    Returns
+    -------
+    frozenset or None
+        Names of the referenced variables. ``None`` if the whole
+        ``cookiecutter`` object is referenced, so any variable may be used.
+
+    """
+    if isinstance(raw, dict):
+        sources = [*raw.keys(), *raw.values()]
+    elif isinstance(raw, list):
+        sources = raw
+    else:
+        sources = [raw]
+
+    names = set()
+    for source in sources:
+        if isinstance(source, (dict, list)):
+            nested = _references(env, source)
+            if nested is None:
+                return None
+            names.update(nested)
+            continue
+        if not isinstance(source, str) or "cookiecutter" not in source:
+            continue
+
+        try:
+            tree = env.parse(source)
+        except TemplateSyntaxError:
+            # The error is raised when the value is rendered
+            continue
+        attributes = set()
+        for node in tree.find_all((nodes.Getattr, nodes.Getitem)):
+            if isinstance(node.node, nodes.Name) and node.node.name == "cookiecutter":
+                if isinstance(node, nodes.Getattr):
+                    names.add(node.attr)
+                elif isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
+                    names.add(node.arg.value)
+                else:
+                    return None
+                attributes.add(id(node.node))
+        for node in tree.find_all(nodes.Name):
+            if node.name == "cookiecutter" and id(node) not in attributes:
+                return None
+    return frozenset(names)
+
+
+def _is_deterministic(env, raw):
+    """Check if rendering a raw value always gives the same result.
+
+    Parameters
+    ----------
+    env : jinja2.Environment
+        Environment parsing the value.
+    raw : object
+        Raw value of a variable.
+
+    Returns
+    -------
+    bool
+        ``False`` if the value uses an extension tag, like ``{% now %}``, or a
+        non-deterministic global or filter, like ``uuid4()``.
+
+    """
+    if isinstance(raw, dict):
+        sources = [*raw.keys(), *raw.values()]
+    elif isinstance(raw, list):
+        sources = raw
+    else:
+        sources = [raw]
+
+    for source in sources:
+        if isinstance(source, (dict, list)):
+            if not _is_deterministic(env, source):
+                return False
+            continue
+        if not isinstance(source, str) or ("{{" not in source and "{%" not in source):
+            continue
+
+        try:
+            tree = env.parse(source)
+        except TemplateSyntaxError:
+            # The error is raised when the value is rendered
+            continue
+        if next(tree.find_all(nodes.ExtensionAttribute), None) is not None:
+            return False
+        if any(node.name in _NON_DETERMINISTIC_GLOBALS for node in tree.find_all(nodes.Name)):
+            return False
+        if any(node.name in _NON_DETERMINISTIC_FILTERS for node in tree.find_all(nodes.Filter)):
+            return False
+    return True
+
+
+def _resolution_order(env, variables):
+    """Sort the variables so each one comes after the variables it references.
+
+    Parameters
+    ----------
+    env : jinja2.Environment
+        Environment parsing the values.
+    variables : dict
+        Raw values of the variables, in declaration order.
+
+    Returns
+    -------
+    list
+        Names of the variables to be rendered, in resolution order.
+
+    Raises
+    ------
+    InvalidContextError
+        If variables reference each other in a cycle.
+
+    """
+    names = list(variables)
+    dependencies = {}
+    for position, name in enumerate(names):
+        references = _references(env, variables[name])
+        if references is None:
+            # Like cookiecutter, only variables declared before are available
+            references = names[:position]
+        dependencies[name] = [other for other in references if other in variables and other != name]
+
+    order, visiting, visited = [], set(), set()
+
+    def visit(name, path):
+        if name in visited:
+            return
+        if name in visiting:
+            cycle = path[path.index(name) :] + [name]
+            raise InvalidContextError([f"Circular reference between {' -> '.join(cycle)}."])
+        visiting.add(name)
+        for dependency in dependencies[name]:
+            visit(dependency, path + [name])
+        visiting.discard(name)
+        visited.add(name)
+        order.append(name)
+
+    for name in names:
+        visit(name, [])
+    return order
+
+
+def _render(env, raw, resolved):
+    """Render a raw value like :func:`cookiecutter.prompt.render_variable`."""
+    if raw is None or isinstance(raw, bool):
+        return raw
+    if isinstance(raw, dict):
+        return {
+            _render(env, key, resolved): _render(env, value, resolved) for key, value in raw.items()
+        }
+    if isinstance(raw, list):
+        return [_render(env, value, resolved) for value in raw]
+    return env.from_string(str(raw)).render(cookiecutter=resolved)
+
+
+def _resolve(env, variables):
+    """Resolve the raw values of the variables, see :func:`resolve_variables`."""
+    resolved = {}
+    for name in _resolution_order(env, variables):
+        raw = variables[name]
+        if name.startswith("_") and not name.startswith("__"):
+            resolved[name] = raw
+            continue
+        try:
+            if isinstance(raw, list) and not name.startswith("__"):
+                # Choice variables default to their first option
+                resolved[name] = _render(env, raw, resolved)[0]
+            else:
+                resolved[name] = _render(env, raw, resolved)
+        except UndefinedError as err:
+            msg = f"Unable to render variable '{name}'"
+            raise UndefinedVariableInTemplate(msg, err, {"cookiecutter": variables}) from err
+
+    # Keep the order of the values resolved by cookiecutter, which renders
+    # public mappings last
+    return OrderedDict(
+        [
+            (name, resolved[name])
+            for name, raw in variables.items()
+            if not _is_public_dict(name, raw)
+        ]
+        + [(name, resolved[name]) for name, raw in variables.items() if _is_public_dict(name, raw)]
+    )
+
+
+def _is_public_dict(name, raw):
+    """Check if a variable is a mapping rendered after all other variables."""
+    return isinstance(raw, dict) and not name.startswith("_")
+
+
+def resolve_variables(context):
+    """Resolve the values of the variables of a context without prompting.
+
+    This is equivalent to :func:`cookiecutter.prompt.prompt_for_config` with
+    ``no_input=True``. Results are memoized, so resolving the same raw values
+    again does not render anything, unless they use non-deterministic
+    extensions or the template loads its own Jinja extensions.
+
+    Parameters
+    ----------
+    context : dict
+        Cookiecutter context holding the raw values of the variables, with any
+        values given by the user already applied.
+
+    Returns
+    -------
+    collections.OrderedDict
+        Resolved value of each variable.
+
+    Raises
+    ------
+    InvalidContextError
+        If variables reference each other in a cycle.
+    UndefinedVariableInTemplate
+        If a variable references an undefined variable.
+
+    """
+    variables = OrderedDict(context["cookiecutter"])
+    variables.pop("__prompts__", None)
+    context["cookiecutter"].pop("__prompts__", None)
+
+    try:
+        key = json.dumps(variables)
+    except TypeError:
+        # Values which are not serializable can not be memoized
+        key = None
+
+    env = _get_environment(context)
+    if key is not None and key in _RESOLVED_CONTEXTS:
+        _RESOLVED_CONTEXTS.move_to_end(key)
+        resolved = _RESOLVED_CONTEXTS[key]
+        # Non-deterministic values are memoized as None and rendered again
+        return copy.deepcopy(resolved) if resolved is not None else _resolve(env, variables)
+
+    resolved = _resolve(env, variables)
+    if key is not None:
+        deterministic = not variables.get("_extensions") and all(
+            _is_deterministic(env, raw)
+            for name, raw in variables.items()
+            if not name.startswith("_") or name.startswith("__")
+        )
+        _RESOLVED_CONTEXTS[key] = resolved if deterministic else None
+        if len(_RESOLVED_CONTEXTS) > MAX_RESOLVED_CONTEXTS:
+            _RESOLVED_CONTEXTS.popitem(last=False)
+    return copy.deepcopy(resolved)
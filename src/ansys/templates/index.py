@@ -0,0 +1,223 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Precomputed index of the available templates.
+
+The index is a single JSON file shipped with the package. It lists the path and
+the description of each template, so the CLI looks up templates in the index
+rather than scanning the template directories.
+
+Build the index after adding or modifying a template with:
+
+.. code:: bash
+
+   python -m ansys.templates.index
+
+"""
+
+import argparse
+from functools import lru_cache
+import hashlib
+import json
+import os
+from pathlib import Path
+
+INDEX_FORMAT = 2
+"""Version of the layout of the index."""
+
+INDEX_PATH = Path(os.path.dirname(os.path.abspath(__file__))) / "templates.json"
+"""Path to the index of the installed templates."""
+
+
+def collect_template_files(template_path):
+    """Map the path of each staged file to its source path.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template.
+
+    Returns
+    -------
+    dict
+        Source paths indexed by their POSIX path relative to the staged
+        template. Template files override common files.
+
+    """
+    project_dir = "{{cookiecutter.__project_name_slug}}"
+    layers = [
+        (Path(template_path) / "../common" / project_dir, project_dir),
+        (Path(template_path), ""),
+    ]
+
+    files = {}
+    for layer_path, prefix in layers:
+        for root, dirs, filenames in os.walk(layer_path):
+            dirs[:] = sorted(name for name in dirs if name != "__pycache__")
+            for filename in sorted(filenames):
+                source_path = Path(root, filename)
+                relative_path = source_path.relative_to(layer_path).as_posix()
+                files[f"{prefix}/{relative_path}" if prefix else relative_path] = source_path
+    return files
+
+
+def files_digest(files):
+    """Compute the digest of the files of a template.
+
+    Parameters
+    ----------
+    files : dict
+        Entries holding the ``sha256`` hash of each file, indexed by its POSIX
+        path relative to the staged template.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the paths and hashes of all the files.
+
+    """
+    digest = hashlib.sha256()
+    for name, entry in sorted(files.items()):
+        digest.update(f"{name}\0{entry['sha256']}\0".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def build_index(templates_path=None):
+    """Build the index of the templates found in a directory.
+
+    Each template is a directory holding a ``manifest.json`` file with its
+    ``name`` and ``description``. See :mod:`ansys.templates.manifest`.
+
+    Parameters
+    ----------
+    templates_path : ~pathlib.Path, optional
+        Directory holding the templates and their ``common`` directory.
+        Default is the directory of the installed Python templates.
+
+    Returns
+    -------
+    dict
+        Index of the templates, sorted by name. Paths are relative to the
+        directory of the package.
+
+    """
+    from ansys.templates.manifest import load_manifest
+
+    package_path = INDEX_PATH.parent
+    templates_path = Path(templates_path or package_path / "python")
+
+    templates = {}
+    for template_path in sorted(templates_path.iterdir()):
+        manifest = load_manifest(template_path) if template_path.is_dir() else None
+        if manifest is None or "name" not in manifest:
+            continue
+
+        templates[manifest["name"]] = {
+            "path": Path(os.path.relpath(template_path, package_path)).as_posix(),
+            "description": manifest.get("description", ""),
+        }
+
+    return {
+        "format": INDEX_FORMAT,
+        "common": Path(os.path.relpath(templates_path / "common", package_path)).as_posix(),
+        "templates": dict(sorted(templates.items())),
+    }
+
+
+def write_index(index_path=INDEX_PATH, templates_path=None):
+    """Build the index of the templates and write it.
+
+    The file is only written if its contents change.
+
+    Parameters
+    ----------
+    index_path : ~pathlib.Path, optional
+        Path to the index. Default is the index of the installed templates.
+    templates_path : ~pathlib.Path, optional
+        Directory holding the templates. Default is the directory of the
+        installed Python templates.
+
+    Returns
+    -------
+    bool
+        ``True`` if the index was written.
+
+    """
+    contents = json.dumps(build_index(templates_path), indent=1) + "\n"
+    index_path = Path(index_path)
+    if index_path.is_file() and index_path.read_text(encoding="utf-8") == contents:
+        return False
+
+    index_path.write_text(contents, encoding="utf-8")
+    load_index.cache_clear()
+    return True
+
+
+@lru_cache(maxsize=None)
+def load_index():
+    """Load the index of the installed templates.
+
+    The index is read only once per process. If the package was installed
+    without an index, it is built from the template directories instead.
+
+    Returns
+    -------
+    dict
+        Index of the templates. See :func:`build_index`.
+
+    Raises
+    ------
+    ValueError
+        If the format of the index is not supported.
+
+    """
+    if not INDEX_PATH.is_file():
+        return build_index()
+
+    with open(INDEX_PATH, encoding="utf-8") as index_file:
+        index = json.load(index_file)
+    if index.get("format") != INDEX_FORMAT:
+        raise ValueError(f"Unsupported format of the template index {INDEX_PATH}.")
+    return index
+
+
+def main():
+    """Build the index of the installed templates."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "index_path",
+        nargs="?",
+        default=INDEX_PATH,
+        type=Path,
+        help="Path to the index. Default is the index shipped with the package.",
+    )
+    args = parser.parse_args()
+
+    if write_index(args.index_path):
+        print(f"Built {args.index_path}")
+    else:
+        print(f"{args.index_path} is up to date")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,182 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Declarative description of the files included in each template.
+
+A template can ship a ``manifest.json`` file next to its ``cookiecutter.json``
+file. The manifest lists the files of the rendered project, relative to its
+root directory:
+
+.. code:: json
+
+    {
+      "name": "pybasic",
+      "description": "Create a basic Python Package.",
+      "files": ["README.rst", "src/{{ cookiecutter.__project_name_slug }}/__init__.py"],
+      "renames": {"requirements_build.txt": "requirements/requirements_build.txt"},
+      "conditions": [
+        {"when": {"ci_cd_platform": "GitHub"}, "files": [".github/workflows/ci_cd.yml"]},
+        {"when": {"build_system": ["flit", "setuptools"]}, "files": ["setup.py"]}
+      ]
+    }
+
+Files under ``conditions`` are only included when all the cookiecutter
+variables under ``when`` match the given value, or any of the given values if a
+list is provided. Files under ``renames`` are rendered using the original name
+and then moved to the new one, which is the name to use in ``files``.
+
+If ``sort_imports`` is ``true``, the post-generation hook of the template sorts
+the imports of all the Python files with :func:`ansys.templates.utils.sort_project_imports`.
+Projects rendered in memory, e.g. by a dry run, get the same post-processing.
+
+The ``name`` and ``description`` of the template are used to expose it in the
+CLI. See :mod:`ansys.templates.index`.
+
+"""
+
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+
+MANIFEST_FILENAME = "manifest.json"
+"""Name of the file declaring the structure of a template."""
+
+
+def load_manifest(template_path):
+    """Load the manifest of a template.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template or to its staged version.
+
+    Returns
+    -------
+    dict or None
+        Contents of the manifest. ``None`` if the template has no manifest.
+
+    """
+    manifest_path = Path(template_path) / MANIFEST_FILENAME
+    if not manifest_path.is_file():
+        return None
+
+    with open(manifest_path, encoding="utf-8") as manifest_file:
+        return json.load(manifest_file)
+
+
+def _matches(conditions, context):
+    """Check if the cookiecutter context satisfies all the given conditions.
+
+    Parameters
+    ----------
+    conditions : dict
+        Cookiecutter variables and their required values.
+    context : dict
+        Cookiecutter context.
+
+    Returns
+    -------
+    bool
+        ``True`` if all the conditions are satisfied.
+
+    """
+    for variable, expected_value in conditions.items():
+        value = context["cookiecutter"].get(variable)
+        expected_values = expected_value if isinstance(expected_value, list) else [expected_value]
+        if value not in expected_values:
+            return False
+    return True
+
+
+@dataclass(frozen=True)
+class RenderPlan:
+    """Files to be rendered for a given cookiecutter context.
+
+    Parameters
+    ----------
+    files : frozenset
+        Files of the final project, relative to its root directory.
+    renames : dict
+        Original and final names of the renamed files.
+
+    """
+
+    files: frozenset
+    renames: dict = field(default_factory=dict)
+
+    def __post_init__(self):
+        """Compute the rendered names of all the files to be kept."""
+        source_files = {source for source, target in self.renames.items() if target in self.files}
+        source_files.update(file for file in self.files if file not in self.renames.values())
+        object.__setattr__(self, "_source_files", frozenset(source_files))
+
+    def includes(self, rendered_path):
+        """Check if a rendered file is part of the project.
+
+        Parameters
+        ----------
+        rendered_path : str
+            Rendered path of the file relative to the project root directory.
+
+        Returns
+        -------
+        bool
+            ``True`` if the file needs to be rendered.
+
+        """
+        return rendered_path.replace(os.path.sep, "/") in self._source_files
+
+
+def render_plan(manifest, context, env):
+    """Resolve the manifest of a template for a given cookiecutter context.
+
+    Parameters
+    ----------
+    manifest : dict
+        Contents of the template manifest.
+    context : dict
+        Cookiecutter context.
+    env : jinja2.Environment
+        Environment used to render the file names.
+
+    Returns
+    -------
+    RenderPlan
+        Files to be rendered.
+
+    """
+    files = list(manifest.get("files", []))
+    for condition in manifest.get("conditions", []):
+        if _matches(condition["when"], context):
+            files.extend(condition.get("files", []))
+
+    def render(path):
+        return env.from_string(path).render(**context)
+
+    return RenderPlan(
+        files=frozenset(render(file) for file in files),
+        renames={
+            render(source): render(target) for source, target in manifest.get("renames", {}).items()
+        },
+    )
@@ -25,11 +25,16 @@
 import os
 from pathlib import Path
 
+from ansys.templates.index import load_index
+
 _PATHS_MODULE = Path(os.path.dirname(os.path.abspath(__file__)))
 
 LICENSES_TEMPLATES_PATH = _PATHS_MODULE / "licenses"
 """Path to the software licenses templates."""
 
+BUNDLES_PATH = _PATHS_MODULE / "bundles"
+"""Path to the bundles of the templates, if built."""
+
 PYTHON_TEMPLATES_PATH = _PATHS_MODULE / "python"
 """Path to the Python templates."""
 
@@ -64,15 +69,7 @@ PYTHON_TEMPLATES_PYACE_FAST_PATH = PYTHON_TEMPLATES_PATH / "pyace_fastapi"
 """Path to the FastAPI based Python Project template."""
 
 TEMPLATE_PATH_FINDER = {
-    "common": PYTHON_TEMPLATES_COMMON_PATH,
-    "doc-project": PYTHON_TEMPLATES_DOC_PROJECT,
-    "pybasic": PYTHON_TEMPLATES_PYBASIC_PATH,
-    "pyansys": PYTHON_TEMPLATES_PYANSYS_PATH,
-    "pyansys-advanced": PYTHON_TEMPLATES_PYANSYS_ADVANCED_PATH,
-    "pyansys-openapi-client": PYTHON_TEMPLATES_PYANSYS_OPENAPI_CLIENT_PATH,
-    "pyace": PYTHON_TEMPLATES_PYACE_PATH,
-    "pyace-grpc": PYTHON_TEMPLATES_PYACE_GRPC_PATH,
-    "pyace-flask": PYTHON_TEMPLATES_PYACE_FLASK_PATH,
-    "pyace-fast": PYTHON_TEMPLATES_PYACE_FAST_PATH,
+    "common": _PATHS_MODULE / load_index()["common"],
+    **{name: _PATHS_MODULE / entry["path"] for name, entry in load_index()["templates"].items()},
 }
 """A dictionary relating templates names with their paths."""
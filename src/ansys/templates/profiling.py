@@ -0,0 +1,157 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Timing reports of baking projects."""
+
+import cProfile
+from contextlib import contextmanager
+import json
+import time
+
+
+class BakeProfile:
+    """Time spent in each phase of a bake and rendering each file.
+
+    Phases may be nested. The time of a phase excludes the time of the phases
+    nested in it, so the time of all phases adds up to the total time.
+
+    Parameters
+    ----------
+    stats_path : str or ~pathlib.Path, optional
+        Path where :mod:`cProfile` statistics are dumped. These can be read
+        with :mod:`pstats`. If ``None``, :mod:`cProfile` is not used.
+
+    """
+
+    def __init__(self, stats_path=None):
+        """Initialize an empty profile."""
+        self.stats_path = stats_path
+        self.total = 0.0
+        self.phases = {}
+        self.files = {}
+        self._nested_times = []
+
+    @contextmanager
+    def measure(self):
+        """Measure the total time of a bake."""
+        profiler = cProfile.Profile() if self.stats_path else None
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            yield self
+        finally:
+            if profiler:
+                profiler.disable()
+                profiler.dump_stats(str(self.stats_path))
+            self.total += time.perf_counter() - start
+
+    @contextmanager
+    def phase(self, name):
+        """Measure the time spent in a phase.
+
+        Parameters
+        ----------
+        name : str
+            Name of the phase.
+
+        """
+        start = time.perf_counter()
+        self._nested_times.append(0.0)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed - self._nested_times.pop()
+            if self._nested_times:
+                self._nested_times[-1] += elapsed
+
+    def record_file(self, path, elapsed):
+        """Record the time spent rendering a file.
+
+        Parameters
+        ----------
+        path : str
+            Path to the file relative to the template.
+        elapsed : float
+            Time spent rendering the file, in seconds.
+
+        """
+        self.files[path] = self.files.get(path, 0.0) + elapsed
+
+    def to_dict(self):
+        """Return the profile as a dictionary.
+
+        Returns
+        -------
+        dict
+            Total time, time of each phase and time of each file, slowest
+            files first. All times are in seconds.
+
+        """
+        return {
+            "total": self.total,
+            "phases": dict(self.phases),
+            "files": [
+                {"path": path, "seconds": elapsed}
+                for path, elapsed in sorted(self.files.items(), key=lambda item: -item[1])
+            ],
+        }
+
+    def write_json(self, path):
+        """Write the profile as JSON.
+
+        Parameters
+        ----------
+        path : str or ~pathlib.Path
+            Path to the JSON file.
+
+        """
+        with open(path, "w", encoding="utf-8") as json_file:
+            json.dump(self.to_dict(), json_file, indent=2)
+
+    def format_report(self, top=10):
+        """Format the profile as a human-readable table.
+
+        Parameters
+        ----------
+        top : int, optional
+            Number of slowest files to be included.
+
+        Returns
+        -------
+        str
+            Time of each phase and of the slowest files.
+
+        """
+        total = self.total or sum(self.phases.values()) or 1.0
+        lines = [f"{'phase':<12}{'seconds':>10}{'share':>8}"]
+        for name, elapsed in sorted(self.phases.items(), key=lambda item: -item[1]):
+            lines.append(f"{name:<12}{elapsed:>10.3f}{elapsed / total:>8.1%}")
+        lines.append(f"{'total':<12}{self.total:>10.3f}")
+
+        if self.files:
+            lines += ["", f"Slowest {min(top, len(self.files))} of {len(self.files)} file(s):"]
+            for entry in self.to_dict()["files"][:top]:
+                lines.append(f"{entry['seconds']:>10.3f}  {entry['path']}")
+        return "\n".join(lines)
@@ -1,6 +1,25 @@
 """Project installation script."""
+{%- if cookiecutter.__template_name == "pyace-grpc" %}
+
+from pathlib import Path
+import runpy
 
 from setuptools import find_namespace_packages, setup
+from setuptools.command.build_py import build_py
+
+
+class BuildPyWithStubs(build_py):
+    """Compile the protobuf files into the stubs package before building it."""
+
+    def run(self):
+        """Compile the stubs and build the Python modules."""
+        build_stubs_path = Path(__file__).resolve().parent / "build_stubs.py"
+        runpy.run_path(str(build_stubs_path))["build_stubs"]()
+        super().run()
+{% else %}
+
+from setuptools import find_namespace_packages, setup
+{%- endif %}
 
 setup(
     name="{{ cookiecutter.__pkg_name }}",
@@ -28,4 +47,7 @@ setup(
     packages=find_namespace_packages(where="src"),
     {%- endif %}
     package_dir={"": "src"},
+    {%- if cookiecutter.__template_name == "pyace-grpc" %}
+    cmdclass={"build_py": BuildPyWithStubs},
+    {%- endif %}
 )
@@ -0,0 +1,105 @@
+{%- if cookiecutter.copyright != "None" -%}
+# Copyright (c) {% now "utc", '%Y' %}, {{ cookiecutter.copyright }}. Unauthorised use, distribution or duplication is prohibited
+{% endif %}
+
+"""Compile the protobuf files into the ``stubs`` package.
+
+A protobuf file is only compiled again if its contents or the version of
+``grpcio-tools`` changed since its last compilation. Run it with::
+
+    python build_stubs.py
+"""
+import argparse
+import hashlib
+from importlib.metadata import version
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+PACKAGE = "stubs"
+"""Name of the package holding the stubs."""
+
+HASHES_FILE = ".proto-hashes.json"
+"""File recording the hash of the compiled protobuf files."""
+
+
+def _stub_paths(package_path, proto_name):
+    """Return the paths of the stubs of a protobuf file."""
+    stem = Path(proto_name).stem
+    return [package_path / f"{stem}_pb2.py", package_path / f"{stem}_pb2_grpc.py"]
+
+
+def build_stubs(proto_path=ROOT / "protobufs", output_path=ROOT / "src", force=False):
+    """Compile the protobuf files that changed.
+
+    The stubs import each other from the ``stubs`` package, so the output
+    directory must be importable.
+
+    Returns
+    -------
+    list
+        Names of the compiled protobuf files.
+    """
+    import grpc_tools
+    from grpc_tools import protoc
+
+    proto_path, output_path = Path(proto_path).resolve(), Path(output_path).resolve()
+    package_path = output_path / PACKAGE
+    hashes_path = package_path / HASHES_FILE
+    try:
+        hashes = json.loads(hashes_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        hashes = {}
+
+    tools_version = version("grpcio-tools")
+    include_path = Path(grpc_tools.__file__).parent / "_proto"
+    compiled, new_hashes = [], {}
+    for proto in sorted(proto_path.glob("*.proto")):
+        digest = hashlib.sha256(tools_version.encode())
+        digest.update(proto.read_bytes())
+        new_hashes[proto.name] = digest.hexdigest()
+        stubs = _stub_paths(package_path, proto.name)
+        if not force and hashes.get(proto.name) == new_hashes[proto.name]:
+            if all(stub.exists() for stub in stubs):
+                continue
+
+        # Map the protobuf files into the package, so the stubs import each
+        # other from it instead of relying on the import path
+        status = protoc.main(
+            [
+                "grpc_tools.protoc",
+                f"--proto_path={PACKAGE}={proto_path}",
+                f"--proto_path={include_path}",
+                f"--python_out={output_path}",
+                f"--grpc_python_out={output_path}",
+                str(proto),
+            ]
+        )
+        if status != 0:
+            raise RuntimeError(f"Failed to compile {proto}.")
+        compiled.append(proto.name)
+
+    # Remove the stubs of deleted protobuf files
+    for proto_name in set(hashes) - set(new_hashes):
+        for stub in _stub_paths(package_path, proto_name):
+            stub.unlink(missing_ok=True)
+
+    hashes_path.write_text(json.dumps(new_hashes, indent=2, sort_keys=True), encoding="utf-8")
+    return compiled
+
+
+def main(args=None):
+    """Compile the protobuf files from the command line."""
+    parser = argparse.ArgumentParser(description="Compile the protobuf files into stubs.")
+    parser.add_argument("--proto-path", default=ROOT / "protobufs", help="Protobuf files.")
+    parser.add_argument("--output-path", default=ROOT / "src", help="Parent of the stubs package.")
+    parser.add_argument("--force", action="store_true", help="Compile all protobuf files.")
+    settings = parser.parse_args(args)
+
+    compiled = build_stubs(settings.proto_path, settings.output_path, settings.force)
+    print(f"Compiled {len(compiled)} protobuf file(s): {', '.join(compiled) or 'none changed'}")
+
+
+if __name__ == "__main__":
+    main()
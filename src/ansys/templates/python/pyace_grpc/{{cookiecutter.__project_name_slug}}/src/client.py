@@ -8,20 +8,70 @@
 {{ cookiecutter.library_name }}
 """
 from __future__ import print_function
-
+{% if cookiecutter.server_model == "asyncio" %}
+import asyncio
+{%- endif %}
 import logging
-import os
-from pathlib import Path
-import sys
 
 import grpc
 
-sys.path.insert(0, os.path.join(Path(os.path.dirname(os.path.realpath(__file__))).parent, "stubs"))
-
 import stubs.pingserver_pb2 as pb2
 import stubs.pingserver_pb2_grpc as pb2_grpc
 
 
+CHUNK_SIZE = 64 * 1024
+"""Default size of the chunks, in bytes."""
+
+
+def read_chunks(file, chunk_size=CHUNK_SIZE):
+    """Read a binary file, one chunk at a time."""
+    return iter(lambda: file.read(chunk_size), b"")
+{% if cookiecutter.server_model == "asyncio" %}
+
+async def download(channel, size, file, chunk_size=CHUNK_SIZE):
+    """Download a payload into a binary file, one chunk at a time."""
+    stub = pb2_grpc.DataTransferStub(channel)
+    async for chunk in stub.Download(pb2.DownloadRequest(size=size, chunk_size=chunk_size)):
+        file.write(chunk.data)
+
+
+async def upload(channel, chunks):
+    """Upload a payload given as an iterable of chunks."""
+
+    async def requests():
+        for data in chunks:
+            yield pb2.Chunk(data=data)
+
+    stub = pb2_grpc.DataTransferStub(channel)
+    return await stub.Upload(requests())
+
+
+async def run():
+    """Run client."""
+    async with grpc.aio.insecure_channel("localhost:50051") as channel:
+        stub = pb2_grpc.PingerStub(channel)
+        response = await stub.WhoPing(pb2.UserRequest(name="you"))
+    print(response.message)
+
+
+if __name__ == "__main__":
+    logging.basicConfig()
+    asyncio.run(run())
+{%- else %}
+
+def download(channel, size, file, chunk_size=CHUNK_SIZE):
+    """Download a payload into a binary file, one chunk at a time."""
+    stub = pb2_grpc.DataTransferStub(channel)
+    for chunk in stub.Download(pb2.DownloadRequest(size=size, chunk_size=chunk_size)):
+        file.write(chunk.data)
+
+
+def upload(channel, chunks):
+    """Upload a payload given as an iterable of chunks."""
+    stub = pb2_grpc.DataTransferStub(channel)
+    return stub.Upload(pb2.Chunk(data=data) for data in chunks)
+
+
 def run():
     """Run client."""
     with grpc.insecure_channel("localhost:50051") as channel:
@@ -33,3 +83,4 @@ def run():
 if __name__ == "__main__":
     logging.basicConfig()
     run()
+{%- endif %}
@@ -0,0 +1,190 @@
+{%- if cookiecutter.copyright != "None" -%}
+# Copyright (c) {% now "utc", '%Y' %}, {{ cookiecutter.copyright }}. Unauthorised use, distribution or duplication is prohibited
+{% endif %}
+
+"""Metrics module.
+
+Metrics are recorded per thread, without locking, and merged when they are
+read. Each server process has its own registry.
+"""
+
+from bisect import bisect_left
+import functools
+import inspect
+import threading
+import time
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+"""Upper bounds of the latency buckets, in seconds."""
+
+
+class Shards(object):
+    """Values owned by each thread."""
+
+    def __init__(self, factory):
+        """Initialize the shards created by a factory."""
+        self._factory = factory
+        self._local = threading.local()
+        self._shards = []
+        self._lock = threading.Lock()
+
+    def local(self):
+        """Return the shard of the current thread."""
+        try:
+            return self._local.shard
+        except AttributeError:
+            shard = self._local.shard = self._factory()
+            with self._lock:
+                self._shards.append(shard)
+            return shard
+
+    def all(self):
+        """Return the shards of all threads."""
+        with self._lock:
+            return list(self._shards)
+
+
+class Counter(object):
+    """Monotonic counter."""
+
+    def __init__(self):
+        """Initialize the counter."""
+        self._shards = Shards(lambda: [0])
+
+    def inc(self, amount=1):
+        """Increment the counter."""
+        self._shards.local()[0] += amount
+
+    @property
+    def value(self):
+        """Value of the counter."""
+        return sum(shard[0] for shard in self._shards.all())
+
+
+class Histogram(object):
+    """Distribution of observed values."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """Initialize the histogram with the upper bounds of its buckets."""
+        self.buckets = tuple(buckets) + (float("inf"),)
+        self._shards = Shards(lambda: {"counts": [0] * len(self.buckets), "sum": 0.0})
+
+    def observe(self, value):
+        """Record a value."""
+        shard = self._shards.local()
+        shard["counts"][bisect_left(self.buckets, value)] += 1
+        shard["sum"] += value
+
+    def snapshot(self):
+        """Return the number of values in each bucket and their sum."""
+        counts, total = [0] * len(self.buckets), 0.0
+        for shard in self._shards.all():
+            counts = [count + shard_count for count, shard_count in zip(counts, shard["counts"])]
+            total += shard["sum"]
+        return {"buckets": list(self.buckets), "counts": counts, "sum": total}
+
+
+class MetricsRegistry(object):
+    """Metrics of the RPCs served by a process."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        """Initialize the registry with the latency buckets of the RPCs."""
+        self.buckets = buckets
+        self._counters = {}
+        self._methods = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name):
+        """Return a counter, created on first use."""
+        with self._lock:
+            return self._counters.setdefault(name, Counter())
+
+    def method(self, name):
+        """Return the call, error and latency metrics of an RPC method."""
+        with self._lock:
+            if name not in self._methods:
+                self._methods[name] = {
+                    "errors": Counter(),
+                    "latency": Histogram(self.buckets),
+                }
+            return self._methods[name]
+
+    def snapshot(self):
+        """Return the current value of all metrics."""
+        with self._lock:
+            counters, methods = dict(self._counters), dict(self._methods)
+        snapshot = {
+            "counters": {name: counter.value for name, counter in counters.items()},
+            "methods": {},
+        }
+        for name, metrics in methods.items():
+            latency = metrics["latency"].snapshot()
+            snapshot["methods"][name] = dict(
+                latency, count=sum(latency["counts"]), errors=metrics["errors"].value
+            )
+        return snapshot
+
+
+REGISTRY = MetricsRegistry()
+"""Registry of the current process."""
+
+
+def observe_rpc(method):
+    """Record the calls, errors and latency of an RPC method."""
+    metrics = REGISTRY.method(method.__name__)
+
+    # Streamed responses are observed until their last message is sent
+    if inspect.isasyncgenfunction(method):
+
+        @functools.wraps(method)
+        async def wrapper(self, request, context):
+            start = time.perf_counter()
+            try:
+                async for response in method(self, request, context):
+                    yield response
+            except Exception:
+                metrics["errors"].inc()
+                raise
+            finally:
+                metrics["latency"].observe(time.perf_counter() - start)
+
+    elif inspect.isgeneratorfunction(method):
+
+        @functools.wraps(method)
+        def wrapper(self, request, context):
+            start = time.perf_counter()
+            try:
+                yield from method(self, request, context)
+            except Exception:
+                metrics["errors"].inc()
+                raise
+            finally:
+                metrics["latency"].observe(time.perf_counter() - start)
+
+    elif inspect.iscoroutinefunction(method):
+
+        @functools.wraps(method)
+        async def wrapper(self, request, context):
+            start = time.perf_counter()
+            try:
+                return await method(self, request, context)
+            except Exception:
+                metrics["errors"].inc()
+                raise
+            finally:
+                metrics["latency"].observe(time.perf_counter() - start)
+
+    else:
+
+        @functools.wraps(method)
+        def wrapper(self, request, context):
+            start = time.perf_counter()
+            try:
+                return method(self, request, context)
+            except Exception:
+                metrics["errors"].inc()
+                raise
+            finally:
+                metrics["latency"].observe(time.perf_counter() - start)
+
+    return wrapper
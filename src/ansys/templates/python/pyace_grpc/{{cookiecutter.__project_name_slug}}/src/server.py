@@ -7,26 +7,178 @@
 
 {{ cookiecutter.library_name }}
 """
+import argparse
+{%- if cookiecutter.server_model == "asyncio" %}
+import asyncio
+{%- else %}
 from concurrent import futures
+{%- endif %}
+import contextlib
+import multiprocessing
+import os
+import signal
+import socket
+import sys
 
 import grpc
 
 from observability.logger import Logger
 from services.pinger import Pinger
+from services.transfer import DataTransfer
 import stubs.pingserver_pb2_grpc
 
 
-def serve():
+def available_cpus():
+    """Return the number of CPUs the process is allowed to run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def parse_args(args=None):
+    """Parse the server settings.
+
+    Each setting is read from the command line, then from its environment
+    variable.
+    """
+    parser = argparse.ArgumentParser(description="Serve the {{ cookiecutter.project_name }} API.")
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ.get("GRPC_PORT", 50051)),
+        help="Port shared by all the workers (env: GRPC_PORT, default: 50051).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.environ.get("GRPC_WORKERS", available_cpus())),
+        help="Number of server processes (env: GRPC_WORKERS, default: number of usable CPUs).",
+    )
+{%- if cookiecutter.server_model != "asyncio" %}
+    parser.add_argument(
+        "--threads",
+        type=int,
+        default=int(os.environ.get("GRPC_THREADS", 10)),
+        help="Size of the thread pool of each worker (env: GRPC_THREADS, default: 10).",
+    )
+{%- endif %}
+    parser.add_argument(
+        "--max-concurrent-rpcs",
+        type=int,
+        default=int(os.environ.get("GRPC_MAX_CONCURRENT_RPCS", 0)) or None,
+        help="Maximum number of concurrent RPCs of each worker (env: GRPC_MAX_CONCURRENT_RPCS, "
+        "default: unlimited).",
+    )
+    return parser.parse_args(args)
+{% if cookiecutter.server_model == "asyncio" %}
+
+async def serve(port=50051, max_concurrent_rpcs=None, reuse_port=False):
+    """Serve function."""
+    logger = Logger.init(__name__)
+    server = grpc.aio.server(
+        options=[("grpc.so_reuseport", int(reuse_port))],
+        maximum_concurrent_rpcs=max_concurrent_rpcs,
+    )
+    stubs.pingserver_pb2_grpc.add_PingerServicer_to_server(Pinger(), server)
+    stubs.pingserver_pb2_grpc.add_DataTransferServicer_to_server(DataTransfer(), server)
+    logger.info(f"Server starting and listening on {port} (pid {os.getpid()})")
+    server.add_insecure_port(f"[::]:{port}")
+    await server.start()
+    await server.wait_for_termination()
+
+
+def run_worker(port, max_concurrent_rpcs=None, reuse_port=False):
+    """Run a server process."""
+    # Workers are stopped by the launcher and must not inherit its handler
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    asyncio.run(serve(port, max_concurrent_rpcs, reuse_port))
+{%- else %}
+
+def serve(port=50051, threads=10, max_concurrent_rpcs=None, reuse_port=False):
     """Serve function."""
     logger = Logger.init(__name__)
-    port = 50051
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=threads),
+        options=[("grpc.so_reuseport", int(reuse_port))],
+        maximum_concurrent_rpcs=max_concurrent_rpcs,
+    )
     stubs.pingserver_pb2_grpc.add_PingerServicer_to_server(Pinger(), server)
-    logger.info(f"Server starting and listening on {port}")
+    stubs.pingserver_pb2_grpc.add_DataTransferServicer_to_server(DataTransfer(), server)
+    logger.info(f"Server starting and listening on {port} (pid {os.getpid()})")
     server.add_insecure_port(f"[::]:{port}")
     server.start()
     server.wait_for_termination()
 
 
+def run_worker(port, threads=10, max_concurrent_rpcs=None, reuse_port=False):
+    """Run a server process."""
+    # Workers are stopped by the launcher and must not inherit its handler
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    serve(port, threads, max_concurrent_rpcs, reuse_port)
+{%- endif %}
+
+
+@contextlib.contextmanager
+def reserve_port(port):
+    """Reserve a port to be shared by the worker processes.
+
+    The port is reserved on IPv6 or, if IPv6 is not available, on IPv4.
+    """
+    families = [socket.AF_INET6, socket.AF_INET] if socket.has_ipv6 else [socket.AF_INET]
+    for family in families:
+        sock = None
+        try:
+            sock = socket.socket(family, socket.SOCK_STREAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            if sock.getsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT) == 0:
+                raise OSError("Failed to set SO_REUSEPORT.")
+            sock.bind(("", port))
+            break
+        except OSError:
+            if sock is not None:
+                sock.close()
+            if family == families[-1]:
+                raise
+    try:
+        yield sock.getsockname()[1]
+    finally:
+        sock.close()
+
+
+def main(args=None):
+    """Start the worker processes of the server.
+
+    Workers are forked before gRPC starts any thread and all of them listen on
+    the same port, so requests are balanced by the kernel across all cores.
+    """
+    settings = parse_args(args)
+{%- if cookiecutter.server_model == "asyncio" %}
+    worker_args = (settings.max_concurrent_rpcs,)
+{%- else %}
+    worker_args = (settings.threads, settings.max_concurrent_rpcs)
+{%- endif %}
+
+    if settings.workers <= 1 or not hasattr(socket, "SO_REUSEPORT"):
+        run_worker(settings.port, *worker_args)
+        return
+
+    # Stop the workers when the launcher is stopped, e.g. by `docker stop`
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    context = multiprocessing.get_context("fork")
+    with reserve_port(settings.port) as port:
+        workers = [
+            context.Process(target=run_worker, args=(port, *worker_args, True))
+            for _ in range(settings.workers)
+        ]
+        for worker in workers:
+            worker.start()
+        try:
+            for worker in workers:
+                worker.join()
+        finally:
+            for worker in workers:
+                worker.terminate()
+
+
 if __name__ == "__main__":
-    serve()
+    main()
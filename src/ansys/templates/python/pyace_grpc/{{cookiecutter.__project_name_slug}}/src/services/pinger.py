@@ -7,25 +7,50 @@
 
 {{ cookiecutter.library_name }}
 """
-from stubs.pingserver_pb2 import PingReply
-from stubs.pingserver_pb2_grpc import PingerServicer
+import os
 
-NumberPing = 0
+from observability.metrics import REGISTRY, observe_rpc
+from stubs.pingserver_pb2 import MethodStats, PingReply, StatsReply
+from stubs.pingserver_pb2_grpc import PingerServicer
 
 
 class Pinger(PingerServicer):
     """Pinger class."""
 
-    def PingServer(self, request, context):
+    def __init__(self):
+        """Initialize the servicer."""
+        self.pings = REGISTRY.counter("pings")
+
+    @observe_rpc
+    {{ "async " if cookiecutter.server_model == "asyncio" }}def PingServer(self, request, context):
         """Ping the server."""
-        global NumberPing
-        NumberPing += 1
+        self.pings.inc()
         return PingReply(
-            message=f"Hello, the server is healthy and it had been pinged {NumberPing} times!"
+            message=f"Hello, the server is healthy and it had been pinged {self.pings.value} times!"
         )
 
-    def WhoPing(self, request, context):
+    @observe_rpc
+    {{ "async " if cookiecutter.server_model == "asyncio" }}def WhoPing(self, request, context):
         """Check who ping the server."""
-        global NumberPing
-        NumberPing += 1
+        self.pings.inc()
         return PingReply(message=f"Hello, the server is pinged by {request.name}!")
+
+    @observe_rpc
+    {{ "async " if cookiecutter.server_model == "asyncio" }}def GetStats(self, request, context):
+        """Return the metrics of the server process."""
+        snapshot = REGISTRY.snapshot()
+        return StatsReply(
+            pid=os.getpid(),
+            counters=snapshot["counters"],
+            methods=[
+                MethodStats(
+                    method=name,
+                    count=metrics["count"],
+                    errors=metrics["errors"],
+                    latency_sum=metrics["sum"],
+                    latency_buckets=metrics["buckets"],
+                    latency_counts=metrics["counts"],
+                )
+                for name, metrics in sorted(snapshot["methods"].items())
+            ],
+        )
@@ -0,0 +1,52 @@
+{%- if cookiecutter.copyright != "None" -%}
+# Copyright (c) {% now "utc", '%Y' %}, {{ cookiecutter.copyright }}. Unauthorised use, distribution or duplication is prohibited
+{% endif %}
+
+"""
+{{ cookiecutter.project_name }}.
+
+{{ cookiecutter.library_name }}
+"""
+import hashlib
+import os
+
+from observability.metrics import observe_rpc
+from stubs.pingserver_pb2 import Chunk, UploadReply
+from stubs.pingserver_pb2_grpc import DataTransferServicer
+
+CHUNK_SIZE = int(os.environ.get("GRPC_CHUNK_SIZE", 64 * 1024))
+"""Default size of the chunks, in bytes."""
+
+MAX_CHUNK_SIZE = 4 * 1024 * 1024 - 1024
+"""Largest chunk fitting in the default maximum message size of gRPC."""
+
+
+def iter_payload(size, chunk_size=CHUNK_SIZE):
+    """Generate a payload of a given size, one chunk at a time.
+
+    Replace it with the source of the data served by the application, e.g. the
+    arrays of a result file. Only one chunk is held in memory.
+    """
+    block = bytes(range(256)) * (chunk_size // 256 + 1)
+    for offset in range(0, size, chunk_size):
+        yield block[: min(chunk_size, size - offset)]
+
+
+class DataTransfer(DataTransferServicer):
+    """Data transfer class."""
+
+    @observe_rpc
+    {{ "async " if cookiecutter.server_model == "asyncio" }}def Download(self, request, context):
+        """Stream a payload in chunks."""
+        chunk_size = min(request.chunk_size or CHUNK_SIZE, MAX_CHUNK_SIZE)
+        for data in iter_payload(request.size, chunk_size):
+            yield Chunk(data=data)
+
+    @observe_rpc
+    {{ "async " if cookiecutter.server_model == "asyncio" }}def Upload(self, request_iterator, context):
+        """Receive a payload in chunks."""
+        digest, size = hashlib.sha256(), 0
+        {{ "async " if cookiecutter.server_model == "asyncio" }}for chunk in request_iterator:
+            digest.update(chunk.data)
+            size += len(chunk.data)
+        return UploadReply(size=size, sha256=digest.hexdigest())
@@ -6,10 +6,7 @@
 {{ cookiecutter.project_name }}.
 
 {{ cookiecutter.library_name }}
-"""
-
-import os
-from pathlib import Path
-import sys
 
-sys.path.insert(0, os.path.join(Path(os.path.dirname(os.path.realpath(__file__))).parent, "stubs"))
+The modules of this package are compiled from the protobuf files by
+``build_stubs.py``.
+"""
@@ -1,25 +1,73 @@
 {%- if cookiecutter.copyright != "None" -%}
 # Copyright (c) {% now "utc", '%Y' %}, {{ cookiecutter.copyright }}. Unauthorised use, distribution or duplication is prohibited
 {% endif %}
+{%- if cookiecutter.server_model == "asyncio" %}
+import grpc
 import pytest
+import pytest_asyncio
 
 
 @pytest.fixture(scope="module")
 def grpc_add_to_server():
-    from src.stubs.pingserver_pb2_grpc import add_PingerServicer_to_server
+    from stubs.pingserver_pb2_grpc import add_PingerServicer_to_server
 
     return add_PingerServicer_to_server
 
 
 @pytest.fixture(scope="module")
 def grpc_servicer():
-    from src.services.pinger import Pinger
+    from services.pinger import Pinger
+
+    return Pinger()
+
+
+@pytest.fixture(scope="module")
+def grpc_stub_cls():
+    from stubs.pingserver_pb2_grpc import PingerStub
+
+    return PingerStub
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def grpc_server(grpc_add_to_server, grpc_servicer):
+    server = grpc.aio.server()
+    grpc_add_to_server(grpc_servicer, server)
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+    yield f"localhost:{port}"
+    await server.stop(None)
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def grpc_channel(grpc_server):
+    async with grpc.aio.insecure_channel(grpc_server) as channel:
+        yield channel
+
+
+@pytest_asyncio.fixture(scope="module", loop_scope="module")
+async def grpc_stub(grpc_channel, grpc_stub_cls):
+    return grpc_stub_cls(grpc_channel)
+{%- else %}
+import pytest
+
+
+@pytest.fixture(scope="module")
+def grpc_add_to_server():
+    from stubs.pingserver_pb2_grpc import add_PingerServicer_to_server
+
+    return add_PingerServicer_to_server
+
+
+@pytest.fixture(scope="module")
+def grpc_servicer():
+    from services.pinger import Pinger
 
     return Pinger()
 
 
 @pytest.fixture(scope="module")
 def grpc_stub_cls(grpc_channel):
-    from src.stubs.pingserver_pb2_grpc import PingerStub
+    from stubs.pingserver_pb2_grpc import PingerStub
 
     return PingerStub
+{%- endif %}
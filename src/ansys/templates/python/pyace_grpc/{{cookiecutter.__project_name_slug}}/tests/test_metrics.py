@@ -0,0 +1,61 @@
+{%- if cookiecutter.copyright != "None" -%}
+# Copyright (c) {% now "utc", '%Y' %}, {{ cookiecutter.copyright }}. Unauthorised use, distribution or duplication is prohibited
+{% endif %}
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from observability.metrics import REGISTRY, Counter, Histogram, MetricsRegistry, observe_rpc
+
+
+def test_counter_is_thread_safe():
+    counter = Counter()
+
+    def increment():
+        for _ in range(10000):
+            counter.inc()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for _ in range(8):
+            executor.submit(increment)
+    assert counter.value == 80000
+
+
+def test_histogram():
+    histogram = Histogram(buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.7, 3.0):
+        histogram.observe(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot["buckets"] == [0.1, 1.0, float("inf")]
+    assert snapshot["counts"] == [1, 2, 1]
+    assert snapshot["sum"] == pytest.approx(4.25)
+
+
+def test_registry_snapshot():
+    registry = MetricsRegistry()
+    registry.counter("requests").inc(2)
+    registry.method("Ping")["latency"].observe(0.01)
+    registry.method("Ping")["errors"].inc()
+
+    snapshot = registry.snapshot()
+    assert snapshot["counters"] == {"requests": 2}
+    assert snapshot["methods"]["Ping"]["count"] == 1
+    assert snapshot["methods"]["Ping"]["errors"] == 1
+
+
+def test_observe_rpc():
+    class Servicer:
+        @observe_rpc
+        def Echo(self, request, context):
+            if request is None:
+                raise ValueError("Empty request")
+            return request
+
+    assert Servicer().Echo("request", None) == "request"
+    with pytest.raises(ValueError):
+        Servicer().Echo(None, None)
+
+    metrics = REGISTRY.snapshot()["methods"]["Echo"]
+    assert metrics["count"] == 2
+    assert metrics["errors"] == 1
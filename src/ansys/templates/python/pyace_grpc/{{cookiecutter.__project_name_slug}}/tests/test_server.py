@@ -1,9 +1,67 @@
 {%- if cookiecutter.copyright != "None" -%}
 # Copyright (c) {% now "utc", '%Y' %}, {{ cookiecutter.copyright }}. Unauthorised use, distribution or duplication is prohibited
 {% endif %}
+{%- if cookiecutter.server_model == "asyncio" %}
+import asyncio
+import os
+from pathlib import Path
+import socket
+import subprocess
+import sys
+
+import grpc
+import pytest
+
+from server import available_cpus, parse_args, reserve_port
+from stubs.pingserver_pb2 import EmptyRequest, UserRequest
+from stubs.pingserver_pb2_grpc import PingerStub
+
+
+@pytest.mark.smoke
+@pytest.mark.asyncio(loop_scope="module")
+class TestServer:
+    async def test_first_ping(self, grpc_stub):
+        request = EmptyRequest()
+        response = await grpc_stub.PingServer(request)
+        assert response.message == "Hello, the server is healthy and it had been pinged 1 times!"
+
+    async def test_who_ping(self, grpc_stub):
+        request = UserRequest(name="you")
+        response = await grpc_stub.WhoPing(request)
+        assert response.message == f"Hello, the server is pinged by {request.name}!"
+
+    async def test_third_ping(self, grpc_stub):
+        request = EmptyRequest()
+        response = await grpc_stub.PingServer(request)
+        assert response.message == "Hello, the server is healthy and it had been pinged 3 times!"
+
+    async def test_get_stats(self, grpc_stub):
+        response = await grpc_stub.GetStats(EmptyRequest())
+        methods = {stats.method: stats for stats in response.methods}
+        assert response.counters["pings"] == 3
+        assert methods["PingServer"].count == 2
+        assert methods["WhoPing"].count == 1
+        assert sum(methods["WhoPing"].latency_counts) == 1
+
+    async def test_concurrent_pings(self, grpc_stub):
+        requests = [UserRequest(name=f"client-{index}") for index in range(1000)]
+        responses = await asyncio.gather(*(grpc_stub.WhoPing(request) for request in requests))
+        assert [response.message for response in responses] == [
+            f"Hello, the server is pinged by {request.name}!" for request in requests
+        ]
+{%- else %}
+import os
+from pathlib import Path
+import socket
+import subprocess
+import sys
+
+import grpc
 import pytest
 
-from src.stubs.pingserver_pb2 import EmptyRequest, UserRequest
+from server import available_cpus, parse_args, reserve_port
+from stubs.pingserver_pb2 import EmptyRequest, UserRequest
+from stubs.pingserver_pb2_grpc import PingerStub
 
 
 @pytest.mark.smoke
@@ -22,3 +80,68 @@ class TestServer:
         request = EmptyRequest()
         response = grpc_stub.PingServer(request)
         assert response.message == "Hello, the server is healthy and it had been pinged 3 times!"
+
+    def test_get_stats(self, grpc_stub):
+        response = grpc_stub.GetStats(EmptyRequest())
+        methods = {stats.method: stats for stats in response.methods}
+        assert response.counters["pings"] == 3
+        assert methods["PingServer"].count == 2
+        assert methods["WhoPing"].count == 1
+        assert sum(methods["WhoPing"].latency_counts) == 1
+{%- endif %}
+
+
+SRC_PATH = Path(__file__).parents[1] / "src"
+
+
+def test_parse_args(monkeypatch):
+    monkeypatch.setenv("GRPC_PORT", "6000")
+    monkeypatch.setenv("GRPC_WORKERS", "4")
+    settings = parse_args(["--workers", "2", "--max-concurrent-rpcs", "100"])
+    assert settings.port == 6000
+    assert settings.workers == 2
+    assert settings.max_concurrent_rpcs == 100
+
+
+def test_parse_args_defaults_to_available_cpus(monkeypatch):
+    monkeypatch.delenv("GRPC_WORKERS", raising=False)
+    assert parse_args([]).workers == available_cpus()
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT is not available")
+def test_reserve_port_without_ipv6(monkeypatch):
+    create_socket = socket.socket
+
+    def ipv4_socket(family=socket.AF_INET, *args):
+        if family == socket.AF_INET6:
+            raise OSError("Address family not supported by protocol")
+        return create_socket(family, *args)
+
+    monkeypatch.setattr(socket, "socket", ipv4_socket)
+    with reserve_port(0) as port:
+        assert port > 0
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"), reason="SO_REUSEPORT is not available")
+def test_main_with_workers():
+    with socket.socket() as sock:
+        sock.bind(("localhost", 0))
+        port = sock.getsockname()[1]
+    code = f"from server import main; main(['--workers', '2', '--port', '{port}'])"
+    env = dict(os.environ, PYTHONPATH=str(SRC_PATH))
+    launcher = subprocess.Popen([sys.executable, "-c", code], env=env)
+    try:
+        with grpc.insecure_channel(f"localhost:{port}") as channel:
+            grpc.channel_ready_future(channel).result(timeout=30)
+            response = PingerStub(channel).WhoPing(UserRequest(name="you"))
+        assert response.message == "Hello, the server is pinged by you!"
+    finally:
+        launcher.terminate()
+        returncode = launcher.wait(timeout=30)
+    assert returncode == 0
+
+    # The workers stopped with the launcher and no longer listen on the port
+    with socket.socket() as sock:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind(("", port))
+        sock.listen()
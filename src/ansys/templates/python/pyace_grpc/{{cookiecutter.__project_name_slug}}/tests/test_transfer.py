@@ -0,0 +1,182 @@
+{%- if cookiecutter.copyright != "None" -%}
+# Copyright (c) {% now "utc", '%Y' %}, {{ cookiecutter.copyright }}. Unauthorised use, distribution or duplication is prohibited
+{% endif %}
+import contextlib
+import hashlib
+import os
+import threading
+import tracemalloc
+
+import pytest
+
+from client import download, upload
+from services.transfer import iter_payload
+from stubs.pingserver_pb2 import DownloadRequest
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+PAYLOAD_SIZE = 256 * 1024 * 1024
+"""Size of the transferred payloads, in bytes."""
+
+MAX_MEMORY = 16 * 1024 * 1024
+"""Maximum memory allocated by Python while transferring a payload, in bytes."""
+
+MAX_RSS_GROWTH = 64 * 1024 * 1024
+"""Maximum growth of the resident set size while transferring a payload, in bytes."""
+
+RSS_SAMPLING_INTERVAL = 0.01
+"""Time between two readings of the resident set size, in seconds."""
+
+
+class HashingFile:
+    """Binary file hashing its contents instead of storing them."""
+
+    def __init__(self):
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.digest.update(data)
+        self.size += len(data)
+
+
+def current_rss():
+    """Return the current resident set size of the process in bytes, if known."""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        pass
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    return None
+
+
+@contextlib.contextmanager
+def track_memory():
+    """Measure the memory used while transferring a payload.
+
+    tracemalloc only sees the memory allocated by Python, not the buffers of
+    gRPC and protobuf allocated in C. These are covered by the growth of the
+    resident set size of the process, sampled in a thread during the transfer.
+    The peak resident set size reported by the system is not used, as earlier
+    tests may already have reached it. The resident set size is only measured
+    on Linux or if psutil is installed.
+    """
+    usage = {"rss": 0}
+    rss_before = current_rss()
+    stop = threading.Event()
+
+    def sample_rss():
+        while not stop.wait(RSS_SAMPLING_INTERVAL):
+            usage["rss"] = max(usage["rss"], current_rss() - rss_before)
+
+    sampler = threading.Thread(target=sample_rss, daemon=True)
+    if rss_before is not None:
+        sampler.start()
+    tracemalloc.start()
+    try:
+        yield usage
+        usage["python"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+        stop.set()
+        if sampler.is_alive():
+            sampler.join()
+
+
+@pytest.fixture(scope="module")
+def expected_digest():
+    digest = hashlib.sha256()
+    for data in iter_payload(PAYLOAD_SIZE):
+        digest.update(data)
+    return digest.hexdigest()
+
+
+@pytest.fixture(scope="module")
+def grpc_add_to_server():
+    from stubs.pingserver_pb2_grpc import add_DataTransferServicer_to_server
+
+    return add_DataTransferServicer_to_server
+
+
+@pytest.fixture(scope="module")
+def grpc_servicer():
+    from services.transfer import DataTransfer
+
+    return DataTransfer()
+{% if cookiecutter.server_model == "asyncio" %}
+
+@pytest.fixture(scope="module")
+def grpc_stub_cls():
+    from stubs.pingserver_pb2_grpc import DataTransferStub
+
+    return DataTransferStub
+
+
+pytestmark = pytest.mark.asyncio(loop_scope="module")
+
+
+async def test_download_chunks(grpc_stub):
+    request = DownloadRequest(size=2500, chunk_size=1000)
+    sizes = [len(chunk.data) async for chunk in grpc_stub.Download(request)]
+    assert sizes == [1000, 1000, 500]
+
+
+async def test_download_constant_memory(grpc_channel, expected_digest):
+    file = HashingFile()
+    with track_memory() as usage:
+        await download(grpc_channel, PAYLOAD_SIZE, file)
+
+    assert file.size == PAYLOAD_SIZE
+    assert file.digest.hexdigest() == expected_digest
+    assert usage["python"] < MAX_MEMORY
+    assert usage["rss"] < MAX_RSS_GROWTH
+
+
+async def test_upload_constant_memory(grpc_channel, expected_digest):
+    with track_memory() as usage:
+        response = await upload(grpc_channel, iter_payload(PAYLOAD_SIZE))
+
+    assert response.size == PAYLOAD_SIZE
+    assert response.sha256 == expected_digest
+    assert usage["python"] < MAX_MEMORY
+    assert usage["rss"] < MAX_RSS_GROWTH
+{%- else %}
+
+@pytest.fixture(scope="module")
+def grpc_stub_cls(grpc_channel):
+    from stubs.pingserver_pb2_grpc import DataTransferStub
+
+    return DataTransferStub
+
+
+def test_download_chunks(grpc_stub):
+    request = DownloadRequest(size=2500, chunk_size=1000)
+    sizes = [len(chunk.data) for chunk in grpc_stub.Download(request)]
+    assert sizes == [1000, 1000, 500]
+
+
+def test_download_constant_memory(grpc_channel, expected_digest):
+    file = HashingFile()
+    with track_memory() as usage:
+        download(grpc_channel, PAYLOAD_SIZE, file)
+
+    assert file.size == PAYLOAD_SIZE
+    assert file.digest.hexdigest() == expected_digest
+    assert usage["python"] < MAX_MEMORY
+    assert usage["rss"] < MAX_RSS_GROWTH
+
+
+def test_upload_constant_memory(grpc_channel, expected_digest):
+    with track_memory() as usage:
+        response = upload(grpc_channel, iter_payload(PAYLOAD_SIZE))
+
+    assert response.size == PAYLOAD_SIZE
+    assert response.sha256 == expected_digest
+    assert usage["python"] < MAX_MEMORY
+    assert usage["rss"] < MAX_RSS_GROWTH
+{%- endif %}
@@ -0,0 +1,817 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Routines for rendering a staged template into a project."""
+
+import builtins
+from dataclasses import dataclass
+import io
+import json
+import os
+from pathlib import Path
+import shutil
+import sys
+import time
+
+from binaryornot.check import is_binary
+from cookiecutter.config import get_user_config
+from cookiecutter.environment import StrictEnvironment
+from cookiecutter.exceptions import (
+    FailedHookException,
+    InvalidModeException,
+    UndefinedVariableInTemplate,
+)
+from cookiecutter.find import find_template
+from cookiecutter.generate import (
+    ensure_dir_is_templated,
+    generate_context,
+    generate_file,
+    is_copy_only_path,
+    render_and_create_dir,
+)
+from cookiecutter.hooks import find_hook, run_hook, run_script_with_context
+from cookiecutter.prompt import prompt_for_config
+from cookiecutter.replay import dump, load
+from cookiecutter.utils import rmtree, work_in
+from jinja2 import FileSystemBytecodeCache, FileSystemLoader
+from jinja2.exceptions import UndefinedError
+
+from ansys.templates.context import load_variables, resolve_variables, validate_extra_context
+from ansys.templates.manifest import load_manifest, render_plan
+from ansys.templates.profiling import BakeProfile
+
+
+class _CachingEnvironment(StrictEnvironment):
+    """Strict Jinja environment reusing the templates compiled from strings.
+
+    Cookiecutter compiles each file and directory name as a template every
+    time it is rendered. This environment compiles each name only once.
+
+    """
+
+    max_cached_strings = 4096
+    """Maximum number of templates compiled from strings kept in memory."""
+
+    def __init__(self, **kwargs):
+        """Initialize the environment and its cache of compiled strings."""
+        super().__init__(**kwargs)
+        self._compiled_strings = {}
+
+    def from_string(self, source, globals=None, template_class=None):
+        """Load a template from a string, compiling it only once."""
+        if globals is not None or template_class is not None:
+            return super().from_string(source, globals=globals, template_class=template_class)
+
+        template = self._compiled_strings.get(source)
+        if template is None:
+            if len(self._compiled_strings) >= self.max_cached_strings:
+                self._compiled_strings.clear()
+            template = self._compiled_strings[source] = super().from_string(source)
+        return template
+
+
+class RenderingEngine:
+    """Jinja rendering engine reusing the compiled templates across bakes.
+
+    Each template file is parsed and compiled only the first time it is
+    rendered. Compiled templates are kept in memory and invalidated if the
+    modification time of their source changes. Optionally, the compiled
+    bytecode is also stored on disk so it can be reused by other processes.
+
+    Parameters
+    ----------
+    bytecode_cache_dir : ~pathlib.Path, optional
+        Directory where the compiled bytecode is stored. If ``None``, compiled
+        templates are only kept in memory.
+
+    """
+
+    max_environments = 32
+    """Maximum number of template directories whose environment is kept."""
+
+    def __init__(self, bytecode_cache_dir=None):
+        """Initialize the engine."""
+        self._environments = {}
+        self._bytecode_cache = None
+        if bytecode_cache_dir is not None:
+            os.makedirs(bytecode_cache_dir, exist_ok=True)
+            self._bytecode_cache = FileSystemBytecodeCache(str(bytecode_cache_dir))
+
+    def get_environment(self, template_dir, context):
+        """Return the environment for rendering the files of a template.
+
+        Parameters
+        ----------
+        template_dir : ~pathlib.Path
+            Path to the templated project directory of a staged template.
+        context : dict
+            Cookiecutter context.
+
+        Returns
+        -------
+        jinja2.Environment
+            Environment holding the compiled templates.
+
+        """
+        template_dir = os.path.abspath(template_dir)
+        envvars = context["cookiecutter"].get("_jinja2_env_vars", {})
+        key = (
+            template_dir,
+            json.dumps(context["cookiecutter"].get("_extensions", [])),
+            json.dumps(envvars, sort_keys=True),
+        )
+
+        env = self._environments.get(key)
+        if env is None:
+            # Templates are looked up by absolute path, so files from
+            # different templates sharing the same name never collide
+            env = _CachingEnvironment(
+                context=context,
+                keep_trailing_newline=True,
+                loader=FileSystemLoader(
+                    [template_dir, os.path.join(os.path.dirname(template_dir), "templates")]
+                ),
+                bytecode_cache=self._bytecode_cache,
+                **envvars,
+            )
+            if len(self._environments) >= self.max_environments:
+                # Forget the oldest environment, e.g. one of a removed overlay
+                self._environments.pop(next(iter(self._environments)))
+            self._environments[key] = env
+
+        return env
+
+
+def generate_template_context(
+    repo_dir,
+    output_dir=".",
+    no_input=False,
+    extra_context=None,
+    replay=None,
+    config_file=None,
+    default_config=False,
+    dump_replay=True,
+):
+    """Generate the cookiecutter context of a staged template.
+
+    This mimics the context resolution performed by cookiecutter, prompting the
+    user for the values of the variables unless ``no_input`` is ``True``. Values
+    given in ``extra_context`` are validated first and, without input, the
+    variables are resolved by :func:`ansys.templates.context.resolve_variables`.
+
+    Parameters
+    ----------
+    repo_dir : ~pathlib.Path
+        Path to the staged template.
+    output_dir : ~pathlib.Path, optional
+        Directory where the project is rendered.
+    no_input : bool, optional
+        Do not prompt for user input.
+    extra_context : dict, optional
+        Variables overriding the default values.
+    replay : bool or str, optional
+        Read the values of the variables from a replay file instead of
+        prompting the user.
+    config_file : str, optional
+        Path to the cookiecutter user configuration file.
+    default_config : bool, optional
+        Use default values rather than a configuration file.
+    dump_replay : bool, optional
+        Save the values of the variables in the replay directory.
+
+    Returns
+    -------
+    dict
+        Cookiecutter context.
+
+    Raises
+    ------
+    ansys.templates.context.InvalidContextError
+        If values given in ``extra_context`` are not valid for the template.
+
+    """
+    if replay and (no_input or extra_context is not None):
+        raise InvalidModeException(
+            "You can not use both replay and no_input or extra_context at the same time."
+        )
+
+    config_dict = get_user_config(config_file=config_file, default_config=default_config)
+    template_name = os.path.basename(os.path.abspath(repo_dir))
+    context_file = os.path.join(repo_dir, "cookiecutter.json")
+    if extra_context and not replay:
+        validate_extra_context(load_variables(context_file), extra_context)
+
+    context = generate_context(
+        context_file=context_file,
+        default_context=config_dict["default_context"],
+        extra_context=None if replay else extra_context,
+    )
+    context["_cookiecutter"] = {
+        key: value for key, value in context["cookiecutter"].items() if not key.startswith("_")
+    }
+
+    if replay:
+        if isinstance(replay, bool):
+            replay_context = load(config_dict["replay_dir"], template_name)
+        else:
+            replay_path, replay_name = os.path.split(os.path.splitext(replay)[0])
+            replay_context = load(replay_path, replay_name)
+        context_for_prompting = {
+            "cookiecutter": {
+                key: value
+                for key, value in context["cookiecutter"].items()
+                if key not in replay_context["cookiecutter"]
+            }
+        }
+    else:
+        context_for_prompting = context
+
+    if context_for_prompting["cookiecutter"]:
+        if no_input:
+            context["cookiecutter"].update(resolve_variables(context_for_prompting))
+        else:
+            context["cookiecutter"].update(prompt_for_config(context_for_prompting, no_input))
+
+    context["cookiecutter"]["_template"] = str(repo_dir)
+    context["cookiecutter"]["_output_dir"] = os.path.abspath(output_dir)
+    context["cookiecutter"]["_repo_dir"] = str(repo_dir)
+    if dump_replay:
+        dump(config_dict["replay_dir"], template_name, context)
+
+    return context
+
+
+def _generate_planned_file(project_dir, infile, context, env, plan, skip_if_file_exists):
+    """Render a file of a staged template if it is part of the render plan.
+
+    Parameters
+    ----------
+    project_dir : str
+        Absolute path to the rendered project.
+    infile : str
+        Path to the file relative to the template directory.
+    context : dict
+        Cookiecutter context.
+    env : jinja2.Environment
+        Environment used for rendering.
+    plan : RenderPlan or None
+        Files to be rendered. If ``None``, all files are rendered.
+    skip_if_file_exists : bool
+        Skip the file if it already exists in the project directory.
+
+    Returns
+    -------
+    bool
+        ``True`` if the file is part of the render plan.
+
+    """
+    outfile = env.from_string(infile).render(**context)
+    if plan is not None:
+        if not plan.includes(outfile):
+            return False
+        # Directories are only created if any of their files is rendered
+        os.makedirs(os.path.join(project_dir, os.path.dirname(outfile)), exist_ok=True)
+
+    if is_copy_only_path(infile, context):
+        shutil.copyfile(infile, os.path.join(project_dir, outfile))
+        shutil.copymode(infile, os.path.join(project_dir, outfile))
+    else:
+        generate_file(project_dir, infile, context, env, skip_if_file_exists)
+    return True
+
+
+@dataclass(frozen=True)
+class RenderedFile:
+    """File of a project rendered in memory.
+
+    Parameters
+    ----------
+    path : str
+        POSIX path to the file relative to the output directory, including the
+        project directory.
+    mode : int
+        Permission bits of the file.
+    data : bytes, optional
+        Contents of the rendered file. ``None`` for files copied as they are.
+    source_path : str, optional
+        Path to the staged file copied as it is. Its contents are only read
+        when required, so large binary files are never fully loaded.
+
+    """
+
+    path: str
+    mode: int
+    data: bytes = None
+    source_path: str = None
+
+    @property
+    def size(self):
+        """Size of the file in bytes."""
+        if self.data is not None:
+            return len(self.data)
+        return os.stat(self.source_path).st_size
+
+    def open(self):
+        """Open the contents of the file for reading in binary mode.
+
+        Returns
+        -------
+        io.BufferedIOBase
+            Readable binary file object.
+
+        """
+        if self.data is not None:
+            return io.BytesIO(self.data)
+        return open(self.source_path, "rb")
+
+
+def _render_file(template_dir, infile, outfile, context, env):
+    """Render a file of a staged template in memory.
+
+    This mirrors :func:`cookiecutter.generate.generate_file`. Binary files and
+    files not to be rendered are not read.
+
+    Parameters
+    ----------
+    template_dir : str
+        Path to the templated project directory of the staged template.
+    infile : str
+        Path to the file relative to the template directory.
+    outfile : str
+        POSIX path to the rendered file relative to the output directory.
+    context : dict
+        Cookiecutter context.
+    env : jinja2.Environment
+        Environment used for rendering.
+
+    Returns
+    -------
+    RenderedFile
+        Rendered file.
+
+    """
+    source_path = os.path.join(template_dir, infile)
+    mode = os.stat(source_path).st_mode & 0o7777
+    if is_copy_only_path(infile, context) or is_binary(source_path):
+        return RenderedFile(outfile, mode, source_path=source_path)
+
+    rendered_file = env.get_template(infile.replace(os.path.sep, "/")).render(**context)
+    newline = context["cookiecutter"].get("_new_lines", False)
+    if not newline:
+        with open(source_path, encoding="utf-8") as text_file:
+            text_file.readline()
+        newline = text_file.newlines or os.linesep
+    return RenderedFile(outfile, mode, data=rendered_file.replace("\n", newline).encode("utf-8"))
+
+
+def _copy_only_parent(infile, context):
+    """Return the outermost directory of a file that is not to be rendered.
+
+    Parameters
+    ----------
+    infile : str
+        Path to the file relative to the template directory.
+    context : dict
+        Cookiecutter context.
+
+    Returns
+    -------
+    str or None
+        Path to the directory relative to the template directory. ``None`` if
+        all the directories of the file are rendered.
+
+    """
+    parent = ""
+    for part in Path(infile).parent.parts:
+        parent = os.path.join(parent, part)
+        if is_copy_only_path(parent, context):
+            return parent
+    return None
+
+
+def iter_rendered_files(repo_dir, context, engine=None):
+    """Render the files of a staged template in memory.
+
+    Only the files listed in the manifest of the template, if any, are
+    rendered, under their final name. Nothing is written to disk and the
+    hooks of the template are not executed.
+
+    Parameters
+    ----------
+    repo_dir : ~pathlib.Path
+        Path to the staged template.
+    context : dict
+        Cookiecutter context.
+    engine : RenderingEngine, optional
+        Engine reusing the compiled templates across bakes. If ``None``, all
+        templates are compiled again.
+
+    Yields
+    ------
+    RenderedFile
+        Each file of the project, as soon as it is rendered.
+
+    Raises
+    ------
+    UndefinedVariableInTemplate
+        If a path or a file uses an undefined variable.
+
+    """
+    template_dir = os.path.abspath(find_template(repo_dir))
+    unrendered_dir = os.path.basename(template_dir)
+    ensure_dir_is_templated(unrendered_dir)
+
+    env = (engine or RenderingEngine()).get_environment(template_dir, context)
+    manifest = load_manifest(repo_dir)
+    plan = render_plan(manifest, context, env) if manifest else None
+    renames = plan.renames if plan is not None else {}
+
+    try:
+        project_dir = env.from_string(unrendered_dir).render(**context)
+    except UndefinedError as err:
+        msg = f"Unable to create project directory '{unrendered_dir}'"
+        raise UndefinedVariableInTemplate(msg, err, context) from err
+
+    for root, dirs, files in os.walk(template_dir):
+        dirs.sort()
+        for file in sorted(files):
+            infile = os.path.relpath(os.path.join(root, file), template_dir)
+            try:
+                parent = _copy_only_parent(infile, context)
+                if parent is not None:
+                    # Directories not to be rendered are copied as they are
+                    outdir = env.from_string(parent).render(**context)
+                    outfile = os.path.join(outdir, os.path.relpath(infile, parent))
+                else:
+                    outfile = env.from_string(infile).render(**context)
+                    if not os.path.basename(outfile):
+                        continue
+                    if plan is not None and not plan.includes(outfile):
+                        continue
+                outfile = Path(outfile).as_posix()
+                outfile = Path(project_dir, renames.get(outfile, outfile)).as_posix()
+                rendered_file = _render_file(template_dir, infile, outfile, context, env)
+            except UndefinedError as err:
+                msg = f"Unable to create file '{infile}'"
+                raise UndefinedVariableInTemplate(msg, err, context) from err
+
+            yield rendered_file
+
+
+def _rename_files(renames, project_dir):
+    """Move rendered files to their final location.
+
+    Parameters
+    ----------
+    renames : dict
+        Original and final names of the files, relative to the project.
+    project_dir : str
+        Absolute path to the rendered project.
+
+    """
+    project_path = Path(project_dir)
+    for source, target in renames.items():
+        source_path, target_path = project_path / source, project_path / target
+        if not source_path.is_file():
+            continue
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(source_path, target_path)
+
+        # Remove the directories left empty
+        for parent in source_path.parents:
+            if parent == project_path or any(parent.iterdir()):
+                break
+            parent.rmdir()
+
+
+def _exec_hook_script(script_path, project_dir, context, env):
+    """Execute a Python hook script in the current interpreter.
+
+    The script is rendered with Jinja and executed as the ``__main__`` module
+    from the project directory, like cookiecutter does in a subprocess. Modules
+    imported by the script, e.g. ``isort``, are thus imported only once.
+
+    Parameters
+    ----------
+    script_path : str
+        Absolute path to the hook script.
+    project_dir : ~pathlib.Path
+        Directory from which the hook is executed.
+    context : dict
+        Cookiecutter context.
+    env : jinja2.Environment
+        Environment rendering the hook script.
+
+    Raises
+    ------
+    FailedHookException
+        If the script raises an exception or exits with a non-zero status.
+
+    """
+    with open(script_path, encoding="utf-8") as script_file:
+        source = env.from_string(script_file.read()).render(**context)
+    code = compile(source, script_path, "exec")
+    namespace = {"__name__": "__main__", "__file__": script_path, "__builtins__": builtins}
+
+    argv, path = sys.argv, list(sys.path)
+    sys.argv = [script_path]
+    sys.path.insert(0, os.path.dirname(script_path))
+    try:
+        with work_in(project_dir):
+            exec(code, namespace)
+    except SystemExit as err:
+        if err.code not in (None, 0):
+            raise FailedHookException(f"Hook script failed (exit status: {err.code})") from err
+    except Exception as err:
+        raise FailedHookException(f"Hook script failed (error: {err!r})") from err
+    finally:
+        sys.argv, sys.path[:] = argv, path
+
+
+def _run_hook(
+    repo_dir, hook_name, project_dir, context, delete_project_on_failure, env=None, in_process=True
+):
+    """Run a hook of a staged template.
+
+    Parameters
+    ----------
+    repo_dir : ~pathlib.Path
+        Path to the staged template.
+    hook_name : str
+        Name of the hook to execute.
+    project_dir : ~pathlib.Path
+        Directory from which the hook is executed.
+    context : dict
+        Cookiecutter context.
+    delete_project_on_failure : bool
+        Remove the project directory if the hook fails.
+    env : jinja2.Environment, optional
+        Environment rendering the hook scripts.
+    in_process : bool, optional
+        Execute Python hook scripts in the current interpreter instead of a
+        subprocess. Other scripts always run in a subprocess.
+
+    """
+    with work_in(repo_dir):
+        try:
+            if not in_process:
+                run_hook(hook_name, project_dir, context)
+                return
+
+            for script_path in find_hook(hook_name) or []:
+                if script_path.endswith(".py"):
+                    if env is None:
+                        env = StrictEnvironment(context=context, keep_trailing_newline=True)
+                    _exec_hook_script(script_path, project_dir, context, env)
+                else:
+                    run_script_with_context(script_path, project_dir, context)
+        except (FailedHookException, UndefinedError):
+            if delete_project_on_failure:
+                rmtree(project_dir)
+            raise
+
+
+def generate_files(
+    repo_dir,
+    context,
+    output_dir=".",
+    overwrite_if_exists=False,
+    skip_if_file_exists=False,
+    accept_hooks=True,
+    keep_project_on_failure=False,
+    engine=None,
+    profile=None,
+    hooks_in_process=True,
+):
+    """Render the files of a staged template.
+
+    Unlike :func:`cookiecutter.generate.generate_files`, only the files listed
+    in the manifest of the template, if any, are rendered. Files to be renamed
+    are moved to their final location before the post-generation hook runs.
+
+    Parameters
+    ----------
+    repo_dir : ~pathlib.Path
+        Path to the staged template.
+    context : dict
+        Cookiecutter context.
+    output_dir : ~pathlib.Path, optional
+        Directory where the project is rendered.
+    overwrite_if_exists : bool, optional
+        Overwrite the contents of the project directory if it exists.
+    skip_if_file_exists : bool, optional
+        Skip the files that already exist in the project directory.
+    accept_hooks : bool, optional
+        Execute the pre and post generation hooks.
+    keep_project_on_failure : bool, optional
+        Keep the project directory if rendering fails.
+    engine : RenderingEngine, optional
+        Engine reusing the compiled templates across bakes. If ``None``, all
+        templates are compiled again.
+    profile : ~ansys.templates.profiling.BakeProfile, optional
+        Profile recording the time spent rendering each file and running the
+        hooks.
+    hooks_in_process : bool, optional
+        Execute the Python hooks in the current interpreter rather than in a
+        subprocess. These hooks temporarily change the working directory of
+        the whole process, so they must not run concurrently in threads.
+
+    Returns
+    -------
+    str
+        Path to the rendered project.
+
+    """
+    profile = profile if profile is not None else BakeProfile()
+    with profile.phase("render"):
+        return _generate_files(
+            repo_dir,
+            context,
+            output_dir,
+            overwrite_if_exists,
+            skip_if_file_exists,
+            accept_hooks,
+            keep_project_on_failure,
+            engine,
+            profile,
+            hooks_in_process,
+        )
+
+
+def _generate_files(
+    repo_dir,
+    context,
+    output_dir,
+    overwrite_if_exists,
+    skip_if_file_exists,
+    accept_hooks,
+    keep_project_on_failure,
+    engine,
+    profile,
+    hooks_in_process,
+):
+    """Render the files of a staged template, see :func:`generate_files`."""
+    template_dir = find_template(repo_dir)
+    unrendered_dir = os.path.split(template_dir)[1]
+    ensure_dir_is_templated(unrendered_dir)
+
+    env = (engine or RenderingEngine()).get_environment(template_dir, context)
+
+    manifest = load_manifest(repo_dir)
+    plan = render_plan(manifest, context, env) if manifest else None
+
+    try:
+        project_dir, output_directory_created = render_and_create_dir(
+            unrendered_dir, context, output_dir, env, overwrite_if_exists
+        )
+    except UndefinedError as err:
+        msg = f"Unable to create project directory '{unrendered_dir}'"
+        raise UndefinedVariableInTemplate(msg, err, context) from err
+
+    project_dir = os.path.abspath(project_dir)
+    delete_project_on_failure = output_directory_created and not keep_project_on_failure
+
+    if accept_hooks:
+        with profile.phase("hooks"):
+            _run_hook(
+                repo_dir,
+                "pre_gen_project",
+                project_dir,
+                context,
+                delete_project_on_failure,
+                env,
+                hooks_in_process,
+            )
+
+    with work_in(template_dir):
+        for root, dirs, files in os.walk("."):
+            for directory in list(dirs):
+                indir = os.path.normpath(os.path.join(root, directory))
+                if is_copy_only_path(indir, context):
+                    dirs.remove(directory)
+                    outdir = env.from_string(os.path.join(project_dir, indir)).render(**context)
+                    if os.path.isdir(outdir):
+                        shutil.rmtree(outdir)
+                    shutil.copytree(indir, outdir)
+                elif plan is None:
+                    # Without a plan, all directories are created even if empty
+                    unrendered_dir = os.path.join(project_dir, root, directory)
+                    try:
+                        render_and_create_dir(
+                            unrendered_dir, context, output_dir, env, overwrite_if_exists
+                        )
+                    except UndefinedError as err:
+                        if delete_project_on_failure:
+                            rmtree(project_dir)
+                        _dir = os.path.relpath(unrendered_dir, output_dir)
+                        msg = f"Unable to create directory '{_dir}'"
+                        raise UndefinedVariableInTemplate(msg, err, context) from err
+
+            for file in files:
+                infile = os.path.normpath(os.path.join(root, file))
+                start = time.perf_counter()
+                try:
+                    rendered = _generate_planned_file(
+                        project_dir, infile, context, env, plan, skip_if_file_exists
+                    )
+                except UndefinedError as err:
+                    if delete_project_on_failure:
+                        rmtree(project_dir)
+                    msg = f"Unable to create file '{infile}'"
+                    raise UndefinedVariableInTemplate(msg, err, context) from err
+                if rendered:
+                    profile.record_file(Path(infile).as_posix(), time.perf_counter() - start)
+
+    if plan is not None:
+        _rename_files(plan.renames, project_dir)
+
+    if accept_hooks:
+        with profile.phase("hooks"):
+            _run_hook(
+                repo_dir,
+                "post_gen_project",
+                project_dir,
+                context,
+                delete_project_on_failure,
+                env,
+                hooks_in_process,
+            )
+
+    return project_dir
+
+
+def render_staged_template(
+    repo_dir,
+    output_dir=".",
+    no_input=False,
+    extra_context=None,
+    replay=None,
+    config_file=None,
+    default_config=False,
+    profile=None,
+    **generate_kwargs,
+):
+    """Render a staged template into a project.
+
+    Parameters
+    ----------
+    repo_dir : ~pathlib.Path
+        Path to the staged template.
+    output_dir : ~pathlib.Path, optional
+        Directory where the project is rendered.
+    no_input : bool, optional
+        Do not prompt for user input.
+    extra_context : dict, optional
+        Variables overriding the default values.
+    replay : bool or str, optional
+        Read the values of the variables from a replay file.
+    config_file : str, optional
+        Path to the cookiecutter user configuration file.
+    default_config : bool, optional
+        Use default values rather than a configuration file.
+    profile : ~ansys.templates.profiling.BakeProfile, optional
+        Profile recording the time spent in each phase of rendering.
+    **generate_kwargs : dict
+        Additional keyword arguments for :func:`generate_files`, including the
+        rendering ``engine``.
+
+    Returns
+    -------
+    str
+        Path to the rendered project.
+
+    """
+    profile = profile if profile is not None else BakeProfile()
+    with profile.phase("context"):
+        context = generate_template_context(
+            repo_dir,
+            output_dir=output_dir,
+            no_input=no_input,
+            extra_context=extra_context,
+            replay=replay,
+            config_file=config_file,
+            default_config=default_config,
+        )
+    return generate_files(
+        repo_dir, context, output_dir=output_dir, profile=profile, **generate_kwargs
+    )
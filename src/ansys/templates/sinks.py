@@ -0,0 +1,269 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Destinations of the files of a project rendered in memory.
+
+A sink receives the files yielded by
+:func:`~ansys.templates.rendering.iter_rendered_files` one at a time, so a
+project can be written straight into an archive, or to the standard output,
+without an intermediate directory. Contents are copied in chunks, so memory
+use does not depend on the size of the project or of its binary files.
+"""
+
+import abc
+import os
+from pathlib import Path
+import shutil
+import sys
+import tarfile
+import time
+import zipfile
+
+CHUNK_SIZE = 1024 * 1024
+"""Size in bytes of the chunks copied into a sink."""
+
+SINK_FORMATS = ("dir", "tar.gz", "zip")
+"""Formats of the available sinks."""
+
+
+class OutputSink(abc.ABC):
+    """Destination of the files of a rendered project.
+
+    Sinks are context managers. Files are written with :meth:`write` and the
+    sink is finalized when the context exits. If an exception is raised in
+    the context, the sink is aborted instead.
+
+    """
+
+    @abc.abstractmethod
+    def write(self, rendered_file):
+        """Write a file into the sink.
+
+        Parameters
+        ----------
+        rendered_file : ~ansys.templates.rendering.RenderedFile
+            File to be written.
+
+        """
+
+    def close(self):
+        """Finalize the sink."""
+
+    def abort(self):
+        """Discard the sink after a failure, without finalizing it."""
+
+    def __enter__(self):
+        """Enter the context of the sink."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Finalize the sink, or abort it on error, when leaving its context."""
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class DirectorySink(OutputSink):
+    """Sink writing the files into a directory.
+
+    Parameters
+    ----------
+    path : str or ~pathlib.Path
+        Output directory.
+
+    """
+
+    def __init__(self, path):
+        """Initialize the sink."""
+        self.path = Path(path)
+
+    def write(self, rendered_file):
+        """Write a file into the directory."""
+        output_path = self.path / rendered_file.path
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with rendered_file.open() as source, open(output_path, "wb") as target:
+            shutil.copyfileobj(source, target, CHUNK_SIZE)
+        os.chmod(output_path, rendered_file.mode)
+
+
+class _StreamSink(OutputSink):
+    """Sink writing an archive into a file or a binary stream.
+
+    Parameters
+    ----------
+    target : str, ~pathlib.Path or io.BufferedIOBase
+        Path to the archive or writable binary stream. Streams are not closed
+        with the sink.
+
+    """
+
+    def __init__(self, target):
+        """Open the target of the sink."""
+        self._owns_stream = isinstance(target, (str, os.PathLike))
+        self.stream = open(target, "wb") if self._owns_stream else target
+        self.mtime = time.time()
+
+    def close(self):
+        """Flush the target and close it if it was opened by the sink."""
+        if self._owns_stream:
+            self.stream.close()
+        else:
+            self.stream.flush()
+
+    def abort(self):
+        """Close the target and remove it if it was opened by the sink.
+
+        An incomplete archive written into a stream not owned by the sink is
+        left as it is.
+
+        """
+        if self._owns_stream:
+            self.stream.close()
+            os.remove(self.stream.name)
+
+
+class TarSink(_StreamSink):
+    """Sink writing the files into a gzip-compressed tar archive.
+
+    The archive is written as a stream, so the target does not need to be
+    seekable.
+
+    Parameters
+    ----------
+    target : str, ~pathlib.Path or io.BufferedIOBase
+        Path to the archive or writable binary stream.
+
+    """
+
+    def __init__(self, target):
+        """Start the archive."""
+        super().__init__(target)
+        self.archive = tarfile.open(fileobj=self.stream, mode="w|gz", bufsize=CHUNK_SIZE)
+
+    def write(self, rendered_file):
+        """Add a file to the archive."""
+        info = tarfile.TarInfo(rendered_file.path)
+        info.size = rendered_file.size
+        info.mode = rendered_file.mode
+        info.mtime = self.mtime
+        with rendered_file.open() as source:
+            self.archive.addfile(info, source)
+
+    def close(self):
+        """Finish the archive."""
+        self.archive.close()
+        super().close()
+
+    def abort(self):
+        """Discard the archive without finishing it."""
+        # Keep the archive from being finished when garbage collected
+        self.archive.closed = self.archive.fileobj.closed = True
+        super().abort()
+
+
+class ZipSink(_StreamSink):
+    """Sink writing the files into a zip archive.
+
+    Non-seekable targets, like the standard output, are supported.
+
+    Parameters
+    ----------
+    target : str, ~pathlib.Path or io.BufferedIOBase
+        Path to the archive or writable binary stream.
+
+    """
+
+    def __init__(self, target):
+        """Start the archive."""
+        super().__init__(target)
+        self.archive = zipfile.ZipFile(self.stream, "w", compression=zipfile.ZIP_DEFLATED)
+
+    def write(self, rendered_file):
+        """Add a file to the archive."""
+        info = zipfile.ZipInfo(rendered_file.path, time.localtime(self.mtime)[:6])
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = (0o100000 | rendered_file.mode) << 16
+        with rendered_file.open() as source:
+            with self.archive.open(info, "w", force_zip64=True) as target:
+                shutil.copyfileobj(source, target, CHUNK_SIZE)
+
+    def close(self):
+        """Finish the archive."""
+        self.archive.close()
+        super().close()
+
+    def abort(self):
+        """Discard the archive without finishing it."""
+        # Keep the archive from being finished when garbage collected
+        self.archive.fp = None
+        super().abort()
+
+
+def open_sink(target, sink_format=None):
+    """Open the sink for a given target.
+
+    Parameters
+    ----------
+    target : str or ~pathlib.Path
+        Output directory, path to an archive or ``"-"`` for the standard
+        output.
+    sink_format : str, optional
+        One of :data:`SINK_FORMATS`. Default is inferred from the extension of
+        the target: ``.tar.gz`` or ``.tgz`` for tar archives, ``.zip`` for zip
+        archives and a directory otherwise. The standard output defaults to a
+        tar archive.
+
+    Returns
+    -------
+    OutputSink
+        Sink writing into the target.
+
+    Raises
+    ------
+    ValueError
+        If the format is unknown or a directory is requested on the standard
+        output.
+
+    """
+    target_name = str(target)
+    if sink_format is None:
+        if target_name == "-" or target_name.endswith((".tar.gz", ".tgz")):
+            sink_format = "tar.gz"
+        elif target_name.endswith(".zip"):
+            sink_format = "zip"
+        else:
+            sink_format = "dir"
+
+    if sink_format not in SINK_FORMATS:
+        raise ValueError(f"Unknown output format '{sink_format}'.")
+    if target_name == "-":
+        if sink_format == "dir":
+            raise ValueError("A directory can not be written to the standard output.")
+        target = sys.stdout.buffer
+
+    if sink_format == "tar.gz":
+        return TarSink(target)
+    if sink_format == "zip":
+        return ZipSink(target)
+    return DirectorySink(target)
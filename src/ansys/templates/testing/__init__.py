@@ -0,0 +1,185 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""A collection of routines focused on testing."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from ansys.templates.utils import bake_template
+
+
+def assert_template_baking_process(template_path, output_path, cookiecutter_vars):
+    """
+    Assert if template renders properly.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the project template.
+    output_path : ~pathlib.Path
+        Path to the output baked project.
+    cookiecutter_vars : dict
+        A dictionary holding cookiecutter variables and their values.
+
+    """
+    bake_template(
+        template_path,
+        output_path,
+        overwrite_if_exists=True,
+        no_input=True,
+        extra_context=cookiecutter_vars,
+    )
+
+
+def assert_file_in_baked_project(file, project_path):
+    """
+    Assert if file is exists inside desired output path.
+
+    Parameters
+    ----------
+    file : str
+        Expected file path relative to the output project path.
+    project_path : ~pathlib.Path
+        Path to the output project path.
+    """
+    assert (project_path.joinpath(file)).is_file()
+
+
+def assert_files_in_baked_project(files_list, project_path):
+    """
+    Assert if given files exists inside desired output path.
+
+    Parameters
+    ----------
+    files_list : list
+        A list of expected files path relative to the output project path.
+    project_path : ~pathlib.Path
+        Path to the output project path.
+    """
+    for file in files_list:
+        assert_file_in_baked_project(file, project_path)
+
+
+def project_fingerprints(project_path):
+    """Compute the fingerprint of each file in a project.
+
+    Parameters
+    ----------
+    project_path : ~pathlib.Path
+        Path to the output project path.
+
+    Returns
+    -------
+    dict
+        SHA-256 hash of each file, indexed by its POSIX path relative to the
+        output project path.
+
+    """
+    fingerprints = {}
+    for root, _, files in os.walk(project_path):
+        for file in files:
+            filepath = Path(root, file)
+            fingerprints[filepath.relative_to(project_path).as_posix()] = hashlib.sha256(
+                filepath.read_bytes()
+            ).hexdigest()
+    return fingerprints
+
+
+def assert_project_structure(expected_structure, project_path, expected_fingerprints=None):
+    """Assert if project has desired structure.
+
+    If any additional files are encountered in the rendered project, it will
+    raise an AssertionError. Only the added, missing and changed files are
+    reported.
+
+    Parameters
+    ----------
+    expected_structure : list
+        A list of expected files path relative to the output project path.
+    project_path : ~pathlib.Path
+        Path to the output project path.
+    expected_fingerprints : dict, optional
+        Expected SHA-256 hash of some files, indexed by their POSIX path
+        relative to the output project path. See :func:`project_fingerprints`.
+
+    """
+    # Paths are compared using the POSIX flavor
+    expected_structure = {file.replace("\\", "/") for file in expected_structure}
+    current_structure = {
+        filepath.relative_to(project_path).as_posix()
+        for root, _, files in os.walk(project_path)
+        for filepath in (Path(root, file) for file in files)
+    }
+
+    changed_files = set()
+    if expected_fingerprints:
+        current_fingerprints = {
+            file: hashlib.sha256((Path(project_path) / file).read_bytes()).hexdigest()
+            for file in current_structure & set(expected_fingerprints)
+        }
+        changed_files = {
+            file
+            for file, fingerprint in current_fingerprints.items()
+            if fingerprint != expected_fingerprints[file]
+        }
+
+    differences = [
+        ("Missing", expected_structure - current_structure),
+        ("Added", current_structure - expected_structure),
+        ("Changed", changed_files),
+    ]
+    if any(files for _, files in differences):
+        msg = f"Project {project_path} does not have the expected structure\n"
+        for label, files in differences:
+            msg += "".join(f"\n{label}: {file}" for file in sorted(files))
+        raise AssertionError(msg)
+
+
+def assert_project_snapshot(snapshot_path, project_path, update=False):
+    """Assert if project matches a snapshot of its files and their fingerprints.
+
+    Parameters
+    ----------
+    snapshot_path : ~pathlib.Path
+        Path to the JSON file holding the fingerprint of each file. See
+        :func:`project_fingerprints`.
+    project_path : ~pathlib.Path
+        Path to the output project path.
+    update : bool, optional
+        Write the snapshot from the project instead of asserting.
+
+    """
+    snapshot_path = Path(snapshot_path)
+    if update:
+        snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        fingerprints = dict(sorted(project_fingerprints(project_path).items()))
+        snapshot_path.write_text(json.dumps(fingerprints, indent=2) + "\n", encoding="utf-8")
+        return
+
+    if not snapshot_path.is_file():
+        raise AssertionError(f"Snapshot {snapshot_path} does not exist")
+
+    expected_fingerprints = json.loads(snapshot_path.read_text(encoding="utf-8"))
+    assert_project_structure(list(expected_fingerprints), project_path, expected_fingerprints)
@@ -0,0 +1,259 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Pytest plugin baking the projects required by a test session at once.
+
+Enable the plugin from a ``conftest.py`` file with:
+
+.. code-block:: python
+
+    pytest_plugins = ["ansys.templates.testing.plugin"]
+
+Tests request a baked project by indirectly parametrizing the
+``baked_project`` fixture with the name of a template and the values of its
+variables:
+
+.. code-block:: python
+
+    @pytest.mark.parametrize(
+        "baked_project", [("pybasic", {"project_name": "pybasic"})], indirect=True
+    )
+    def test_pybasic(baked_project):
+        assert (baked_project.path / "README.rst").is_file()
+
+All the projects requested by the collected tests are baked in parallel the
+first time one of them is needed. Projects are shared between tests, so their
+files are read-only. The path to the project used by each test is written to
+``baked_projects.json`` in the base temporary directory, indexed by the node ID
+of the test.
+
+The ``project_snapshot`` fixture compares a project with the snapshot of the
+test, stored in the ``snapshots`` directory next to the test file. Run pytest
+with ``--update-snapshots`` to write the snapshots.
+"""
+
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import platform
+import stat
+import sys
+
+import pytest
+
+from ansys.templates.testing import assert_project_snapshot
+from ansys.templates.utils import bake_templates
+
+_BAKE_REQUESTS = pytest.StashKey[dict]()
+_USED_PROJECTS = pytest.StashKey[dict]()
+
+BAKED_PROJECTS_INDEX = "baked_projects.json"
+"""Name of the file recording the project used by each test."""
+
+
+@dataclass(frozen=True)
+class BakedProject:
+    """Project baked for a test session.
+
+    Parameters
+    ----------
+    template : str
+        Name of the template.
+    extra_context : dict
+        Values of the template variables.
+    path : ~pathlib.Path
+        Path to the baked project. Its files must not be modified.
+
+    """
+
+    template: str
+    extra_context: dict
+    path: Path
+
+
+def _bake_key(param):
+    """Return a hashable key identifying a requested project."""
+    template, extra_context = param
+    return json.dumps([template, extra_context], sort_keys=True)
+
+
+def _make_read_only(path):
+    """Remove the write permission of all the files in a directory."""
+    write_bits = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+    for root, _, files in os.walk(path):
+        for file in files:
+            filepath = os.path.join(root, file)
+            os.chmod(filepath, os.stat(filepath).st_mode & ~write_bits)
+
+
+def _is_skipped(item):
+    """Return whether a test is skipped by its ``skip`` or ``skipif`` marks.
+
+    Conditions given as strings are evaluated in the same namespace as pytest
+    does. Invalid conditions are reported by pytest when running the test, so
+    they are ignored here.
+    """
+    if any(True for _ in item.iter_markers("skip")):
+        return True
+
+    for mark in item.iter_markers("skipif"):
+        conditions = mark.args or ([mark.kwargs["condition"]] if "condition" in mark.kwargs else [])
+        if not conditions:
+            return True
+        for condition in conditions:
+            try:
+                if isinstance(condition, str):
+                    namespace = {"os": os, "sys": sys, "platform": platform, "config": item.config}
+                    for extra_namespace in item.ihook.pytest_markeval_namespace(config=item.config):
+                        namespace.update(extra_namespace)
+                    if hasattr(item, "obj"):
+                        namespace.update(item.obj.__globals__)
+                    condition = eval(compile(condition, "<skipif condition>", "eval"), namespace)
+                if condition:
+                    return True
+            except Exception:
+                continue
+    return False
+
+
+def pytest_addoption(parser):
+    """Add the options of the plugin."""
+    group = parser.getgroup("ansys-templates")
+    group.addoption(
+        "--bake-workers",
+        type=int,
+        default=None,
+        help="Maximum number of processes baking projects. Default is the number of CPUs.",
+    )
+    group.addoption(
+        "--update-snapshots",
+        action="store_true",
+        default=False,
+        help="Write the snapshots of the projects instead of comparing them.",
+    )
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_collection_modifyitems(config, items):
+    """Collect the projects requested by the selected tests."""
+    requests = {}
+    for item in items:
+        callspec = getattr(item, "callspec", None)
+        if callspec is None or "baked_project" not in callspec.params:
+            continue
+        if _is_skipped(item):
+            continue
+        requests.setdefault(
+            _bake_key(callspec.params["baked_project"]), callspec.params["baked_project"]
+        )
+    config.stash[_BAKE_REQUESTS] = requests
+
+
+def _bake(requests, output_path, max_workers):
+    """Bake various projects in parallel.
+
+    Parameters
+    ----------
+    requests : dict
+        Template name and variables of each project, indexed by their key.
+    output_path : ~pathlib.Path
+        Directory where projects are baked.
+    max_workers : int or None
+        Maximum number of worker processes.
+
+    Returns
+    -------
+    dict
+        Outcome of baking each project, indexed by its key.
+
+    """
+    jobs = [
+        {
+            "template": template,
+            "output_dir": str(output_path / str(index)),
+            "extra_context": context,
+        }
+        for index, (template, context) in enumerate(requests.values())
+    ]
+    results = dict(zip(requests, bake_templates(jobs, max_workers=max_workers)))
+    for result in results.values():
+        if result.succeeded:
+            _make_read_only(result.project_dir)
+    return results
+
+
+@pytest.fixture(scope="session")
+def baked_projects(request, tmp_path_factory):
+    """Bake all the projects requested by the collected tests."""
+    return _bake(
+        request.config.stash.get(_BAKE_REQUESTS, {}),
+        tmp_path_factory.mktemp("baked_projects"),
+        request.config.getoption("bake_workers"),
+    )
+
+
+@pytest.fixture
+def baked_project(request, baked_projects, tmp_path_factory):
+    """Return the baked project requested by the test."""
+    if not hasattr(request, "param"):
+        raise pytest.UsageError(
+            "The baked_project fixture must be indirectly parametrized with the name of a "
+            "template and the values of its variables."
+        )
+
+    key = _bake_key(request.param)
+    if key not in baked_projects:
+        # Projects requested outside of collection, e.g. dynamically, are baked on demand
+        baked_projects.update(
+            _bake({key: request.param}, tmp_path_factory.mktemp("baked_project"), 1)
+        )
+
+    result = baked_projects[key]
+    if not result.succeeded:
+        pytest.fail(f"Baking template '{result.template}' failed: {result.error}")
+
+    # Record the project of the test, e.g. to publish it once tests pass
+    used_projects = request.config.stash.setdefault(_USED_PROJECTS, {})
+    used_projects[request.node.nodeid] = str(result.project_dir)
+    index_path = tmp_path_factory.getbasetemp() / BAKED_PROJECTS_INDEX
+    index_path.write_text(json.dumps(used_projects, indent=2, sort_keys=True), encoding="utf-8")
+
+    template, extra_context = request.param
+    return BakedProject(template, extra_context, Path(result.project_dir))
+
+
+@pytest.fixture
+def project_snapshot(request):
+    """Return a function asserting if a project matches the snapshot of the test."""
+    snapshot_path = request.path.parent / "snapshots" / f"{request.node.name}.json"
+    update = request.config.getoption("update_snapshots")
+
+    def assert_snapshot(project_path):
+        if not update and not snapshot_path.is_file():
+            pytest.fail(
+                f"Snapshot {snapshot_path} does not exist, run pytest with --update-snapshots."
+            )
+        assert_project_snapshot(snapshot_path, project_path, update=update)
+
+    return assert_snapshot
@@ -0,0 +1,397 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Incremental updates of baked projects.
+
+Projects baked with ``ansys-templates new --record`` hold a record of their
+template, the values of the template variables and the hash of the contents
+and permission bits of each generated file.
+Updating a project renders its template again away from the project and
+compares, for each file, the recorded, the current and the rendered contents.
+Only the files changed in the template but not in the project are written.
+Files changed in both are reported as conflicts and left untouched.
+"""
+
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+
+import ansys.templates
+from ansys.templates.licenses import MIT_LICENSE
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.profiling import BakeProfile
+from ansys.templates.rendering import generate_files, generate_template_context
+from ansys.templates.utils import staged_template
+
+RECORD_FILENAME = ".ansys-templates.json"
+"""Name of the file recording how a project was baked."""
+
+
+@dataclass
+class UpdateReport:
+    """Outcome of updating a project.
+
+    Parameters
+    ----------
+    added : list
+        Files added by the template.
+    updated : list
+        Files rewritten because their contents changed in the template.
+    removed : list
+        Files removed because they are no longer part of the template.
+    kept : list
+        Files changed in the project only, which are kept as they are.
+    unchanged : list
+        Files whose contents did not change.
+    conflicts : dict
+        Reason of the conflict for each file changed both in the project and
+        in the template. These files are not modified.
+
+    """
+
+    added: list = field(default_factory=list)
+    updated: list = field(default_factory=list)
+    removed: list = field(default_factory=list)
+    kept: list = field(default_factory=list)
+    unchanged: list = field(default_factory=list)
+    conflicts: dict = field(default_factory=dict)
+
+
+def _hash(data, mode):
+    """Return the SHA-256 hash of some contents and their permission bits."""
+    file_hash = hashlib.sha256(f"{mode & 0o7777:o}\0".encode("ascii"))
+    file_hash.update(data)
+    return file_hash.hexdigest()
+
+
+def _hash_file(path):
+    """Return the SHA-256 hash of a file and its permission bits, if it exists."""
+    return _hash(path.read_bytes(), path.stat().st_mode) if path.is_file() else None
+
+
+def render_project(
+    template,
+    no_input=True,
+    extra_context=None,
+    license_path=MIT_LICENSE,
+    bundle_path=None,
+    profile=None,
+):
+    """Render a project in memory.
+
+    The project is rendered in a temporary directory, so the hooks of the
+    template run as usual, and its files are then read back.
+
+    Parameters
+    ----------
+    template : str
+        Name of the template.
+    no_input : bool, optional
+        Do not prompt for the values of the template variables.
+    extra_context : dict, optional
+        Values of the template variables overriding the default ones.
+    license_path : ~pathlib.Path, optional
+        Path to license file. Default is MIT.
+    bundle_path : ~pathlib.Path, optional
+        Path to a bundle of the template.
+    profile : ~ansys.templates.profiling.BakeProfile, optional
+        Profile recording the time spent in each phase of rendering.
+
+    Returns
+    -------
+    str
+        Path to the project directory relative to the output directory.
+    dict
+        Values of the public template variables.
+    dict
+        Contents and permission bits of each file, indexed by its POSIX path
+        relative to the project directory.
+
+    Raises
+    ------
+    ValueError
+        If the template is unknown.
+
+    """
+    if template not in TEMPLATE_PATH_FINDER or template == "common":
+        raise ValueError(f"Unknown template '{template}'.")
+
+    profile = profile if profile is not None else BakeProfile()
+    with ExitStack() as stack:
+        with profile.phase("staging"):
+            staged_path = stack.enter_context(
+                staged_template(
+                    TEMPLATE_PATH_FINDER[template], license_path, bundle_path=bundle_path
+                )
+            )
+        output_dir = stack.enter_context(tempfile.TemporaryDirectory())
+
+        with profile.phase("context"):
+            context = generate_template_context(
+                staged_path, output_dir=output_dir, no_input=no_input, extra_context=extra_context
+            )
+        project_dir = Path(
+            generate_files(
+                staged_path,
+                context,
+                output_dir=output_dir,
+                overwrite_if_exists=True,
+                profile=profile,
+            )
+        )
+        # Templates may render the project in the output directory itself
+        project_name = os.path.relpath(project_dir, output_dir)
+
+        files = {}
+        with profile.phase("collect"):
+            for root, _, filenames in os.walk(project_dir):
+                for filename in filenames:
+                    filepath = Path(root, filename)
+                    files[filepath.relative_to(project_dir).as_posix()] = (
+                        filepath.read_bytes(),
+                        filepath.stat().st_mode & 0o7777,
+                    )
+
+    variables = {
+        name: value for name, value in context["cookiecutter"].items() if not name.startswith("_")
+    }
+    return project_name, variables, files
+
+
+def read_record(project_path):
+    """Read the record of a baked project.
+
+    Parameters
+    ----------
+    project_path : ~pathlib.Path
+        Path to the project.
+
+    Returns
+    -------
+    dict or None
+        Record of the project. ``None`` if the project has no record.
+
+    """
+    record_path = Path(project_path) / RECORD_FILENAME
+    if not record_path.is_file():
+        return None
+    with open(record_path, "r", encoding="utf-8") as record_file:
+        return json.load(record_file)
+
+
+def write_record(project_path, template, variables, hashes):
+    """Write the record of a baked project, if it changed.
+
+    Parameters
+    ----------
+    project_path : ~pathlib.Path
+        Path to the project.
+    template : str
+        Name of the template.
+    variables : dict
+        Values of the public template variables.
+    hashes : dict
+        Hash of the contents and permission bits of each file generated by
+        the template.
+
+    """
+    record = {
+        "template": template,
+        "version": ansys.templates.__version__,
+        "context": variables,
+        "files": dict(sorted(hashes.items())),
+    }
+    contents = json.dumps(record, indent=2) + "\n"
+
+    record_path = Path(project_path) / RECORD_FILENAME
+    if not record_path.is_file() or record_path.read_text(encoding="utf-8") != contents:
+        record_path.write_text(contents, encoding="utf-8")
+
+
+def _write_file(path, data, mode):
+    """Write a file and set its permission bits."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    os.chmod(path, mode)
+
+
+def bake_project(
+    template,
+    output_path,
+    no_input=False,
+    extra_context=None,
+    license_path=MIT_LICENSE,
+    bundle_path=None,
+    profile=None,
+    record=True,
+):
+    """Bake a project and record how it was baked.
+
+    Existing files are overwritten only if their contents or permission bits
+    differ.
+
+    Parameters
+    ----------
+    template : str
+        Name of the template.
+    output_path : ~pathlib.Path
+        Output path for the baked project.
+    no_input : bool, optional
+        Do not prompt for the values of the template variables.
+    extra_context : dict, optional
+        Values of the template variables overriding the default ones.
+    license_path : ~pathlib.Path, optional
+        Path to license file. Default is MIT.
+    bundle_path : ~pathlib.Path, optional
+        Path to a bundle of the template.
+    profile : ~ansys.templates.profiling.BakeProfile, optional
+        Profile recording the time spent in each phase of the bake.
+    record : bool, optional
+        Write the record needed to update the project later. Default is
+        ``True``.
+
+    Returns
+    -------
+    ~pathlib.Path
+        Path to the baked project.
+
+    """
+    profile = profile if profile is not None else BakeProfile()
+    with profile.measure():
+        project_name, variables, files = render_project(
+            template, no_input, extra_context, license_path, bundle_path, profile
+        )
+        project_path = Path(output_path) / project_name
+
+        with profile.phase("write"):
+            hashes = {}
+            for name, (data, mode) in files.items():
+                hashes[name] = _hash(data, mode)
+                if _hash_file(project_path / name) != hashes[name]:
+                    _write_file(project_path / name, data, mode)
+
+            if record:
+                write_record(project_path, template, variables, hashes)
+    return project_path
+
+
+def update_project(
+    project_path, template=None, extra_context=None, license_path=MIT_LICENSE, bundle_path=None
+):
+    """Update a project to the installed version of its template.
+
+    Parameters
+    ----------
+    project_path : ~pathlib.Path
+        Path to the project.
+    template : str, optional
+        Name of the template. Default is the recorded one. Projects without a
+        record are rendered prompting for the values of the template variables.
+    extra_context : dict, optional
+        Values of the template variables overriding the recorded ones.
+    license_path : ~pathlib.Path, optional
+        Path to license file. Default is MIT.
+    bundle_path : ~pathlib.Path, optional
+        Path to a bundle of the template.
+
+    Returns
+    -------
+    UpdateReport
+        Files modified in the project and conflicts found.
+
+    Raises
+    ------
+    ValueError
+        If the project has no record and no template is given.
+
+    """
+    project_path = Path(project_path)
+    record = read_record(project_path)
+    if record is None and template is None:
+        raise ValueError(f"Project '{project_path}' has no record, a template must be given.")
+
+    variables = dict(record["context"]) if record else {}
+    variables.update(extra_context or {})
+    _, variables, files = render_project(
+        template or record["template"],
+        no_input=record is not None,
+        extra_context=variables,
+        license_path=license_path,
+        bundle_path=bundle_path,
+    )
+
+    base_hashes = record["files"] if record else {}
+    hashes = {}
+    report = UpdateReport()
+    for name, (data, mode) in sorted(files.items()):
+        path = project_path / name
+        base_hash, current_hash, new_hash = (
+            base_hashes.get(name),
+            _hash_file(path),
+            _hash(data, mode),
+        )
+
+        if current_hash == new_hash:
+            report.unchanged.append(name)
+        elif current_hash == base_hash:
+            _write_file(path, data, mode)
+            (report.updated if current_hash else report.added).append(name)
+        elif base_hash == new_hash:
+            report.kept.append(name)
+        elif base_hash is None:
+            report.conflicts[name] = "not generated by the template before"
+        elif current_hash is None:
+            report.conflicts[name] = "deleted in the project, changed in the template"
+        else:
+            report.conflicts[name] = "changed both in the project and in the template"
+
+        # Conflicts keep the previous hash until they are solved
+        hashes[name] = new_hash if name not in report.conflicts else base_hash
+
+    for name, base_hash in sorted(base_hashes.items()):
+        path = project_path / name
+        if name in files or not path.is_file():
+            continue
+        if _hash_file(path) == base_hash:
+            path.unlink()
+            report.removed.append(name)
+            # Remove the directories left empty
+            for parent in path.parents:
+                if parent == project_path or any(parent.iterdir()):
+                    break
+                parent.rmdir()
+        else:
+            report.conflicts[name] = "changed in the project, removed from the template"
+            hashes[name] = base_hash
+
+    write_record(
+        project_path,
+        template or record["template"],
+        variables,
+        {name: file_hash for name, file_hash in hashes.items() if file_hash is not None},
+    )
+    return report
@@ -21,19 +21,157 @@
 # SOFTWARE.
 
 """A collection of useful utilities and routines."""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass
+from functools import partial
+import hashlib
+import json
 import os
 from pathlib import Path
 import shutil
+import sys
 import tempfile
+import time
+import traceback
 
-from cookiecutter.main import cookiecutter
+from cookiecutter.find import find_template
 
+from ansys.templates.bundle import extract_bundle, find_bundle, read_bundle_index
+from ansys.templates.cache import bundle_staging_key, get_staged_template, staging_key
 from ansys.templates.licenses import MIT_LICENSE
+from ansys.templates.manifest import load_manifest, render_plan
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.profiling import BakeProfile
+from ansys.templates.rendering import (
+    RenderedFile,
+    RenderingEngine,
+    generate_template_context,
+    iter_rendered_files,
+    render_staged_template,
+)
+from ansys.templates.sinks import CHUNK_SIZE
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover
+    # Not available on Windows
+    fcntl = None
+
+# Request code of the ioctl cloning a file, only known on Linux
+_FICLONE = 0x40049409 if sys.platform.startswith("linux") else None
+
+
+def _link_file(input_path, output_path):
+    """
+    Link a file into an overlay directory instead of copying it.
+
+    A symbolic link is created when the platform allows it. Otherwise, the
+    file is copied as a fallback. Any existing entry in the destination is
+    replaced, which allows upper layers to override lower ones.
+
+    Parameters
+    ----------
+    input_path : ~pathlib.Path
+        Path of the source file to be linked.
+    output_path : ~pathlib.Path
+        Path of the destination link.
+
+    """
+    # Never write through a previously created link: this would modify the
+    # source file of a lower layer
+    if os.path.lexists(output_path):
+        os.unlink(output_path)
+
+    try:
+        os.symlink(os.path.abspath(input_path), output_path)
+    except (OSError, NotImplementedError):
+        # Symbolic links may require special privileges, e.g. on Windows
+        shutil.copy2(input_path, output_path)
+
+
+def _clone_file(input_file, output_file):
+    """
+    Clone the contents of a file using the fastest system call available.
+
+    A copy-on-write clone is requested first. The kernel is then asked to copy
+    the data by itself, which avoids moving it through user space and allows
+    network filesystems to copy server side.
+
+    Parameters
+    ----------
+    input_file : io.BufferedReader
+        Source file opened in binary mode.
+    output_file : io.BufferedWriter
+        Destination file opened in binary mode.
+
+    Raises
+    ------
+    OSError
+        If none of the system calls is supported for these files.
+
+    """
+    if fcntl is not None and _FICLONE is not None:
+        try:
+            fcntl.ioctl(output_file.fileno(), _FICLONE, input_file.fileno())
+            return
+        except OSError:
+            pass
+
+    if not hasattr(os, "copy_file_range"):
+        raise OSError("Copying file ranges is not supported in this platform.")
+
+    size = os.fstat(input_file.fileno()).st_size
+    copied = 0
+    while copied < size:
+        count = os.copy_file_range(input_file.fileno(), output_file.fileno(), size - copied)
+        if not count:
+            break
+        copied += count
+
+    if copied != size:
+        # Some filesystems report no data to be copied, copy it through user space
+        input_file.seek(0)
+        output_file.seek(0)
+        output_file.truncate()
+        shutil.copyfileobj(input_file, output_file)
+
+
+def _copy_file(input_path, output_path):
+    """
+    Copy a file together with its permission bits and timestamps.
+
+    This function behaves like :func:`shutil.copy2` but relies on reflinks or
+    on ``copy_file_range`` when the platform supports them. Any existing entry
+    in the destination is replaced rather than written through, so a link
+    created by a lower layer never modifies its source file.
+
+    Parameters
+    ----------
+    input_path : ~pathlib.Path
+        Path of the source file to be copied.
+    output_path : ~pathlib.Path
+        Path of the destination file.
 
-def _copytree(input_path, output_path):
     """
-    Recursively copy all the contents of a directory into desired one.
+    if os.path.lexists(output_path):
+        os.unlink(output_path)
+
+    try:
+        with open(input_path, "rb") as input_file, open(output_path, "wb") as output_file:
+            _clone_file(input_file, output_file)
+    except OSError:
+        shutil.copyfile(input_path, output_path)
+
+    shutil.copystat(input_path, output_path)
+
+
+def _copytree(input_path, output_path, copy_function=_copy_file, max_workers=None):
+    """
+    Copy all the contents of a directory into desired one.
+
+    The source tree is walked once to create all the destination directories.
+    Files are then copied concurrently by a bounded pool of threads.
 
     Parameters
     ----------
@@ -41,29 +179,39 @@ def _copytree(input_path, output_path):
         Path of the source directory to be copied.
     output_path : ~pathlib.Path
         Path of the destination directory.
+    copy_function : callable, optional
+        Function used for copying each one of the files. Default copies the
+        contents, the permission bits and the timestamps of each file.
+    max_workers : int, optional
+        Maximum number of threads copying files. Default is the one of
+        :class:`concurrent.futures.ThreadPoolExecutor`.
 
     """
-    # Create output directory if it does not exist and ensure permission bits
-    if not os.path.exists(output_path):
-        os.makedirs(output_path)
-        shutil.copystat(input_path, output_path)
+    files = []
+    pending_dirs = [(os.fspath(input_path), os.fspath(output_path))]
+    while pending_dirs:
+        source_dir, dest_dir = pending_dirs.pop()
 
-    # Get all file directories from the input directory
-    files_list = os.listdir(input_path)
+        # Create output directory if it does not exist and ensure permission bits
+        if not os.path.exists(dest_dir):
+            os.makedirs(dest_dir)
+            shutil.copystat(source_dir, dest_dir)
 
-    for file in files_list:
-        # Create source and destination file paths
-        source_path = os.path.join(input_path, file)
-        dest_path = os.path.join(output_path, file)
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                dest_path = os.path.join(dest_dir, entry.name)
+                if entry.is_dir():
+                    pending_dirs.append((entry.path, dest_path))
+                else:
+                    files.append((entry.path, dest_path))
 
-        # Recursion is used in case a directory is found
-        if os.path.isdir(source_path):
-            _copytree(source_path, dest_path)
-        else:
-            shutil.copy2(source_path, dest_path)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(copy_function, *paths) for paths in files]
+        for future in futures:
+            future.result()
 
 
-def _copy_common_template_files(common_path, project_path):
+def _copy_common_template_files(common_path, project_path, copy_function=_copy_file):
     """
     Copy common template files into desired project directory.
 
@@ -73,15 +221,18 @@ def _copy_common_template_files(common_path, project_path):
         Path to the common template directory.
     project_path : ~pathlib.Path
         Path to the baked project directory.
+    copy_function : callable, optional
+        Function used for copying each one of the files.
 
     """
     _copytree(
         common_path / "{{cookiecutter.__project_name_slug}}",
         project_path / "{{cookiecutter.__project_name_slug}}",
+        copy_function=copy_function,
     )
 
 
-def _copy_all_template_files(template_path, project_path):
+def _copy_all_template_files(template_path, project_path, copy_function=_copy_file):
     """
     Copy all template files including cookiecutter.json and hooks/ directory.
 
@@ -91,15 +242,18 @@ def _copy_all_template_files(template_path, project_path):
         Path to the template directory.
     project_path : ~pathlib.Path
         Path to the baked project directory.
+    copy_function : callable, optional
+        Function used for copying each one of the files.
 
     """
     _copytree(
         template_path,
         project_path,
+        copy_function=copy_function,
     )
 
 
-def _include_license(license_path, project_path):
+def _include_license(license_path, project_path, copy_function=shutil.copyfile):
     """
     Include a desired license into the baked project.
 
@@ -109,71 +263,186 @@ def _include_license(license_path, project_path):
         Path to the license template.
     project_path : ~pathlib.Path
         Path to the baked project directory.
+    copy_function : callable, optional
+        Function used for copying the license file.
 
     Notes
     -----
     This function is intended to be used during the pre_gen_project.py hook.
 
     """
-    shutil.copyfile(license_path, project_path / "{{cookiecutter.__project_name_slug}}/LICENSE")
+    copy_function(license_path, project_path / "{{cookiecutter.__project_name_slug}}/LICENSE")
+
+
+def _overlay_template(template_path, license_path, overlay_path):
+    """
+    Layer the common files, the template files and the license into a directory.
+
+    Files are linked rather than copied. Layers are applied from bottom to top,
+    so a template file overrides a common file with the same relative path.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template.
+    license_path : ~pathlib.Path
+        Path to the license template.
+    overlay_path : ~pathlib.Path
+        Path to the directory holding the layered view of the template.
+
+    """
+    # The common directory can be obtained from the template path
+    common_path = template_path / "../common"
+
+    _copy_common_template_files(common_path, overlay_path, copy_function=_link_file)
+    _copy_all_template_files(template_path, overlay_path, copy_function=_link_file)
+    _include_license(license_path, overlay_path, copy_function=_link_file)
+
+
+def _stage_template(template_path, license_path, staging_path):
+    """
+    Copy the common files, the template files and the license into a directory.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template.
+    license_path : ~pathlib.Path
+        Path to the license template.
+    staging_path : ~pathlib.Path
+        Path to the directory holding the staged template.
+
+    """
+    # The common directory can be obtained from the template path
+    common_path = template_path / "../common"
+
+    _copy_common_template_files(common_path, staging_path)
+    _copy_all_template_files(template_path, staging_path)
+    _include_license(license_path, staging_path)
 
 
-def remove_file(filename, project_path=Path(os.getcwd())):
+def _stage_bundle(bundle_path, license_path, staging_path):
+    """
+    Extract a template bundle and the license into a directory.
+
+    Parameters
+    ----------
+    bundle_path : ~pathlib.Path
+        Path to the template bundle.
+    license_path : ~pathlib.Path
+        Path to the license template.
+    staging_path : ~pathlib.Path
+        Path to the directory holding the staged template.
+
+    """
+    extract_bundle(bundle_path, staging_path)
+    _include_license(license_path, staging_path)
+
+
+def remove_file(filename, project_path=None):
     """Remove desired file being given its relative path to project.
 
     Parameters
     ----------
     filename : str
         Filename relative to project root directory.
-    project_path : Path
-        Project's root directory.
+    project_path : ~pathlib.Path, optional
+        Project's root directory. Default is the current working directory.
 
     """
+    project_path = Path.cwd() if project_path is None else Path(project_path)
     filepath = project_path / filename
     filepath.unlink()
 
 
-def keep_files(files_list, project_path=Path(os.getcwd())):
+def _prune_tree(path, relative_path, desired_files, desired_dirs):
+    """Remove all the undesired entries of a directory in a single pass.
+
+    Parameters
+    ----------
+    path : str
+        Path to the directory.
+    relative_path : str
+        Path to the directory relative to the project's root directory.
+    desired_files : set
+        Desired paths relative to the project's root directory.
+    desired_dirs : set
+        Directories containing any desired path, relative to the project's root
+        directory.
+
+    Returns
+    -------
+    bool
+        ``True`` if the directory is empty after removing undesired entries.
+
+    """
+    is_empty = True
+    with os.scandir(path) as entries:
+        for entry in entries:
+            entry_path = os.path.join(relative_path, entry.name) if relative_path else entry.name
+
+            if entry.is_dir(follow_symlinks=False):
+                if entry_path in desired_dirs or entry_path in desired_files:
+                    is_dir_empty = _prune_tree(entry.path, entry_path, desired_files, desired_dirs)
+                    if is_dir_empty and entry_path not in desired_files:
+                        os.rmdir(entry.path)
+                        continue
+                else:
+                    # None of the paths in this directory is desired
+                    shutil.rmtree(entry.path)
+                    continue
+            elif entry_path not in desired_files:
+                os.unlink(entry.path)
+                continue
+
+            is_empty = False
+
+    return is_empty
+
+
+def keep_files(files_list, project_path=None):
     """Remove undesired files except given ones from project.
 
     Parameters
     ----------
     files_list : list
         Desired file names relative to project's root directory.
-    project_path : Path
-        Project's root directory.
+    project_path : ~pathlib.Path, optional
+        Project's root directory. Default is the current working directory.
 
-    """
-    # Collect all the files in the project
-    all_project_files = project_path.glob("**/*")
+    Notes
+    -----
+    The project is walked only once. Directories not containing any desired
+    file are removed as a whole, without visiting their contents.
 
+    """
+    project_path = Path.cwd() if project_path is None else Path(project_path)
     # Fix path name according to OS flavor
-    separator, new_separator = ("/", "\\") if os.name != "posix" else ("/", "/")
-    desired_files = [file.replace(separator, new_separator) for file in files_list]
-
-    folders = []
-    # Removing undesired files
-    for file in all_project_files:
-        if str(file.relative_to(project_path)).replace(separator, new_separator) not in desired_files:
-            file.unlink() if file.is_file() else folders.append(file)
+    desired_files = {os.path.normpath(file) for file in files_list}
 
-    folders = sorted(folders, reverse=True)
+    # Collect all the directories leading to a desired file
+    desired_dirs = set()
+    for file in desired_files:
+        parent = os.path.dirname(file)
+        while parent and parent not in desired_dirs:
+            desired_dirs.add(parent)
+            parent = os.path.dirname(parent)
 
-    # Removing undesired empty folders
-    [folder.rmdir() for folder in folders if not os.listdir(str(folder))]
+    _prune_tree(str(project_path), "", desired_files, desired_dirs)
 
 
-def rename_files(files_list: list[tuple[str, str]], project_path=Path(os.getcwd())):
+def rename_files(files_list: list[tuple[str, str]], project_path=None):
     """Rename files in the project.
 
     Parameters
     ----------
     files_list : list
         List of tuples containing the original and new file names.
-    project_path : Path
-        Project's root directory.
+    project_path : ~pathlib.Path, optional
+        Project's root directory. Default is the current working directory.
 
     """
+    project_path = (Path.cwd() if project_path is None else Path(project_path)).absolute()
     for old_name, new_name in files_list:
         old_file = (project_path / old_name).absolute()
         new_file = (project_path / new_name).absolute()
@@ -185,7 +454,451 @@ def rename_files(files_list: list[tuple[str, str]], project_path=Path(os.getcwd(
             if not os.listdir(parent):
                 parent.rmdir()
 
-def bake_template(template_path, output_path, license_path=MIT_LICENSE, **cookiecutter_kwargs):
+
+_ISORT_CONFIGS = {}
+"""isort configurations indexed by line length, profile and hash of the settings files."""
+
+_SORTED_IMPORTS_HASHES = {}
+"""Hashes of the Python sources whose imports are known to be sorted, indexed by configuration."""
+
+MAX_SORTED_IMPORTS_HASHES = 4096
+"""Maximum number of hashes of sorted Python sources kept for each isort configuration."""
+
+MAX_SORTED_IMPORTS_CONFIGS = 32
+"""Maximum number of isort configurations whose sorted Python sources are remembered."""
+
+
+def _isort_config(line_length, profile, settings_path=None):
+    """Return the isort configuration for a given line length and profile.
+
+    Building an isort configuration looks for settings files in the file
+    system, so configurations are built only once and then reused by all the
+    projects with the same settings files.
+
+    Parameters
+    ----------
+    line_length : int
+        Maximum length of the lines.
+    profile : str
+        Name of the isort profile.
+    settings_path : ~pathlib.Path, optional
+        Project's root directory, whose isort settings files are honored. The
+        line length and profile take precedence over these settings.
+
+    Returns
+    -------
+    tuple
+        Configuration and key identifying it.
+
+    """
+    import isort
+
+    settings_hasher = hashlib.sha256()
+    if settings_path is not None:
+        settings_path = Path(settings_path).resolve()
+        for name in isort.settings.CONFIG_SOURCES:
+            if (settings_path / name).is_file():
+                settings_hasher.update(name.encode("utf-8") + b"\0")
+                settings_hasher.update((settings_path / name).read_bytes())
+    key = (line_length, profile, settings_hasher.hexdigest())
+
+    if key not in _ISORT_CONFIGS:
+        if key[2] == hashlib.sha256().hexdigest():
+            # Without settings files, no project directory needs to be searched
+            settings_path = None
+        _ISORT_CONFIGS[key] = isort.settings.Config(
+            settings_path=str(settings_path or ""), line_length=line_length, profile=profile
+        )
+    config = _ISORT_CONFIGS[key]
+
+    # Source paths are relative to the project the configuration was built for
+    directory = Path(config.directory)
+    if settings_path is not None and directory != settings_path:
+        src_paths = frozenset(
+            settings_path / path.relative_to(directory) if path.is_relative_to(directory) else path
+            for path in config.src_paths
+        )
+        config = isort.settings.Config(
+            config=config, directory=str(settings_path), src_paths=src_paths
+        )
+    return config, key
+
+
+def sort_imports(filepaths, line_length=100, profile="black", settings_path=None):
+    """Sort the imports of various Python files in a single pass.
+
+    The isort configuration is built only once for each line length, profile
+    and settings. Files whose contents were already sorted with the same
+    configuration and source paths by the current process are skipped without
+    being parsed.
+
+    Parameters
+    ----------
+    filepaths : list
+        Paths to the Python files.
+    line_length : int or str, optional
+        Maximum length of the lines. Default is 100.
+    profile : str, optional
+        Name of the isort profile. Default is ``"black"``.
+    settings_path : ~pathlib.Path, optional
+        Project's root directory, whose isort settings files are honored.
+
+    Returns
+    -------
+    list
+        Paths to the files whose imports were sorted.
+
+    """
+    import isort
+
+    config, key = _isort_config(int(line_length), profile, settings_path)
+    # First party modules are found in the source paths, which differ between projects
+    key = (*key, config.src_paths)
+    if (
+        key not in _SORTED_IMPORTS_HASHES
+        and len(_SORTED_IMPORTS_HASHES) >= MAX_SORTED_IMPORTS_CONFIGS
+    ):
+        del _SORTED_IMPORTS_HASHES[next(iter(_SORTED_IMPORTS_HASHES))]
+    sorted_hashes = _SORTED_IMPORTS_HASHES.setdefault(key, set())
+
+    changed_files = []
+    for filepath in filepaths:
+        filepath = Path(filepath)
+        code = filepath.read_bytes()
+        if hashlib.sha256(code).digest() in sorted_hashes:
+            continue
+
+        sorted_code = isort.api.sort_code_string(
+            code.decode("utf-8"), config=config, file_path=filepath
+        ).encode("utf-8")
+        if sorted_code != code:
+            filepath.write_bytes(sorted_code)
+            changed_files.append(filepath)
+
+        if len(sorted_hashes) >= MAX_SORTED_IMPORTS_HASHES:
+            sorted_hashes.clear()
+        sorted_hashes.add(hashlib.sha256(sorted_code).digest())
+
+    return changed_files
+
+
+def sort_project_imports(project_path=None, line_length=100, profile="black"):
+    """Sort the imports of all the Python files of a project.
+
+    The isort settings of the project, if any, are honored.
+
+    Parameters
+    ----------
+    project_path : ~pathlib.Path, optional
+        Project's root directory. Default is the current working directory.
+    line_length : int or str, optional
+        Maximum length of the lines. Default is 100.
+    profile : str, optional
+        Name of the isort profile. Default is ``"black"``.
+
+    Returns
+    -------
+    list
+        Paths to the files whose imports were sorted.
+
+    """
+    project_path = Path.cwd() if project_path is None else Path(project_path)
+    return sort_imports(
+        sorted(project_path.rglob("*.py")), line_length, profile, settings_path=project_path
+    )
+
+
+@contextmanager
+def staged_template(template_path, license_path=MIT_LICENSE, use_cache=True, bundle_path=None):
+    """
+    Stage a template together with the common files and the license.
+
+    Parameters
+    ----------
+    template_path: ~pathlib.Path
+        Path to the template.
+    license_path: ~pathlib.Path
+        Path to license file. Default is MIT.
+    use_cache: bool
+        Reuse the staged template from the user cache directory, staging it
+        only if required. Default is ``True``.
+    bundle_path: ~pathlib.Path
+        Path to a bundle of the template. Default is the installed bundle of
+        the template, if any, or its loose files otherwise.
+
+    Yields
+    ------
+    ~pathlib.Path
+        Path to the staged template. It must not be modified.
+
+    Notes
+    -----
+    Files from the common directory need to be combined with the template
+    before the cookiecutter context initializes. Otherwise, files added by a
+    hook will not be rendered. The combined template is staged once in the
+    user cache directory and reused while the installed templates do not
+    change. If the cache is disabled or not writable, a temporary overlay where
+    the common and desired template files are linked, not copied, is used.
+
+    Templates packed into a bundle are staged from it, using the hashes
+    precomputed when building the bundle instead of walking the template
+    files. See :mod:`ansys.templates.bundle`.
+
+    """
+    if bundle_path is None:
+        bundle_path = find_bundle(template_path)
+
+    if bundle_path is not None:
+        bundle_index = read_bundle_index(bundle_path)
+        if bundle_index["template"] != Path(template_path).resolve().name:
+            raise ValueError(
+                f"Bundle '{bundle_path}' holds template '{bundle_index['template']}', "
+                f"not '{Path(template_path).resolve().name}'."
+            )
+        stage_function = partial(_stage_bundle, bundle_path, license_path)
+    else:
+        stage_function = partial(_stage_template, template_path, license_path)
+
+    staged_path = None
+    if use_cache:
+        try:
+            if bundle_path is not None:
+                key = bundle_staging_key(bundle_index, license_path)
+            else:
+                key = staging_key(template_path, license_path)
+            staged_path = get_staged_template(key, stage_function)
+        except OSError:
+            # The cache directory is not writable, fall back to an overlay
+            staged_path = None
+
+    if staged_path is not None:
+        yield staged_path
+        return
+
+    # Create a temporary directory to be used as the final template source
+    with tempfile.TemporaryDirectory() as tmp_template_path:
+
+        if bundle_path is not None:
+            _stage_bundle(bundle_path, license_path, Path(str(tmp_template_path)))
+        else:
+            # Link the common files, the desired template files and the license
+            _overlay_template(template_path, license_path, Path(str(tmp_template_path)))
+
+        yield Path(str(tmp_template_path))
+
+
+_CONTEXT_KWARGS = ("no_input", "extra_context", "replay", "config_file", "default_config")
+"""Cookiecutter keyword arguments resolving the context of a template."""
+
+
+def _iter_project_files(
+    template_path,
+    output_path,
+    license_path,
+    use_cache,
+    engine,
+    bundle_path,
+    dump_replay=True,
+    **context_kwargs,
+):
+    """Render a project in memory, see :func:`dry_run_template`.
+
+    Yields
+    ------
+    ~ansys.templates.rendering.RenderedFile
+        Each file of the project, as soon as it is rendered.
+
+    """
+    with staged_template(template_path, license_path, use_cache, bundle_path) as staged_path:
+        context = generate_template_context(
+            staged_path, output_dir=str(output_path), dump_replay=dump_replay, **context_kwargs
+        )
+        engine = engine or RenderingEngine()
+        rendered_files = iter_rendered_files(staged_path, context, engine)
+        manifest = load_manifest(staged_path) or {}
+        if manifest.get("sort_imports"):
+            template_dir = find_template(staged_path)
+            plan = render_plan(manifest, context, engine.get_environment(template_dir, context))
+            rendered_files = _sort_rendered_imports(
+                rendered_files, plan.files, context["cookiecutter"].get("__max_linelength") or 100
+            )
+        yield from rendered_files
+
+
+def _sort_rendered_imports(rendered_files, project_files, line_length, profile="black"):
+    """Sort the imports of the Python files of a project rendered in memory.
+
+    This is the post-processing applied by :func:`sort_project_imports` once
+    the project is baked. isort looks for the modules of the project and for
+    its settings files in the file system, so the layout of the project is
+    mirrored with empty files in a temporary directory. Files rendered before
+    all the settings files are held back.
+
+    Parameters
+    ----------
+    rendered_files : iterable
+        Rendered files of the project, see
+        :func:`~ansys.templates.rendering.iter_rendered_files`.
+    project_files : iterable
+        POSIX paths to all the files of the project, relative to its root
+        directory.
+    line_length : int or str
+        Maximum length of the lines.
+    profile : str, optional
+        Name of the isort profile. Default is ``"black"``.
+
+    Yields
+    ------
+    ~ansys.templates.rendering.RenderedFile
+        Each file of the project, with the imports of Python files sorted.
+
+    """
+    import isort
+
+    pending_settings = set(isort.settings.CONFIG_SOURCES).intersection(project_files)
+    with tempfile.TemporaryDirectory() as settings_path:
+        for name in project_files:
+            Path(settings_path, name).parent.mkdir(parents=True, exist_ok=True)
+            Path(settings_path, name).touch()
+
+        config = None
+        held_files = []
+        for rendered_file in rendered_files:
+            relative_path = rendered_file.path.split("/", 1)[-1]
+            if relative_path in pending_settings:
+                with rendered_file.open() as contents:
+                    Path(settings_path, relative_path).write_bytes(contents.read())
+                pending_settings.discard(relative_path)
+
+            if pending_settings:
+                held_files.append(rendered_file)
+                continue
+            if config is None:
+                config, _ = _isort_config(int(line_length), profile, settings_path)
+                for held_file in held_files:
+                    yield _sort_rendered_file(held_file, config, settings_path)
+                held_files.clear()
+            yield _sort_rendered_file(rendered_file, config, settings_path)
+
+        if held_files:
+            # Some settings files are not rendered, e.g. on failure
+            config, _ = _isort_config(int(line_length), profile, settings_path)
+            for held_file in held_files:
+                yield _sort_rendered_file(held_file, config, settings_path)
+
+
+def _sort_rendered_file(rendered_file, config, settings_path):
+    """Sort the imports of a rendered file if it is a Python file.
+
+    Parameters
+    ----------
+    rendered_file : ~ansys.templates.rendering.RenderedFile
+        Rendered file.
+    config : isort.settings.Config
+        Configuration of isort.
+    settings_path : str
+        Directory holding the isort settings files of the project.
+
+    Returns
+    -------
+    ~ansys.templates.rendering.RenderedFile
+        Rendered file, replaced if its imports were not sorted.
+
+    """
+    import isort
+
+    if not rendered_file.path.endswith(".py"):
+        return rendered_file
+
+    with rendered_file.open() as contents:
+        code = contents.read()
+    relative_path = rendered_file.path.split("/", 1)[-1]
+    sorted_code = isort.api.sort_code_string(
+        code.decode("utf-8"), config=config, file_path=Path(settings_path, relative_path)
+    ).encode("utf-8")
+    if sorted_code == code:
+        return rendered_file
+    return RenderedFile(rendered_file.path, rendered_file.mode, data=sorted_code)
+
+
+def dry_run_template(
+    template_path,
+    output_path=".",
+    license_path=MIT_LICENSE,
+    use_cache=True,
+    engine=None,
+    bundle_path=None,
+    **context_kwargs,
+):
+    """Render a project in memory and describe each of its files.
+
+    The files are rendered as :func:`bake_template` would do, but nothing is
+    written to the output path. The hooks of the template are not executed,
+    but the imports of the Python files are sorted like they do if the
+    manifest of the template declares it.
+
+    Parameters
+    ----------
+    template_path : ~pathlib.Path
+        Path to the template.
+    output_path : ~pathlib.Path, optional
+        Output path the project would be baked into.
+    license_path : ~pathlib.Path, optional
+        Path to license file. Default is MIT.
+    use_cache : bool, optional
+        Reuse the staged template from the user cache directory, staging it
+        only if required. Default is ``True``.
+    engine : ~ansys.templates.rendering.RenderingEngine, optional
+        Long-lived rendering engine reusing the compiled templates.
+    bundle_path : ~pathlib.Path, optional
+        Path to a bundle of the template.
+    **context_kwargs : dict
+        Keyword arguments of
+        :func:`~ansys.templates.rendering.generate_template_context`, like
+        ``no_input`` or ``extra_context``.
+
+    Yields
+    ------
+    dict
+        POSIX ``path`` relative to the output path, ``size`` in bytes,
+        ``sha256`` hash and permission bits ``mode`` of each file, as soon as
+        it is rendered.
+
+    """
+    for rendered_file in _iter_project_files(
+        template_path,
+        output_path,
+        license_path,
+        use_cache,
+        engine,
+        bundle_path,
+        dump_replay=False,
+        **context_kwargs,
+    ):
+        hasher = hashlib.sha256()
+        with rendered_file.open() as contents:
+            for chunk in iter(partial(contents.read, CHUNK_SIZE), b""):
+                hasher.update(chunk)
+        yield {
+            "path": rendered_file.path,
+            "size": rendered_file.size,
+            "sha256": hasher.hexdigest(),
+            "mode": rendered_file.mode,
+        }
+
+
+def bake_template(
+    template_path,
+    output_path,
+    license_path=MIT_LICENSE,
+    use_cache=True,
+    engine=None,
+    bundle_path=None,
+    profile=None,
+    dry_run=False,
+    sink=None,
+    **cookiecutter_kwargs,
+):
     """
     Bakes project using desired template and common files.
 
@@ -197,29 +910,275 @@ def bake_template(template_path, output_path, license_path=MIT_LICENSE, **cookie
         Output path for the baked template.
     license_path: ~pathlib.Path
         Path to license file. Default is MIT.
+    use_cache: bool
+        Reuse the staged template from the user cache directory, staging it
+        only if required. Default is ``True``.
+    engine: ~ansys.templates.rendering.RenderingEngine
+        Long-lived rendering engine reusing the compiled templates across
+        bakes. Default creates a new engine for each bake.
+    bundle_path: ~pathlib.Path
+        Path to a bundle of the template. Default is the installed bundle of
+        the template, if any, or its loose files otherwise.
+    profile: ~ansys.templates.profiling.BakeProfile
+        Profile recording the time spent staging the template, resolving its
+        context, rendering each file and running the hooks. Default does not
+        report the timings.
+    dry_run: bool
+        Render the project in memory without writing anything to the output
+        path. See :func:`dry_run_template`. Default is ``False``.
+    sink: ~ansys.templates.sinks.OutputSink
+        Sink receiving the files of the project as soon as they are rendered
+        in memory, e.g. to stream an archive. The output path is then only
+        used to resolve the context of the template and the hooks of the
+        template are not executed, but the imports are sorted like with
+        :func:`dry_run_template`. Default writes the project into the output
+        path.
     **cookiecutter_kwargs: dict
         Additional cookiecutter keyword arguments.
 
+    Returns
+    -------
+    str, list or int
+        Path to the baked project or, for a dry run, the description of each
+        file of the project or, for a sink, the number of files written.
+
     Notes
     -----
-    Files from the common directory need to be copied before the cookiecutter
-    context initializes. Otherwise, copied files by a hook will not be
-    rendered. This function creates a temporary directory where the common and
-    desired template are combined so then cookiecutter can be executed.
+    The template is staged with :func:`staged_template`. If the template ships
+    a ``manifest.json`` file, only the files declared in it for the resolved
+    context are rendered. See :mod:`ansys.templates.manifest`.
 
     """
-    # Create a temporary directory to be used as the final template source
-    with tempfile.TemporaryDirectory() as tmp_template_path:
+    context_kwargs = {
+        name: value for name, value in cookiecutter_kwargs.items() if name in _CONTEXT_KWARGS
+    }
+    if dry_run:
+        return list(
+            dry_run_template(
+                template_path,
+                output_path,
+                license_path,
+                use_cache,
+                engine,
+                bundle_path,
+                **context_kwargs,
+            )
+        )
+    if sink is not None:
+        written_files = 0
+        for rendered_file in _iter_project_files(
+            template_path,
+            output_path,
+            license_path,
+            use_cache,
+            engine,
+            bundle_path,
+            **context_kwargs,
+        ):
+            sink.write(rendered_file)
+            written_files += 1
+        return written_files
+
+    profile = profile if profile is not None else BakeProfile()
+    with profile.measure(), ExitStack() as stack:
+        with profile.phase("staging"):
+            staged_path = stack.enter_context(
+                staged_template(template_path, license_path, use_cache, bundle_path)
+            )
+        # Bake the project using cookiecutter with desired options
+        return render_staged_template(
+            staged_path,
+            output_dir=str(output_path),
+            engine=engine,
+            profile=profile,
+            **cookiecutter_kwargs,
+        )
+
+
+@dataclass
+class BakeResult:
+    """Outcome of a baking job.
+
+    Parameters
+    ----------
+    template : str
+        Name of the template.
+    output_dir : str
+        Output path for the baked template.
+    elapsed : float
+        Wall time spent baking the project, in seconds.
+    error : str, optional
+        Description of the error, if the job failed.
+    project_dir : str, optional
+        Path to the baked project, if the job succeeded.
+
+    """
+
+    template: str
+    output_dir: str
+    elapsed: float
+    error: str = None
+    project_dir: str = None
+
+    @property
+    def succeeded(self):
+        """Return ``True`` if the project was baked without errors."""
+        return self.error is None
+
+
+def load_bake_jobs(jobs_file):
+    """Load a list of baking jobs from a JSON or YAML file.
+
+    Each job is a dictionary with a ``template`` name, an ``output_dir`` and,
+    optionally, an ``extra_context`` dictionary holding cookiecutter variables.
+
+    Parameters
+    ----------
+    jobs_file : ~pathlib.Path
+        Path to the JSON or YAML file.
+
+    Returns
+    -------
+    list
+        Baking jobs.
+
+    Raises
+    ------
+    ValueError
+        If the file does not hold a list of dictionaries. Missing keys are
+        reported as the error of their job when it is baked.
+
+    """
+    jobs_file = Path(jobs_file)
+    with open(jobs_file, encoding="utf-8") as file:
+        if jobs_file.suffix.lower() in [".yml", ".yaml"]:
+            try:
+                import yaml
+            except ModuleNotFoundError:
+                raise ModuleNotFoundError("PyYAML is required for loading YAML jobs files.")
+            jobs = yaml.safe_load(file)
+        else:
+            jobs = json.load(file)
 
-        # The common directory can be obtained from the template path
-        common_path = template_path / "../common"
+    if not isinstance(jobs, list):
+        raise ValueError(f"Jobs file '{jobs_file}' must hold a list of jobs.")
+    invalid = [str(index) for index, job in enumerate(jobs) if not isinstance(job, dict)]
+    if invalid:
+        raise ValueError(f"Jobs {', '.join(invalid)} of '{jobs_file}' are not dictionaries.")
+    return jobs
 
-        # Copy the common and desired template files
-        _copy_common_template_files(common_path, Path(str(tmp_template_path)))
-        _copy_all_template_files(template_path, Path(str(tmp_template_path)))
 
-        # Copy license file
-        _include_license(license_path, Path(str(tmp_template_path)))
+def _job_error(job):
+    """Describe why a baking job is not valid.
+
+    Parameters
+    ----------
+    job : object
+        Baking job. See :func:`load_bake_jobs`.
+
+    Returns
+    -------
+    str or None
+        Description of the error, ``None`` if the job is valid.
+
+    """
+    if not isinstance(job, dict):
+        return f"Job must be a dictionary, got {type(job).__name__}."
+    missing = [key for key in ("template", "output_dir") if job.get(key) is None]
+    if missing:
+        return f"Job is missing {', '.join(repr(key) for key in missing)}."
+    if not isinstance(job.get("extra_context", {}), dict):
+        return "Job 'extra_context' must be a dictionary."
+    return None
+
+
+def _failed_job(job, error):
+    """Return the outcome of a job failing before being baked."""
+    fields = job if isinstance(job, dict) else {}
+    output_dir = fields.get("output_dir")
+    return BakeResult(
+        fields.get("template"), None if output_dir is None else str(output_dir), 0.0, error
+    )
+
+
+_WORKER_ENGINE = None
+"""Rendering engine shared by all the jobs baked in a worker process."""
+
+
+def _init_worker():
+    """Create the rendering engine of a worker process."""
+    global _WORKER_ENGINE
+    _WORKER_ENGINE = RenderingEngine()
+
+
+def _bake_job(job):
+    """Bake a project and report the outcome instead of raising.
+
+    Parameters
+    ----------
+    job : dict
+        Baking job. See :func:`load_bake_jobs`.
+
+    Returns
+    -------
+    BakeResult
+        Outcome of the job.
+
+    """
+    error = _job_error(job)
+    if error is not None:
+        return _failed_job(job, error)
+
+    template, output_dir = job["template"], str(job["output_dir"])
+    start = time.perf_counter()
+    error = project_dir = None
+    try:
+        if template not in TEMPLATE_PATH_FINDER:
+            raise ValueError(f"Unknown template '{template}'.")
+        project_dir = bake_template(
+            TEMPLATE_PATH_FINDER[template],
+            Path(output_dir),
+            overwrite_if_exists=True,
+            no_input=True,
+            extra_context=job.get("extra_context", {}),
+            engine=_WORKER_ENGINE,
+        )
+    except Exception as err:
+        error = "".join(traceback.format_exception_only(type(err), err)).strip()
+
+    return BakeResult(template, output_dir, time.perf_counter() - start, error, project_dir)
+
+
+def bake_templates(jobs, max_workers=None):
+    """Bake various projects in parallel.
+
+    Each job is baked in a separate worker process, so changes of the working
+    directory performed while rendering or running hooks do not interfere
+    with other jobs. A failing job does not stop the remaining ones. Compiled
+    templates are reused by all the jobs baked in the same worker process.
+
+    Parameters
+    ----------
+    jobs : list
+        Baking jobs. See :func:`load_bake_jobs`.
+    max_workers : int, optional
+        Maximum number of worker processes. Default is the number of CPUs.
+
+    Returns
+    -------
+    list
+        :class:`BakeResult` of each job, in the same order as the jobs.
+
+    """
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker) as executor:
+        futures = [executor.submit(_bake_job, job) for job in jobs]
+
+    results = []
+    for job, future in zip(jobs, futures):
+        try:
+            results.append(future.result())
+        except Exception as err:
+            # The worker process died before reporting the outcome
+            results.append(_failed_job(job, repr(err)))
 
-        # Bake the temporary project using cookiecutter with desired options
-        cookiecutter(str(tmp_template_path), output_dir=str(output_path), **cookiecutter_kwargs)
+    return results
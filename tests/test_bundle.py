@@ -0,0 +1,165 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import zipfile
+
+import pytest
+
+from ansys.templates.bundle import (
+    BUNDLE_INDEX,
+    build_bundle,
+    build_bundles,
+    extract_bundle,
+    find_bundle,
+    read_bundle_index,
+)
+from ansys.templates.cache import staging_cache_dir
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.utils import bake_template
+
+
+def _create_family(path):
+    """Create a tiny family of templates with an overridden file."""
+    common_project = path / "common/{{cookiecutter.__project_name_slug}}"
+    template_project = path / "template/{{cookiecutter.__project_name_slug}}"
+    common_project.mkdir(parents=True)
+    template_project.mkdir(parents=True)
+
+    (common_project / "README.rst").write_text("common readme")
+    (common_project / "run.sh").write_text("echo {{ cookiecutter.__project_name_slug }}")
+    (common_project / "run.sh").chmod(0o755)
+    (template_project / "README.rst").write_text("template readme")
+    (path / "template/cookiecutter.json").write_text('{"__project_name_slug": "project"}')
+    (path / "LICENSE").write_text("license")
+
+    return path / "template", path / "LICENSE"
+
+
+def test_build_bundle(tmp_path):
+    template_path, _ = _create_family(tmp_path / "family")
+
+    index = build_bundle(template_path, tmp_path / "template.zip")
+
+    assert read_bundle_index(tmp_path / "template.zip") == index
+    assert index["template"] == "template"
+    assert sorted(index["files"]) == [
+        "cookiecutter.json",
+        "{{cookiecutter.__project_name_slug}}/README.rst",
+        "{{cookiecutter.__project_name_slug}}/run.sh",
+    ]
+    assert index["files"]["{{cookiecutter.__project_name_slug}}/run.sh"]["mode"] == 0o755
+
+    # Building again produces the very same archive
+    build_bundle(template_path, tmp_path / "again.zip")
+    assert (tmp_path / "again.zip").read_bytes() == (tmp_path / "template.zip").read_bytes()
+
+
+def test_extract_bundle(tmp_path):
+    template_path, _ = _create_family(tmp_path / "family")
+    build_bundle(template_path, tmp_path / "template.zip")
+
+    extract_bundle(tmp_path / "template.zip", tmp_path / "staged")
+
+    project_path = tmp_path / "staged/{{cookiecutter.__project_name_slug}}"
+    assert (project_path / "README.rst").read_text() == "template readme"
+    assert (project_path / "run.sh").stat().st_mode & 0o777 == 0o755
+
+
+def test_extract_corrupted_bundle(tmp_path):
+    template_path, _ = _create_family(tmp_path / "family")
+    index = build_bundle(template_path, tmp_path / "template.zip")
+    index["files"]["cookiecutter.json"]["sha256"] = "0" * 64
+    with zipfile.ZipFile(tmp_path / "corrupted.zip", "w") as archive:
+        archive.writestr(BUNDLE_INDEX, json.dumps(index))
+        archive.writestr("cookiecutter.json", "{}")
+
+    with pytest.raises(ValueError, match="is corrupted"):
+        extract_bundle(tmp_path / "corrupted.zip", tmp_path / "staged")
+
+
+@pytest.mark.parametrize("name", ["/etc/passwd", "../outside.txt", "a/../../outside.txt", "C:/x"])
+def test_extract_bundle_with_unsafe_path(tmp_path, name):
+    template_path, _ = _create_family(tmp_path / "family")
+    index = build_bundle(template_path, tmp_path / "template.zip")
+    index["files"] = {name: {"sha256": "0" * 64, "size": 0, "mode": 0o644}}
+    with zipfile.ZipFile(tmp_path / "unsafe.zip", "w") as archive:
+        archive.writestr(BUNDLE_INDEX, json.dumps(index))
+        archive.writestr(name, "")
+
+    with pytest.raises(ValueError, match="is not allowed"):
+        extract_bundle(tmp_path / "unsafe.zip", tmp_path / "staged/nested")
+    assert not (tmp_path / "outside.txt").exists()
+    assert not (tmp_path / "staged").exists()
+
+
+def test_find_bundle(tmp_path, monkeypatch):
+    template_path, _ = _create_family(tmp_path / "family")
+    monkeypatch.setattr("ansys.templates.bundle.BUNDLES_PATH", tmp_path / "bundles")
+    assert find_bundle(template_path) is None
+
+    build_bundle(template_path, tmp_path / "bundles/template.zip")
+    assert find_bundle(template_path) == tmp_path / "bundles/template.zip"
+
+    # A stale bundle does not shadow the loose files
+    (template_path / "{{cookiecutter.__project_name_slug}}/README.rst").write_text("changed")
+    assert find_bundle(template_path) is None
+
+
+def test_read_bundle_index_of_invalid_file(tmp_path):
+    (tmp_path / "invalid.zip").write_text("invalid")
+
+    with pytest.raises(ValueError, match="is not a template bundle"):
+        read_bundle_index(tmp_path / "invalid.zip")
+
+
+def test_bake_template_from_bundle(tmp_path):
+    template_path, license_path = _create_family(tmp_path / "family")
+    build_bundle(template_path, tmp_path / "template.zip")
+    # Bundles do not depend on the loose files once built
+    (template_path / "{{cookiecutter.__project_name_slug}}/README.rst").write_text("changed")
+
+    bake_template(
+        template_path,
+        tmp_path / "output",
+        license_path=license_path,
+        bundle_path=tmp_path / "template.zip",
+        no_input=True,
+    )
+
+    assert (tmp_path / "output/project/README.rst").read_text() == "template readme"
+    assert (tmp_path / "output/project/run.sh").read_text() == "echo project"
+    assert (tmp_path / "output/project/LICENSE").read_text() == "license"
+    assert any(path.name.startswith("template-") for path in staging_cache_dir().iterdir())
+
+
+def test_bake_template_from_bundle_of_another_template(tmp_path):
+    build_bundles(tmp_path)
+
+    with pytest.raises(ValueError, match="holds template 'pybasic'"):
+        bake_template(
+            TEMPLATE_PATH_FINDER["pyansys"],
+            tmp_path / "output",
+            bundle_path=tmp_path / "pybasic.zip",
+            no_input=True,
+        )
@@ -0,0 +1,99 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import os
+import sys
+
+import pytest
+
+from ansys.templates.cache import (
+    evict_staged_templates,
+    get_staged_template,
+    staging_cache_dir,
+    staging_key,
+)
+
+
+def _make_template(path, files):
+    """Create a template and its common files holding some files."""
+    (path / "common" / "{{cookiecutter.__project_name_slug}}").mkdir(parents=True)
+    (path / "template").mkdir()
+    for name, contents in files.items():
+        (path / "template" / name).write_text(contents)
+    (path / "LICENSE").write_text("license")
+    return path / "template", path / "LICENSE"
+
+
+def test_staging_key_separates_paths_and_contents(tmp_path):
+    first_key = staging_key(*_make_template(tmp_path / "first", {"a": "bc"}))
+    second_key = staging_key(*_make_template(tmp_path / "second", {"ab": "c"}))
+
+    assert first_key != second_key
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Permission bits are not kept on Windows")
+def test_staging_key_depends_on_permission_bits(tmp_path):
+    template_path, license_path = _make_template(tmp_path, {"hook.py": "pass"})
+    key = staging_key(template_path, license_path)
+
+    os.chmod(template_path / "hook.py", 0o755)
+
+    assert staging_key(template_path, license_path) != key
+
+
+def test_get_staged_template_is_cached():
+    calls = []
+
+    def stage_function(staging_path):
+        calls.append(staging_path)
+        (staging_path / "cookiecutter.json").write_text("{}")
+
+    first_path = get_staged_template("template-0.1.0-abc", stage_function)
+    second_path = get_staged_template("template-0.1.0-abc", stage_function)
+
+    assert first_path == second_path
+    assert (first_path / "cookiecutter.json").is_file()
+    assert len(calls) == 1
+
+
+def test_evict_staged_templates():
+    for index in range(3):
+        staged_path = get_staged_template(f"evict-{index}", lambda staging_path: None)
+        os.utime(staged_path, (index, index))
+
+    removed = evict_staged_templates(max_entries=len(os.listdir(staging_cache_dir())) - 2)
+
+    assert removed == 2
+    assert not (staging_cache_dir() / "evict-0").exists()
+    assert not (staging_cache_dir() / "evict-1").exists()
+
+
+def test_evict_staged_templates_keeps_recently_used():
+    for index in range(2):
+        get_staged_template(f"recent-{index}", lambda staging_path: None)
+
+    evict_staged_templates(max_entries=0)
+
+    # Other processes may still be baking from them
+    assert (staging_cache_dir() / "recent-0").is_dir()
+    assert (staging_cache_dir() / "recent-1").is_dir()
@@ -20,11 +20,22 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import json
+from pathlib import Path
+import pstats
+import subprocess
+import sys
+import zipfile
+
 from click.testing import CliRunner
 import pytest
 
 from ansys.templates import AVAILABLE_TEMPLATES_AND_DESCRIPTION, __version__
+from ansys.templates.bundle import build_bundle
+from ansys.templates.cache import CACHE_DIR_ENV_VAR
 from ansys.templates.cli import main
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.update import RECORD_FILENAME
 
 
 def test_cli_main_group():
@@ -34,9 +45,12 @@ def test_cli_main_group():
 
     assert "Ansys tool for creating new Ansys projects." in result.output
 
-    assert "list     List all available templates names." in result.output
-    assert "new      Create a new project from desired template." in result.output
-    assert "version  Display current version" in result.output
+    assert "bake-many  Bake various projects in parallel from a jobs file." in result.output
+    assert "cache      Manage the cache of staged templates." in result.output
+    assert "list       List all available templates names." in result.output
+    assert "new        Create a new project from desired template." in result.output
+    assert "update     Update a project to the installed version of its template." in result.output
+    assert "version    Display current version" in result.output
 
 
 def test_cli_main_list_command():
@@ -72,9 +86,174 @@ def test_cli_main_version_command():
     assert f"ansys-templates {__version__}" in result.output
 
 
+def _imported_modules(code):
+    """Return the names of the modules imported by a fresh interpreter."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+
+@pytest.mark.parametrize(
+    "command, heavy_modules",
+    [
+        ("list", ["cookiecutter", "jinja2", "isort", "importlib.metadata"]),
+        ("version", ["cookiecutter", "jinja2", "isort"]),
+        ("--help", ["cookiecutter", "jinja2", "isort", "importlib.metadata"]),
+    ],
+)
+def test_cli_startup_imports(command, heavy_modules):
+    code = f"from ansys.templates.cli import main; main([{command!r}], standalone_mode=False)"
+    modules = _imported_modules(code)
+
+    assert "ansys.templates.cli" in modules
+    for module in heavy_modules:
+        assert module not in modules
+
+
 @pytest.mark.parametrize("template", AVAILABLE_TEMPLATES_AND_DESCRIPTION.keys())
 def test_cli_main_new(template):
     runner = CliRunner()
     with runner.isolated_filesystem() as td:
         result = runner.invoke(main, ["new", template.replace("_", "-")])
         assert result.exit_code == 0
+
+
+def test_cli_main_new_from_bundle(tmp_path):
+    bundle_path = tmp_path / "doc_project.zip"
+    build_bundle(TEMPLATE_PATH_FINDER["doc-project"], bundle_path)
+
+    runner = CliRunner()
+    with runner.isolated_filesystem() as td:
+        result = runner.invoke(main, ["new", "--from-bundle", str(bundle_path), "doc-project"])
+        assert result.exit_code == 0
+
+        assert (Path(td) / "doc-project" / "README.rst").is_file()
+
+
+def test_cli_main_new_profile(tmp_path):
+    profile_path = tmp_path / "profile.json"
+    stats_path = tmp_path / "bake.prof"
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            main,
+            [
+                "new",
+                "--profile",
+                str(profile_path),
+                "--profile-stats",
+                str(stats_path),
+                "doc-project",
+            ],
+            input="\n" * 10,
+        )
+        assert result.exit_code == 0
+
+    profile = json.loads(profile_path.read_text())
+    assert {"staging", "context", "render", "hooks", "write"} <= set(profile["phases"])
+    assert any(entry["path"].endswith("README.rst") for entry in profile["files"])
+    assert "Slowest 10 of" in result.output
+    assert pstats.Stats(str(stats_path)).total_calls > 0
+
+
+def test_cli_main_new_dry_run():
+    runner = CliRunner()
+    with runner.isolated_filesystem() as td:
+        result = runner.invoke(main, ["new", "--dry-run", "doc-project"])
+        assert result.exit_code == 0
+
+        assert not any(Path(td).iterdir())
+
+    files = [json.loads(line) for line in result.output.splitlines()]
+    assert "doc-project/README.rst" in {file["path"] for file in files}
+    assert all(set(file) == {"path", "size", "sha256", "mode"} for file in files)
+
+
+def test_cli_main_new_output_archive():
+    runner = CliRunner()
+    with runner.isolated_filesystem() as td:
+        result = runner.invoke(main, ["new", "--output", "project.zip", "doc-project"])
+        assert result.exit_code == 0
+
+        with zipfile.ZipFile(Path(td) / "project.zip") as archive:
+            assert "doc-project/README.rst" in archive.namelist()
+        assert [path.name for path in Path(td).iterdir()] == ["project.zip"]
+
+
+@pytest.mark.parametrize("option", [["--profile", "profile.json"], ["--record"]])
+@pytest.mark.parametrize("mode", [["--dry-run"], ["--output", "project.zip"]])
+def test_cli_main_new_incompatible_options(option, mode):
+    runner = CliRunner()
+    with runner.isolated_filesystem() as td:
+        result = runner.invoke(main, ["new", *option, *mode, "doc-project"])
+        assert result.exit_code == 2
+
+        assert f"{option[0]} cannot be combined with --dry-run or --output." in result.output
+        assert not any(Path(td).iterdir())
+
+
+def test_cli_main_update_command():
+    runner = CliRunner()
+    with runner.isolated_filesystem() as td:
+        runner.invoke(main, ["new", "--record", "doc-project"], input="\n" * 10)
+        readme = Path(td) / "doc-project" / "README.rst"
+        readme.write_text("edited readme")
+
+        result = runner.invoke(main, ["update", "doc-project"])
+        assert result.exit_code == 0
+
+        assert "kept      README.rst" in result.output
+        assert "Updated 0 file(s) with 0 conflict(s)" in result.output
+        assert readme.read_text() == "edited readme"
+
+
+def test_cli_main_new_without_record():
+    runner = CliRunner()
+    with runner.isolated_filesystem() as td:
+        result = runner.invoke(main, ["new", "doc-project"], input="\n" * 10)
+        assert result.exit_code == 0
+
+        assert (Path(td) / "doc-project" / "README.rst").is_file()
+        assert not (Path(td) / "doc-project" / RECORD_FILENAME).exists()
+
+
+def test_cli_main_cache_clear_command(tmp_path, monkeypatch):
+    monkeypatch.setenv(CACHE_DIR_ENV_VAR, str(tmp_path))
+    (tmp_path / "staging/pybasic-0.1.0-0123456789abcdef").mkdir(parents=True)
+
+    runner = CliRunner()
+    result = runner.invoke(main, ["cache", "clear"])
+    assert result.exit_code == 0
+
+    assert "Removed 1 staged template(s)" in result.output
+    assert not any((tmp_path / "staging").iterdir())
+
+
+def test_cli_main_bake_many_command():
+    jobs = [
+        {"template": "doc-project", "output_dir": "first"},
+        {"template": "doc-project", "output_dir": "second", "extra_context": {"logo": "PyAnsys"}},
+        {"template": "unknown", "output_dir": "third"},
+    ]
+
+    runner = CliRunner()
+    with runner.isolated_filesystem() as td:
+        with open("jobs.json", "w") as jobs_file:
+            json.dump(jobs, jobs_file)
+
+        result = runner.invoke(main, ["bake-many", "jobs.json", "--max-workers", "2"])
+        assert result.exit_code == 1
+
+        assert "Baked 2 of 3 project(s)" in result.output
+        assert "Unknown template 'unknown'." in result.output
+        for output_dir in ["first", "second"]:
+            assert (Path(td) / output_dir / "doc-project" / "README.rst").is_file()
@@ -0,0 +1,144 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import OrderedDict
+import json
+
+from cookiecutter.exceptions import UndefinedVariableInTemplate
+from cookiecutter.generate import generate_context
+from cookiecutter.prompt import prompt_for_config
+import pytest
+
+from ansys.templates import context as context_module
+from ansys.templates.context import (
+    InvalidContextError,
+    load_variables,
+    resolve_variables,
+    validate_extra_context,
+)
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+
+
+@pytest.mark.parametrize("template", sorted(TEMPLATE_PATH_FINDER))
+def test_resolve_variables_matches_cookiecutter(template):
+    context_file = TEMPLATE_PATH_FINDER[template] / "cookiecutter.json"
+    extra_context = {"project_name": "My Project"}
+
+    expected = prompt_for_config(generate_context(context_file, extra_context=extra_context), True)
+    resolved = resolve_variables(generate_context(context_file, extra_context=extra_context))
+
+    assert resolved == expected
+    assert list(resolved) == list(expected)
+
+
+def test_resolve_variables_follows_references():
+    # Variables reference others declared later
+    context = {
+        "cookiecutter": OrderedDict(
+            [
+                ("__slug", "{{ cookiecutter.__name.lower() }}"),
+                ("__name", "{{ cookiecutter['project'] }} Lib"),
+                ("project", "Demo"),
+                ("flavor", ["{{ cookiecutter.__slug }}-a", "b"]),
+                ("_private", "{{ cookiecutter.project }}"),
+            ]
+        )
+    }
+
+    resolved = resolve_variables(context)
+
+    assert resolved == {
+        "__slug": "demo lib",
+        "__name": "Demo Lib",
+        "project": "Demo",
+        "flavor": "demo lib-a",
+        "_private": "{{ cookiecutter.project }}",
+    }
+
+
+def test_resolve_variables_is_memoized():
+    context = {"cookiecutter": {"project": "Demo", "__slug": "{{ cookiecutter.project }}"}}
+
+    first = resolve_variables(context)
+    first["__slug"] = "modified"
+
+    assert resolve_variables(context)["__slug"] == "Demo"
+
+
+@pytest.mark.parametrize(
+    "raw, resolutions",
+    [
+        ("{{ cookiecutter.project | lower }}", 1),
+        ("{{ uuid4() }}", 2),
+        ("{{ random_ascii_string(32) }}", 2),
+        ("{% now 'utc', '%Y-%m-%d %H:%M:%S.%f' %}", 2),
+        ("{{ ['a', 'b'] | random }}", 2),
+        (["{{ uuid4() }}", "b"], 2),
+    ],
+)
+def test_resolve_variables_memoizes_deterministic_values(raw, resolutions, monkeypatch):
+    resolve, calls = context_module._resolve, []
+    monkeypatch.setattr(
+        context_module,
+        "_resolve",
+        lambda env, variables: calls.append(1) or resolve(env, variables),
+    )
+    context = {"cookiecutter": {"project": "Memoized", "__id": raw}}
+
+    resolve_variables(context)
+    resolve_variables(context)
+
+    assert len(calls) == resolutions
+
+
+def test_resolve_variables_errors():
+    with pytest.raises(InvalidContextError, match="__a -> __b -> __a"):
+        resolve_variables(
+            {"cookiecutter": {"__a": "{{ cookiecutter.__b }}", "__b": "{{ cookiecutter.__a }}"}}
+        )
+
+    with pytest.raises(UndefinedVariableInTemplate, match="Unable to render variable '__a'"):
+        resolve_variables({"cookiecutter": {"__a": "{{ cookiecutter.missing }}"}})
+
+
+def test_validate_extra_context():
+    variables = load_variables(TEMPLATE_PATH_FINDER["pyansys"] / "cookiecutter.json")
+    validate_extra_context(variables, {"library_name": "demo", "__project_name_slug": "demo"})
+
+    with pytest.raises(InvalidContextError) as err:
+        validate_extra_context(variables, {"requires_python": "2.7", "library_name": ["a", "b"]})
+    assert len(err.value.errors) == 2
+    assert "'2.7' is not a valid choice for 'requires_python'" in str(err.value)
+    assert "'library_name' expects a single value" in str(err.value)
+
+    with pytest.warns(UserWarning, match="undeclared template variables: unknown"):
+        validate_extra_context(variables, {"unknown": "value"})
+
+
+def test_load_variables_reads_changes(tmp_path):
+    context_file = tmp_path / "cookiecutter.json"
+    context_file.write_text(json.dumps({"project_name": "demo"}))
+    assert load_variables(context_file) == {"project_name": "demo"}
+
+    context_file.write_text(json.dumps({"project_name": "demo", "version": "0.1.0"}))
+    assert load_variables(context_file) == {"project_name": "demo", "version": "0.1.0"}
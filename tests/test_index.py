@@ -0,0 +1,84 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+
+import pytest
+
+from ansys.templates import AVAILABLE_TEMPLATES_AND_DESCRIPTION
+import ansys.templates.index
+from ansys.templates.index import INDEX_PATH, build_index, load_index, write_index
+from ansys.templates.paths import PYTHON_TEMPLATES_COMMON_PATH, TEMPLATE_PATH_FINDER
+
+
+def test_index_is_up_to_date():
+    assert (
+        json.loads(INDEX_PATH.read_text(encoding="utf-8")) == build_index()
+    ), "The template index is outdated, run 'python -m ansys.templates.index'"
+
+
+def test_load_index():
+    index = load_index()
+
+    assert TEMPLATE_PATH_FINDER["common"] == PYTHON_TEMPLATES_COMMON_PATH
+    assert set(index["templates"]) == set(TEMPLATE_PATH_FINDER) - {"common"}
+    assert set(index["templates"]) == set(AVAILABLE_TEMPLATES_AND_DESCRIPTION)
+
+    # Only the lookups of the CLI are indexed
+    assert index["templates"]["pybasic"] == {
+        "path": "python/pybasic",
+        "description": "Create a basic Python Package.",
+    }
+
+
+def test_write_index(tmp_path):
+    template_path = tmp_path / "python" / "demo"
+    (template_path / "{{cookiecutter.__project_name_slug}}").mkdir(parents=True)
+    (template_path / "{{cookiecutter.__project_name_slug}}" / "README.rst").write_text("demo")
+    (template_path / "cookiecutter.json").write_text(json.dumps({"project_name": "demo"}))
+    (template_path / "manifest.json").write_text(
+        json.dumps({"name": "demo", "description": "Demo template.", "files": ["README.rst"]})
+    )
+    (tmp_path / "python" / "common").mkdir()
+    (tmp_path / "python" / "not_a_template").mkdir()
+
+    index_path = tmp_path / "templates.json"
+    assert write_index(index_path, tmp_path / "python")
+    assert not write_index(index_path, tmp_path / "python")
+
+    index = json.loads(index_path.read_text())
+    assert list(index["templates"]) == ["demo"]
+    assert index["templates"]["demo"]["description"] == "Demo template."
+
+
+def test_load_index_unsupported_format(tmp_path, monkeypatch):
+    index_path = tmp_path / "templates.json"
+    index_path.write_text(json.dumps({"format": 0}))
+    monkeypatch.setattr(ansys.templates.index, "INDEX_PATH", index_path)
+    load_index.cache_clear()
+
+    try:
+        with pytest.raises(ValueError, match="Unsupported format"):
+            load_index()
+    finally:
+        load_index.cache_clear()
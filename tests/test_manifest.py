@@ -0,0 +1,90 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from cookiecutter.environment import StrictEnvironment
+import pytest
+
+from ansys.templates.manifest import RenderPlan, load_manifest, render_plan
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+
+MANIFEST = {
+    "files": ["README.rst", "src/{{ cookiecutter.__project_name_slug }}/__init__.py"],
+    "renames": {"requirements_build.txt": "requirements/requirements_build.txt"},
+    "conditions": [
+        {"when": {"ci_cd_platform": "GitHub"}, "files": [".github/workflows/ci_cd.yml"]},
+        {
+            "when": {"build_system": ["flit", "setuptools"]},
+            "files": ["requirements/requirements_build.txt"],
+        },
+    ],
+}
+
+
+def test_render_plan():
+    context = {
+        "cookiecutter": {
+            "__project_name_slug": "project",
+            "ci_cd_platform": "GitHub",
+            "build_system": "poetry",
+        }
+    }
+
+    plan = render_plan(MANIFEST, context, StrictEnvironment(context=context))
+
+    assert plan.files == {"README.rst", "src/project/__init__.py", ".github/workflows/ci_cd.yml"}
+    assert plan.includes("src/project/__init__.py")
+    assert plan.includes(".github/workflows/ci_cd.yml")
+    assert not plan.includes("setup.py")
+
+    # The renamed file is only rendered if its final name is part of the project
+    assert not plan.includes("requirements_build.txt")
+
+
+def test_render_plan_includes_renamed_files():
+    plan = RenderPlan(
+        files=frozenset(["requirements/requirements_build.txt"]),
+        renames={"requirements_build.txt": "requirements/requirements_build.txt"},
+    )
+
+    assert plan.includes("requirements_build.txt")
+    assert not plan.includes("requirements/requirements_build.txt")
+
+
+@pytest.mark.parametrize("template", [name for name in TEMPLATE_PATH_FINDER if name != "common"])
+def test_templates_manifest(template):
+    manifest = load_manifest(TEMPLATE_PATH_FINDER[template])
+
+    assert manifest is not None
+    assert manifest["name"] == template
+    assert set(manifest) <= {
+        "name",
+        "description",
+        "sort_imports",
+        "files",
+        "renames",
+        "conditions",
+    }
+    # Imports are sorted in memory exactly for the templates whose hook sorts them
+    hook_path = TEMPLATE_PATH_FINDER[template] / "hooks/post_gen_project.py"
+    sorts_imports = hook_path.is_file() and "sort_project_imports(" in hook_path.read_text()
+    assert manifest.get("sort_imports", False) == sorts_imports
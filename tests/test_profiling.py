@@ -0,0 +1,69 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.profiling import BakeProfile
+from ansys.templates.utils import bake_template
+
+
+def test_bake_profile_nested_phases():
+    profile = BakeProfile()
+    with profile.measure():
+        with profile.phase("render"):
+            with profile.phase("hooks"):
+                pass
+        with profile.phase("render"):
+            pass
+
+    assert set(profile.phases) == {"render", "hooks"}
+    assert sum(profile.phases.values()) <= profile.total
+
+
+def test_bake_profile_report(tmp_path):
+    profile = BakeProfile()
+    profile.phases = {"render": 0.75, "hooks": 0.25}
+    profile.total = 1.0
+    for index in range(5):
+        profile.record_file(f"file_{index}.txt", index / 100)
+
+    report = profile.format_report(top=2)
+    assert "render           0.750   75.0%" in report
+    assert "Slowest 2 of 5 file(s):" in report
+    assert "file_4.txt" in report and "file_3.txt" in report
+    assert "file_2.txt" not in report
+
+    profile.write_json(tmp_path / "profile.json")
+    data = json.loads((tmp_path / "profile.json").read_text())
+    assert [entry["path"] for entry in data["files"]][:2] == ["file_4.txt", "file_3.txt"]
+
+
+def test_bake_template_profile(tmp_path):
+    profile = BakeProfile(tmp_path / "bake.prof")
+    bake_template(
+        TEMPLATE_PATH_FINDER["pybasic"], tmp_path / "output", no_input=True, profile=profile
+    )
+
+    assert {"staging", "context", "render", "hooks"} == set(profile.phases)
+    assert "README.rst" in profile.files
+    assert (tmp_path / "bake.prof").is_file()
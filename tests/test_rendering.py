@@ -0,0 +1,164 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import json
+import sys
+
+from cookiecutter.exceptions import FailedHookException
+import pytest
+
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.rendering import (
+    RenderingEngine,
+    generate_files,
+    generate_template_context,
+    iter_rendered_files,
+    render_staged_template,
+)
+from ansys.templates.utils import bake_template, staged_template
+
+
+def test_rendering_engine_reuses_compiled_templates(tmp_path):
+    engine = RenderingEngine()
+    context = {"cookiecutter": {}}
+
+    bake_template(TEMPLATE_PATH_FINDER["pyansys"], tmp_path / "first", engine=engine, no_input=True)
+    (env,) = engine._environments.values()
+    compiled_template = env.get_template("README.rst")
+
+    bake_template(
+        TEMPLATE_PATH_FINDER["pyansys"], tmp_path / "second", engine=engine, no_input=True
+    )
+
+    assert list(engine._environments.values()) == [env]
+    assert env.get_template("README.rst") is compiled_template
+    assert env.from_string("{{ cookiecutter.x }}") is env.from_string("{{ cookiecutter.x }}")
+    assert (tmp_path / "second/pyproduct-library/README.rst").read_text() == (
+        tmp_path / "first/pyproduct-library/README.rst"
+    ).read_text()
+    assert engine.get_environment(env.loader.searchpath[0], context) is env
+
+
+def test_rendering_engine_bytecode_cache(tmp_path):
+    engine = RenderingEngine(bytecode_cache_dir=tmp_path / "bytecode")
+
+    bake_template(
+        TEMPLATE_PATH_FINDER["pybasic"],
+        tmp_path,
+        engine=engine,
+        no_input=True,
+        extra_context={"project_name": "pybasic"},
+    )
+
+    assert any((tmp_path / "bytecode").iterdir())
+
+
+def _make_hook_template(template_path, hook_source):
+    (template_path / "{{cookiecutter.name}}").mkdir(parents=True)
+    (template_path / "{{cookiecutter.name}}" / "README.rst").write_text("{{ cookiecutter.name }}")
+    (template_path / "cookiecutter.json").write_text(json.dumps({"name": "demo"}))
+    (template_path / "hooks").mkdir()
+    (template_path / "hooks" / "post_gen_project.py").write_text(hook_source)
+
+
+@pytest.mark.parametrize("hooks_in_process", [True, False])
+def test_render_staged_template_hooks(tmp_path, hooks_in_process):
+    _make_hook_template(
+        tmp_path / "template",
+        "import os\nimport sys\n\n"
+        "if __name__ == '__main__':\n"
+        "    with open('hook.txt', 'w') as hook_file:\n"
+        "        hook_file.write('{{ cookiecutter.name }} ' + os.path.basename(os.getcwd()))\n",
+    )
+    argv = list(sys.argv)
+
+    project_dir = render_staged_template(
+        tmp_path / "template",
+        output_dir=str(tmp_path / "output"),
+        no_input=True,
+        hooks_in_process=hooks_in_process,
+    )
+
+    assert (tmp_path / "output" / "demo" / "hook.txt").read_text() == "demo demo"
+    assert project_dir == str(tmp_path / "output" / "demo")
+    assert sys.argv == argv
+
+
+def test_render_staged_template_hook_keeps_files_of_project(tmp_path, monkeypatch):
+    _make_hook_template(
+        tmp_path / "template",
+        "from ansys.templates.utils import keep_files\n\n"
+        "if __name__ == '__main__':\n"
+        "    keep_files(['README.rst'])\n",
+    )
+    (tmp_path / "template" / "{{cookiecutter.name}}" / "extra.txt").write_text("extra")
+    (tmp_path / "caller").mkdir()
+    (tmp_path / "caller" / "notes.txt").write_text("notes")
+    monkeypatch.chdir(tmp_path / "caller")
+
+    render_staged_template(
+        tmp_path / "template", output_dir=str(tmp_path / "output"), no_input=True
+    )
+
+    # The hook works on the baked project, not on the initial working directory
+    assert sorted(path.name for path in (tmp_path / "output" / "demo").iterdir()) == ["README.rst"]
+    assert (tmp_path / "caller" / "notes.txt").read_text() == "notes"
+
+
+@pytest.mark.parametrize("hook_body", ["sys.exit(3)", "raise RuntimeError('hook failed')"])
+def test_render_staged_template_failing_hook(tmp_path, hook_body):
+    _make_hook_template(tmp_path / "template", f"import sys\n\n{hook_body}\n")
+
+    with pytest.raises(FailedHookException):
+        render_staged_template(
+            tmp_path / "template", output_dir=str(tmp_path / "output"), no_input=True
+        )
+
+    assert not (tmp_path / "output" / "demo").exists()
+
+
+@pytest.mark.parametrize("template", ["pyansys", "pybasic"])
+def test_iter_rendered_files(tmp_path, template):
+    with staged_template(TEMPLATE_PATH_FINDER[template]) as staged_path:
+        context = generate_template_context(staged_path, output_dir=str(tmp_path), no_input=True)
+        rendered_files = {}
+        for rendered_file in iter_rendered_files(staged_path, context):
+            with rendered_file.open() as contents:
+                rendered_files[rendered_file.path] = (contents.read(), rendered_file.mode)
+            assert rendered_file.size == len(rendered_files[rendered_file.path][0])
+        assert not any(tmp_path.iterdir())
+
+        generate_files(
+            staged_path,
+            context,
+            output_dir=str(tmp_path),
+            overwrite_if_exists=True,
+            accept_hooks=False,
+        )
+
+    baked_files = {
+        path.relative_to(tmp_path).as_posix(): (path.read_bytes(), path.stat().st_mode & 0o7777)
+        for path in tmp_path.rglob("*")
+        if path.is_file()
+    }
+    assert rendered_files == baked_files
@@ -0,0 +1,162 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import io
+from pathlib import Path
+import tarfile
+import zipfile
+
+import pytest
+
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.rendering import RenderedFile
+from ansys.templates.sinks import DirectorySink, OutputSink, TarSink, ZipSink, open_sink
+from ansys.templates.utils import bake_template
+
+
+class _UnseekableStream(io.RawIOBase):
+    """Writable stream that can not seek, like a pipe."""
+
+    def __init__(self):
+        self.buffer = bytearray()
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self.buffer.extend(data)
+        return len(data)
+
+
+def _expected_hashes(tmp_path):
+    files = bake_template(TEMPLATE_PATH_FINDER["pyansys"], tmp_path, dry_run=True, no_input=True)
+    return {file["path"]: file["sha256"] for file in files}
+
+
+def test_directory_sink(tmp_path):
+    with DirectorySink(tmp_path / "output") as sink:
+        count = bake_template(TEMPLATE_PATH_FINDER["pyansys"], tmp_path, sink=sink, no_input=True)
+
+    hashes = {
+        path.relative_to(tmp_path / "output")
+        .as_posix(): hashlib.sha256(path.read_bytes())
+        .hexdigest()
+        for path in (tmp_path / "output").rglob("*")
+        if path.is_file()
+    }
+    assert hashes == _expected_hashes(tmp_path)
+    assert count == len(hashes)
+
+
+def test_tar_sink(tmp_path):
+    stream = _UnseekableStream()
+    with TarSink(stream) as sink:
+        bake_template(TEMPLATE_PATH_FINDER["pyansys"], tmp_path, sink=sink, no_input=True)
+
+    with tarfile.open(fileobj=io.BytesIO(stream.buffer), mode="r:gz") as archive:
+        hashes = {
+            member.name: hashlib.sha256(archive.extractfile(member).read()).hexdigest()
+            for member in archive.getmembers()
+        }
+    assert hashes == _expected_hashes(tmp_path)
+
+
+def test_zip_sink(tmp_path):
+    stream = _UnseekableStream()
+    with ZipSink(stream) as sink:
+        bake_template(TEMPLATE_PATH_FINDER["pyansys"], tmp_path, sink=sink, no_input=True)
+
+    with zipfile.ZipFile(io.BytesIO(stream.buffer)) as archive:
+        hashes = {
+            name: hashlib.sha256(archive.read(name)).hexdigest() for name in archive.namelist()
+        }
+    assert hashes == _expected_hashes(tmp_path)
+
+
+def test_sink_copies_source_files(tmp_path):
+    source_path = tmp_path / "logo.png"
+    source_path.write_bytes(bytes(range(256)) * 4096)
+
+    with ZipSink(tmp_path / "project.zip") as sink:
+        sink.write(RenderedFile("project/logo.png", 0o755, source_path=str(source_path)))
+
+    with zipfile.ZipFile(tmp_path / "project.zip") as archive:
+        assert archive.read("project/logo.png") == source_path.read_bytes()
+        assert archive.getinfo("project/logo.png").external_attr >> 16 & 0o7777 == 0o755
+
+
+@pytest.mark.parametrize("sink_class", [TarSink, ZipSink])
+def test_sink_aborted_on_error(tmp_path, sink_class):
+    with pytest.raises(RuntimeError, match="failure"):
+        with sink_class(tmp_path / "project.archive") as sink:
+            sink.write(RenderedFile("project/README.rst", 0o644, data=b"readme"))
+            raise RuntimeError("failure")
+
+    # Archives owned by the sink are removed instead of being left incomplete
+    assert not (tmp_path / "project.archive").exists()
+
+
+def test_sink_matches_baked_project(tmp_path):
+    # Files post-processed by the hooks, e.g. with sorted imports, match too
+    project_path = bake_template(TEMPLATE_PATH_FINDER["doc-project"], tmp_path, no_input=True)
+    hashes = {
+        path.relative_to(tmp_path).as_posix(): hashlib.sha256(path.read_bytes()).hexdigest()
+        for path in Path(project_path).rglob("*")
+        if path.is_file()
+    }
+
+    with ZipSink(tmp_path / "project.zip") as sink:
+        bake_template(TEMPLATE_PATH_FINDER["doc-project"], tmp_path, sink=sink, no_input=True)
+
+    with zipfile.ZipFile(tmp_path / "project.zip") as archive:
+        assert {
+            name: hashlib.sha256(archive.read(name)).hexdigest() for name in archive.namelist()
+        } == hashes
+
+
+def test_output_sink_is_abstract():
+    with pytest.raises(TypeError):
+        OutputSink()
+
+
+@pytest.mark.parametrize(
+    "target, sink_format, sink_class",
+    [
+        ("project", None, DirectorySink),
+        ("project.tar.gz", None, TarSink),
+        ("project.tgz", None, TarSink),
+        ("project.zip", None, ZipSink),
+        ("project.out", "zip", ZipSink),
+    ],
+)
+def test_open_sink(tmp_path, target, sink_format, sink_class):
+    with open_sink(tmp_path / target, sink_format) as sink:
+        assert type(sink) is sink_class
+
+
+def test_open_sink_errors():
+    with pytest.raises(ValueError, match="Unknown output format"):
+        open_sink("project.7z", "7z")
+    with pytest.raises(ValueError, match="standard output"):
+        open_sink("-", "dir")
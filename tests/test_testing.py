@@ -20,9 +20,19 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import json
 import os
+from pathlib import Path
 
-from ansys.templates.testing import assert_files_in_baked_project, assert_template_baking_process
+import pytest
+
+from ansys.templates.testing import (
+    assert_files_in_baked_project,
+    assert_project_snapshot,
+    assert_project_structure,
+    assert_template_baking_process,
+    project_fingerprints,
+)
 
 
 def test_assert_files_in_baked_project(tmp_path):
@@ -33,6 +43,43 @@ def test_assert_files_in_baked_project(tmp_path):
     assert_files_in_baked_project(files_list, tmp_path)
 
 
+def test_assert_project_structure(tmp_path):
+    for file in ["README.rst", "src/pkg/__init__.py", "src/pkg/extra.py"]:
+        (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file).write_text(file)
+    fingerprints = project_fingerprints(tmp_path)
+    fingerprints["README.rst"] = "0" * 64
+
+    assert_project_structure(["README.rst", "src/pkg/__init__.py", "src/pkg/extra.py"], tmp_path)
+    with pytest.raises(AssertionError) as error:
+        assert_project_structure(
+            ["README.rst", "src/pkg/__init__.py", "tox.ini"], tmp_path, fingerprints
+        )
+
+    assert str(error.value).splitlines()[1:] == [
+        "",
+        "Missing: tox.ini",
+        "Added: src/pkg/extra.py",
+        "Changed: README.rst",
+    ]
+
+
+def test_assert_project_snapshot(tmp_path):
+    project_path, snapshot_path = tmp_path / "project", tmp_path / "snapshots/project.json"
+    project_path.mkdir()
+    (project_path / "README.rst").write_text("readme")
+
+    with pytest.raises(AssertionError, match="does not exist"):
+        assert_project_snapshot(snapshot_path, project_path)
+
+    assert_project_snapshot(snapshot_path, project_path, update=True)
+    assert_project_snapshot(snapshot_path, project_path)
+
+    (project_path / "README.rst").write_text("changed readme")
+    with pytest.raises(AssertionError, match="Changed: README.rst"):
+        assert_project_snapshot(snapshot_path, project_path)
+
+
 def test_assert_template_baking_process(tmp_path):
     # Create a tiny family template
     os.mkdir(tmp_path / "common")
@@ -62,3 +109,87 @@ def test_assert_template_baking_process(tmp_path):
     assert_template_baking_process(
         tmp_path / "template", tmp_path, dict(project_name_slug="hello_project")
     )
+
+
+def test_baked_project_fixture(pytester):
+    pytester.makepyfile(
+        """
+        import stat
+
+        import pytest
+
+        VARIABLES = {"project_name": "doc-project", "logo": "Ansys"}
+
+        @pytest.mark.parametrize("baked_project", [("doc-project", VARIABLES)], indirect=True)
+        def test_readme(baked_project):
+            assert (baked_project.path / "README.rst").is_file()
+
+        @pytest.mark.parametrize("baked_project", [("doc-project", VARIABLES)], indirect=True)
+        def test_read_only(baked_project):
+            assert not (baked_project.path / "README.rst").stat().st_mode & stat.S_IWUSR
+
+        @pytest.mark.parametrize("baked_project", [("unknown", {})], indirect=True)
+        def test_unknown_template(baked_project):
+            pass
+        """
+    )
+
+    result = pytester.runpytest("-p", "ansys.templates.testing.plugin", "--bake-workers", "2")
+
+    result.assert_outcomes(passed=2, errors=1)
+    result.stdout.fnmatch_lines(["*Baking template 'unknown' failed: ValueError: Unknown*"])
+
+
+def test_baked_project_fixture_skipped_tests(pytester):
+    pytester.makepyfile(
+        """
+        import pytest
+
+        @pytest.mark.skipif(True, reason="Not baked")
+        @pytest.mark.parametrize("baked_project", [("pybasic", {})], indirect=True)
+        def test_skipped(baked_project):
+            pass
+
+        @pytest.mark.skipif("sys.platform != 'unknown'", reason="Not baked")
+        @pytest.mark.parametrize("baked_project", [("pyace", {})], indirect=True)
+        def test_skipped_on_condition(baked_project):
+            pass
+
+        @pytest.mark.skip(reason="Not baked")
+        @pytest.mark.parametrize("baked_project", [("pyansys", {})], indirect=True)
+        def test_skipped_always(baked_project):
+            pass
+
+        @pytest.mark.skipif("sys.platform == 'unknown'", reason="Baked")
+        @pytest.mark.parametrize(
+            "baked_project", [("doc-project", {"project_name": "doc-project"})], indirect=True
+        )
+        def test_used(baked_project):
+            pass
+        """
+    )
+    basetemp = pytester.path / "output"
+
+    result = pytester.runpytest("-p", "ansys.templates.testing.plugin", f"--basetemp={basetemp}")
+
+    result.assert_outcomes(passed=1, skipped=3)
+    assert len(list((basetemp / "baked_projects0").iterdir())) == 1
+    index = json.loads((basetemp / "baked_projects.json").read_text())
+    assert list(index) == ["test_baked_project_fixture_skipped_tests.py::test_used[baked_project0]"]
+    assert (Path(index[next(iter(index))]) / "README.rst").is_file()
+
+
+def test_project_snapshot_fixture(pytester):
+    pytester.makepyfile(
+        """
+        def test_project(tmp_path, project_snapshot):
+            (tmp_path / "README.rst").write_text("readme")
+            project_snapshot(tmp_path)
+        """
+    )
+    plugin_args = ["-p", "ansys.templates.testing.plugin"]
+
+    pytester.runpytest(*plugin_args).assert_outcomes(failed=1)
+    pytester.runpytest(*plugin_args, "--update-snapshots").assert_outcomes(passed=1)
+    assert (pytester.path / "snapshots/test_project.json").is_file()
+    pytester.runpytest(*plugin_args).assert_outcomes(passed=1)
@@ -0,0 +1,130 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import json
+import os
+import sys
+
+import pytest
+
+from ansys.templates.update import RECORD_FILENAME, bake_project, read_record, update_project
+
+DOC_PROJECT_VARS = dict(project_name="doc-project", logo="Ansys")
+
+
+def _set_recorded_contents(project_path, file, contents, mode=None):
+    """Make the record look as if the template had generated some contents."""
+    if mode is None:
+        mode = (project_path / file).stat().st_mode & 0o7777
+    record = read_record(project_path)
+    file_hash = hashlib.sha256(f"{mode:o}\0".encode("ascii") + contents.encode("utf-8"))
+    record["files"][file] = file_hash.hexdigest()
+    (project_path / RECORD_FILENAME).write_text(json.dumps(record))
+
+
+@pytest.fixture
+def project_path(tmp_path):
+    return bake_project("doc-project", tmp_path, no_input=True, extra_context=DOC_PROJECT_VARS)
+
+
+def test_bake_project(project_path):
+    record = read_record(project_path)
+
+    assert record["template"] == "doc-project"
+    assert record["context"]["logo"] == "Ansys"
+    assert "README.rst" in record["files"]
+    assert (project_path / "README.rst").is_file()
+
+
+def test_update_project_without_changes(project_path):
+    mtime = (project_path / "README.rst").stat().st_mtime_ns
+
+    report = update_project(project_path)
+
+    assert report.unchanged and not (report.added or report.updated or report.conflicts)
+    assert (project_path / "README.rst").stat().st_mtime_ns == mtime
+
+
+def test_update_project_with_template_changes(project_path):
+    # An outdated file generated by a previous version of the template
+    (project_path / "README.rst").write_text("old readme")
+    _set_recorded_contents(project_path, "README.rst", "old readme")
+    # A file which is no longer part of the template
+    (project_path / "doc/old.txt").write_text("old")
+    _set_recorded_contents(project_path, "doc/old.txt", "old")
+    # A file added to the template
+    (project_path / "tox.ini").unlink()
+    record = read_record(project_path)
+    del record["files"]["tox.ini"]
+    (project_path / RECORD_FILENAME).write_text(json.dumps(record))
+
+    report = update_project(project_path)
+
+    assert report.updated == ["README.rst"]
+    assert report.removed == ["doc/old.txt"]
+    assert report.added == ["tox.ini"]
+    assert not report.conflicts
+    assert (project_path / "README.rst").read_text() != "old readme"
+
+    fresh_project_path = bake_project(
+        "doc-project", project_path.parent / "fresh", True, DOC_PROJECT_VARS
+    )
+    assert read_record(project_path)["files"] == read_record(fresh_project_path)["files"]
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Permission bits are not kept on Windows")
+def test_update_project_with_template_mode_changes(project_path):
+    readme = project_path / "README.rst"
+    mode = readme.stat().st_mode & 0o7777
+    # The previous version of the template generated an executable file
+    os.chmod(readme, 0o755)
+    _set_recorded_contents(project_path, "README.rst", readme.read_text(), 0o755)
+
+    report = update_project(project_path)
+
+    assert report.updated == ["README.rst"]
+    assert readme.stat().st_mode & 0o7777 == mode
+
+
+def test_update_project_with_conflicts(project_path):
+    # A file edited both in the project and in the template
+    (project_path / "README.rst").write_text("edited readme")
+    _set_recorded_contents(project_path, "README.rst", "old readme")
+    # A file edited in the project only
+    (project_path / "tox.ini").write_text("edited tox")
+
+    report = update_project(project_path)
+
+    assert report.conflicts == {"README.rst": "changed both in the project and in the template"}
+    assert report.kept == ["tox.ini"]
+    assert (project_path / "README.rst").read_text() == "edited readme"
+    assert (project_path / "tox.ini").read_text() == "edited tox"
+
+    # Conflicts are reported until solved
+    assert "README.rst" in update_project(project_path).conflicts
+
+
+def test_update_project_without_record(tmp_path):
+    with pytest.raises(ValueError, match="has no record"):
+        update_project(tmp_path)
@@ -0,0 +1,297 @@
+# Copyright (C) 2022 - 2025 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import stat
+
+import pytest
+
+from ansys.templates.cache import staging_cache_dir
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.utils import (
+    _copy_file,
+    _copytree,
+    _overlay_template,
+    bake_template,
+    bake_templates,
+    keep_files,
+    load_bake_jobs,
+    sort_imports,
+    sort_project_imports,
+)
+
+
+def _create_family(path):
+    """Create a tiny family of templates with an overridden file."""
+    common_project = path / "common/{{cookiecutter.__project_name_slug}}"
+    template_project = path / "template/{{cookiecutter.__project_name_slug}}"
+    common_project.mkdir(parents=True)
+    template_project.mkdir(parents=True)
+
+    (common_project / "README.rst").write_text("common readme")
+    (common_project / "setup.py").write_text("common setup")
+    (template_project / "README.rst").write_text("template readme")
+    (path / "template/cookiecutter.json").write_text('{"__project_name_slug": "project"}')
+    (path / "LICENSE").write_text("license")
+
+    return path / "template", path / "LICENSE"
+
+
+def test_copy_file(tmp_path):
+    source = tmp_path / "source.sh"
+    source.write_text("echo hello")
+    source.chmod(0o750)
+    os.utime(source, (1_000_000, 1_000_000))
+    destination = tmp_path / "destination.sh"
+    destination.symlink_to(tmp_path / "target.sh")
+    (tmp_path / "target.sh").write_text("target")
+
+    _copy_file(source, destination)
+
+    assert not destination.is_symlink()
+    assert destination.read_text() == "echo hello"
+    assert stat.S_IMODE(destination.stat().st_mode) == 0o750
+    assert destination.stat().st_mtime == 1_000_000
+    # Existing links are replaced rather than written through
+    assert (tmp_path / "target.sh").read_text() == "target"
+
+
+def test_copy_file_without_copied_data(tmp_path, monkeypatch):
+    source = tmp_path / "source.txt"
+    source.write_bytes(b"data" * 1024)
+    monkeypatch.setattr("ansys.templates.utils.fcntl", None)
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+
+    _copy_file(source, tmp_path / "destination.txt")
+
+    assert (tmp_path / "destination.txt").read_bytes() == source.read_bytes()
+
+
+def test_copytree(tmp_path):
+    source = tmp_path / "source"
+    for index in range(50):
+        file = source / f"dir_{index % 5}/sub_{index % 2}/file_{index}.txt"
+        file.parent.mkdir(parents=True, exist_ok=True)
+        file.write_text(str(index))
+    (source / "empty").mkdir()
+    destination = tmp_path / "destination"
+    (destination / "dir_0/sub_0").mkdir(parents=True)
+    (destination / "dir_0/sub_0/file_0.txt").write_text("old")
+    (destination / "extra.txt").write_text("extra")
+
+    _copytree(source, destination, max_workers=4)
+
+    copied = sorted(path.relative_to(destination) for path in destination.rglob("*"))
+    expected = sorted(path.relative_to(source) for path in source.rglob("*"))
+    assert copied == sorted(expected + [(destination / "extra.txt").relative_to(destination)])
+    for index in range(50):
+        file = f"dir_{index % 5}/sub_{index % 2}/file_{index}.txt"
+        assert (destination / file).read_text() == str(index)
+
+
+def test_overlay_template(tmp_path):
+    template_path, license_path = _create_family(tmp_path / "family")
+    overlay_path = tmp_path / "overlay"
+    overlay_path.mkdir()
+
+    _overlay_template(template_path, license_path, overlay_path)
+
+    project_path = overlay_path / "{{cookiecutter.__project_name_slug}}"
+    assert (project_path / "README.rst").read_text() == "template readme"
+    assert (project_path / "setup.py").read_text() == "common setup"
+    assert (project_path / "LICENSE").read_text() == "license"
+    assert (overlay_path / "cookiecutter.json").is_file()
+
+    # Overriding a layer must never modify the source files
+    common_readme = tmp_path / "family/common/{{cookiecutter.__project_name_slug}}/README.rst"
+    assert common_readme.read_text() == "common readme"
+
+
+def test_bake_template_reuses_staged_template(tmp_path):
+    template_path, license_path = _create_family(tmp_path / "family")
+
+    bake_template(template_path, tmp_path / "first", license_path=license_path, no_input=True)
+    staged_templates = set(staging_cache_dir().iterdir())
+    bake_template(template_path, tmp_path / "second", license_path=license_path, no_input=True)
+
+    assert set(staging_cache_dir().iterdir()) == staged_templates
+    assert (tmp_path / "second/project/README.rst").read_text() == "template readme"
+
+    # Any change in the template files invalidates the staged template
+    (template_path / "{{cookiecutter.__project_name_slug}}/README.rst").write_text("new readme")
+    bake_template(template_path, tmp_path / "third", license_path=license_path, no_input=True)
+
+    assert (tmp_path / "third/project/README.rst").read_text() == "new readme"
+
+
+def test_bake_template_without_cache(tmp_path):
+    template_path, license_path = _create_family(tmp_path / "family")
+
+    bake_template(
+        template_path, tmp_path, license_path=license_path, use_cache=False, no_input=True
+    )
+
+    assert (tmp_path / "project/setup.py").read_text() == "common setup"
+
+
+@pytest.mark.parametrize("template", ["pyansys", "doc-project"])
+def test_bake_template_dry_run(tmp_path, template):
+    files = bake_template(
+        TEMPLATE_PATH_FINDER[template], tmp_path / "output", dry_run=True, no_input=True
+    )
+    assert not (tmp_path / "output").exists()
+
+    project_path = bake_template(TEMPLATE_PATH_FINDER[template], tmp_path / "output", no_input=True)
+    baked_files = sorted(
+        path.relative_to(tmp_path / "output").as_posix()
+        for path in Path(project_path).rglob("*")
+        if path.is_file()
+    )
+    assert sorted(file["path"] for file in files) == baked_files
+
+    # Files post-processed by the hooks, e.g. with sorted imports, match too
+    for file in files:
+        data = (tmp_path / "output" / file["path"]).read_bytes()
+        assert file["size"] == len(data), file["path"]
+        assert file["sha256"] == hashlib.sha256(data).hexdigest(), file["path"]
+
+
+def test_bake_templates(tmp_path):
+    jobs = [
+        {"template": "pyansys", "output_dir": tmp_path / "pyansys"},
+        {"template": "doc-project", "output_dir": tmp_path / "doc-project"},
+        {"template": "unknown", "output_dir": tmp_path / "unknown"},
+        {"template": "pybasic"},
+        ["pybasic", tmp_path / "pybasic"],
+    ]
+
+    results = bake_templates(jobs, max_workers=2)
+
+    assert [result.template for result in results] == [
+        "pyansys",
+        "doc-project",
+        "unknown",
+        "pybasic",
+        None,
+    ]
+    assert [result.succeeded for result in results] == [True, True, False, False, False]
+    assert results[3].error == "Job is missing 'output_dir'."
+    assert results[3].output_dir is None
+    assert results[4].error == "Job must be a dictionary, got list."
+    assert (tmp_path / "pyansys/pyproduct-library/setup.py").is_file()
+    assert (tmp_path / "doc-project/doc-project/README.rst").is_file()
+
+
+def test_load_bake_jobs(tmp_path):
+    jobs = [{"template": "pybasic", "output_dir": "out", "extra_context": {"project_name": "a"}}]
+    (tmp_path / "jobs.json").write_text(json.dumps(jobs))
+
+    assert load_bake_jobs(tmp_path / "jobs.json") == jobs
+
+    (tmp_path / "jobs.json").write_text(json.dumps([*jobs, ["pybasic", "out"]]))
+    with pytest.raises(ValueError, match="Jobs 1 of .* are not dictionaries"):
+        load_bake_jobs(tmp_path / "jobs.json")
+
+    (tmp_path / "jobs.json").write_text(json.dumps(jobs[0]))
+    with pytest.raises(ValueError, match="must hold a list of jobs"):
+        load_bake_jobs(tmp_path / "jobs.json")
+
+
+def test_keep_files(tmp_path):
+    for file in ["README.rst", "setup.py", "src/pkg/__init__.py", "src/pkg/core.py"]:
+        (tmp_path / file).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / file).touch()
+    (tmp_path / "doc/source/_static").mkdir(parents=True)
+    (tmp_path / "doc/source/conf.py").touch()
+    (tmp_path / "empty").mkdir()
+    (tmp_path / "tests").mkdir()
+
+    keep_files(["README.rst", "src/pkg/core.py", "doc/source/_static", "empty"], tmp_path)
+
+    remaining = sorted(str(path.relative_to(tmp_path).as_posix()) for path in tmp_path.rglob("*"))
+    assert remaining == [
+        "README.rst",
+        "doc",
+        "doc/source",
+        "doc/source/_static",
+        "empty",
+        "src",
+        "src/pkg",
+        "src/pkg/core.py",
+    ]
+
+
+def test_sort_imports(tmp_path):
+    unsorted_code = "import sys\nimport os\n"
+    sorted_code = "import os\nimport sys\n"
+    first_file, second_file = tmp_path / "first.py", tmp_path / "second.py"
+    first_file.write_text(unsorted_code)
+    second_file.write_text(unsorted_code)
+
+    assert sort_imports([first_file], line_length="100") == [first_file]
+    assert first_file.read_text() == sorted_code
+
+    # Sorted sources are recognized by their hash
+    assert sort_imports([first_file, second_file], line_length=100) == [second_file]
+    assert second_file.read_text() == sorted_code
+
+
+def test_sort_project_imports(tmp_path):
+    for project in ("first", "second"):
+        package = f"{project}_package"
+        (tmp_path / project / "src" / package).mkdir(parents=True)
+        (tmp_path / project / "src" / package / "__init__.py").touch()
+        (tmp_path / project / "pyproject.toml").write_text(
+            '[tool.isort]\nprofile = "black"\nforce_sort_within_sections = true\n'
+        )
+        (tmp_path / project / "module.py").write_text(
+            f"from pathlib import Path\nimport {package}\nimport numpy\nimport os\n"
+        )
+
+        sort_project_imports(tmp_path / project)
+
+        # Settings of the project are honored and its package is first party
+        assert (tmp_path / project / "module.py").read_text() == (
+            f"import os\nfrom pathlib import Path\n\nimport numpy\n\nimport {package}\n"
+        )
+
+
+def test_sort_project_imports_in_other_project(tmp_path):
+    sorted_code = "import numpy\n\nimport first_package\n"
+    for project in ("first", "second"):
+        (tmp_path / project).mkdir()
+        (tmp_path / project / "pyproject.toml").write_text('[tool.isort]\nprofile = "black"\n')
+        (tmp_path / project / "module.py").write_text(sorted_code)
+    (tmp_path / "first" / "first_package").mkdir()
+    (tmp_path / "first" / "first_package" / "__init__.py").touch()
+
+    assert sort_project_imports(tmp_path / "first") == []
+
+    # The package is third party in the second project, so its sources are sorted again
+    sort_project_imports(tmp_path / "second")
+    assert (tmp_path / "second" / "module.py").read_text() == (
+        "import first_package\nimport numpy\n"
+    )
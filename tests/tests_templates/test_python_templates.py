@@ -22,11 +22,13 @@
 
 from copy import deepcopy
 import json
+from pathlib import Path
+import shutil
 
 import pytest
 
-from ansys.templates.paths import PYTHON_TEMPLATES_COMMON_PATH, TEMPLATE_PATH_FINDER
-from ansys.templates.testing import assert_project_structure, assert_template_baking_process
+from ansys.templates.paths import TEMPLATE_PATH_FINDER
+from ansys.templates.testing import assert_project_structure
 from ansys.templates.utils import keep_files
 
 PYCOMMON_VARS = dict(
@@ -192,8 +194,10 @@ PYACE_GRPC_STRUCTURE = deepcopy(PYCOMMON_STRUCTURE) + [
     "src/server.py",
     "src/client.py",
     "src/observability/logger.py",
+    "src/observability/metrics.py",
     "src/services/__init__.py",
     "src/services/pinger.py",
+    "src/services/transfer.py",
     "src/stubs/__init__.py",
     "docker/compose.yaml",
     "docker/Dockerfile",
@@ -202,8 +206,12 @@ PYACE_GRPC_STRUCTURE = deepcopy(PYCOMMON_STRUCTURE) + [
     "requirements/requirements_build.txt",
     "requirements/requirements_doc.txt",
     "requirements/requirements_tests.txt",
+    "build_stubs.py",
+    "MANIFEST.in",
     "protobufs/pingserver.proto",
     "tests/test_server.py",
+    "tests/test_metrics.py",
+    "tests/test_transfer.py",
     "tests/conftest.py",
 ]
 [PYACE_GRPC_STRUCTURE.remove(file) for file in
@@ -296,44 +304,84 @@ TEMPLATES_VARIABLES_AND_STRUCTURE = {
 }
 
 
-@pytest.mark.parametrize("build_system", ["flit", "poetry", "setuptools"])
-@pytest.mark.parametrize("template", TEMPLATES_VARIABLES_AND_STRUCTURE)
-def test_template_python(tmp_path, build_system, template):
+def _template_cases():
+    """Return the project to be baked for each template and build system."""
+    cases = []
+    for template, (variables, _) in TEMPLATES_VARIABLES_AND_STRUCTURE.items():
+        # Get the list of supported build systems for the template
+        template_path = TEMPLATE_PATH_FINDER[template]
+        with open(template_path / "cookiecutter.json", 'r', encoding="utf-8") as fp:
+            config_json = json.load(fp)
+        default_build_system = "setuptools"
+        supported_build_systems = config_json.get("build_system", [default_build_system])
 
-    # Get the list of supported build systems for the template
-    template_path = TEMPLATE_PATH_FINDER[template]
-    with open(template_path / "cookiecutter.json", 'r', encoding="utf-8") as fp:
-        config_json = json.load(fp)
-    default_build_system = "setuptools"
-    supported_build_systems = config_json.get("build_system", [default_build_system])
+        for build_system in ["flit", "poetry", "setuptools"]:
+            # Update variables if required
+            if template == "pyansys-advanced":
+                variables = dict(variables, build_system=build_system)
 
-    # Skip if template does not support a particular build system
-    if build_system not in supported_build_systems:
-        pytest.skip(f"Template {template} does not support {build_system}.")
+            # Skip if template does not support a particular build system
+            marks = (
+                [pytest.mark.skip(reason=f"Template {template} does not support {build_system}.")]
+                if build_system not in supported_build_systems else []
+            )
+            cases.append(
+                pytest.param((template, variables), id=f"{template}-{build_system}", marks=marks)
+            )
+    return cases
 
-    # Collect variables and expected structure
-    VARIABLES, EXPECTED_STRUCTURE = TEMPLATES_VARIABLES_AND_STRUCTURE[template]
 
-    # Collect some additional information
-    template_path, outdir_name = (
-        (TEMPLATE_PATH_FINDER[template], VARIABLES["__project_name_slug"])
-        if template != "common" else (PYTHON_TEMPLATES_COMMON_PATH, "common")
-    )
-    project_path = tmp_path.joinpath(outdir_name)
+@pytest.mark.parametrize("baked_project", _template_cases(), indirect=True)
+def test_template_python(tmp_path, baked_project):
 
-    # Update variables if required
-    if template == "pyansys-advanced":
-        VARIABLES["build_system"] = build_system
-
-    # Assert no errors were raised during template rendering process
-    assert_template_baking_process(template_path, tmp_path, VARIABLES)
+    # Collect the expected structure
+    template, build_system = baked_project.template, baked_project.extra_context.get("build_system")
+    _, EXPECTED_STRUCTURE = TEMPLATES_VARIABLES_AND_STRUCTURE[template]
+    project_path = baked_project.path
 
     # The pyansys-advanced template does not ship with some files included in
     # the common/ directory
     if template == "pyansys-advanced" and build_system == "setuptools":
-        EXPECTED_STRUCTURE.append("setup.py")
+        EXPECTED_STRUCTURE = EXPECTED_STRUCTURE + ["setup.py"]
     elif template == "common":
+        # Baked projects are shared, so prune a copy of it
+        project_path = Path(shutil.copytree(project_path, tmp_path / "common"))
         keep_files(EXPECTED_STRUCTURE, project_path)
 
     # Check that all common files are included in baked project
     assert_project_structure(EXPECTED_STRUCTURE, project_path)
+
+
+@pytest.mark.parametrize(
+    "baked_project",
+    [("pyace-grpc", dict(PYACE_VARS, server_model="asyncio"))],
+    ids=["pyace-grpc-asyncio"],
+    indirect=True,
+)
+def test_template_pyace_grpc_asyncio(baked_project):
+    project_path = baked_project.path
+    assert_project_structure(PYACE_GRPC_STRUCTURE, project_path)
+
+    server = (project_path / "src" / "server.py").read_text(encoding="utf-8")
+    assert "server = grpc.aio.server(" in server
+    assert "asyncio.run(serve(port, max_concurrent_rpcs, reuse_port))" in server
+    assert '("grpc.so_reuseport", int(reuse_port))' in server
+    assert "futures" not in server
+
+    pinger = (project_path / "src" / "services" / "pinger.py").read_text(encoding="utf-8")
+    assert "async def PingServer(self, request, context):" in pinger
+    assert "async def WhoPing(self, request, context):" in pinger
+
+    transfer = (project_path / "src" / "services" / "transfer.py").read_text(encoding="utf-8")
+    assert "async def Download(self, request, context):" in transfer
+    assert "async for chunk in request_iterator:" in transfer
+
+    client = (project_path / "src" / "client.py").read_text(encoding="utf-8")
+    assert "async with grpc.aio.insecure_channel" in client
+
+    conftest = (project_path / "tests" / "conftest.py").read_text(encoding="utf-8")
+    assert "@pytest_asyncio.fixture" in conftest
+
+    requirements = (project_path / "requirements" / "requirements_tests.txt").read_text()
+    assert "pytest-asyncio" in requirements
+    assert "pytest-grpc" not in requirements